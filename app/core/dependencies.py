@@ -0,0 +1,31 @@
+from fastapi import Request
+from .models.database import DBManager
+from .models.cache import CacheManager
+from .models.file_manager import BlobStore
+from .models.blob_compressor import BlobCompressor
+from .models.hot_cache import HotBlobCache
+
+
+def get_db_manager(request: Request) -> DBManager:
+    """앱 lifespan에서 생성된 프로세스 공용 DBManager"""
+    return request.app.state.db_manager
+
+
+def get_cache_manager(request: Request) -> CacheManager:
+    """앱 lifespan에서 생성된 프로세스 공용 CacheManager"""
+    return request.app.state.cache_manager
+
+
+def get_blob_store(request: Request) -> BlobStore:
+    """앱 lifespan에서 생성된 GLB 파일 저장소"""
+    return request.app.state.blob_store
+
+
+def get_blob_compressor(request: Request) -> BlobCompressor:
+    """앱 lifespan에서 생성된 GLB 사전 압축 작업자"""
+    return request.app.state.blob_compressor
+
+
+def get_hot_cache(request: Request) -> HotBlobCache:
+    """앱 lifespan에서 생성된 작업자 공용 GLB 페이로드 캐시"""
+    return request.app.state.hot_cache
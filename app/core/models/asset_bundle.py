@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import os
+import struct
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from . import fast_json
+from .file_manager import BlobStore
+
+# 번들 형식 (little endian)
+#   magic "FDTB" (4) | version uint32 | manifest 길이 uint32 | manifest JSON (8바이트 정렬, 공백 패딩)
+#   | 데이터 영역: 파일 본문을 manifest의 blobs 순서대로 이어붙임 (offset은 데이터 영역 시작 기준)
+BUNDLE_MAGIC = b"FDTB"
+BUNDLE_VERSION = 1
+BUNDLE_HEADER = struct.Struct("<4sII")
+_ALIGNMENT = 8
+
+
+def collect_glb_refs(scenario: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """시나리오 문서의 agents/terrains가 참조하는 GLB (sha256 기준 중복 제거, 처음 나온 순서)
+
+    저장소 파일이 없는 GLB id 목록을 함께 반환한다.
+    """
+    refs: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for item in scenario["agents"] + scenario["terrains"]:
+        glb = item.get("glb")
+        if not glb:
+            continue
+        if not glb.get("sha256"):
+            # 아직 저장소로 옮기지 않은 행은 번들에 넣을 수 없다
+            missing.append(glb["id"])
+            continue
+        refs.setdefault(glb["sha256"], glb)
+    return list(refs.values()), missing
+
+
+def _stat_blobs(blob_store: BlobStore, digests: List[str]) -> Dict[str, Optional[int]]:
+    sizes: Dict[str, Optional[int]] = {}
+    for digest in digests:
+        try:
+            sizes[digest] = os.stat(blob_store.path_for(digest)).st_size
+        except FileNotFoundError:
+            sizes[digest] = None
+    return sizes
+
+
+class ScenarioBundle:
+    """시나리오 문서 + 참조 GLB를 한 응답으로 보내는 패킹 컨테이너
+
+    파일 크기를 미리 알아 manifest(offset 포함)와 전체 Content-Length를 먼저 정하고,
+    본문은 청크 단위로 여러 개를 동시에 미리 읽으며(read-ahead 창 크기만큼) 순서대로 내보낸다.
+    번들 전체를 메모리에 올리지 않는다.
+    """
+
+    def __init__(self, blob_store: BlobStore, manifest: bytes, blobs: List[Tuple[str, int]]):
+        self.blob_store = blob_store
+        self.blobs = blobs
+        padding = -(BUNDLE_HEADER.size + len(manifest)) % _ALIGNMENT
+        self.manifest = manifest + b" " * padding
+        self.header = BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(self.manifest))
+        # manifest에 모든 파일 해시가 들어 있으므로 manifest 해시가 번들 내용을 결정한다
+        self.etag = f'"{hashlib.sha256(self.manifest).hexdigest()}"'
+
+    @classmethod
+    async def build(cls, blob_store: BlobStore, scenario: Dict[str, Any]) -> "ScenarioBundle":
+        refs, missing = collect_glb_refs(scenario)
+        sizes = await asyncio.get_running_loop().run_in_executor(
+            None, _stat_blobs, blob_store, [ref["sha256"] for ref in refs]
+        )
+        entries = []
+        blobs = []
+        offset = 0
+        for ref in refs:
+            size = sizes[ref["sha256"]]
+            if size is None:
+                missing.append(ref["id"])
+                continue
+            entries.append({"sha256": ref["sha256"], "offset": offset, "length": size})
+            blobs.append((ref["sha256"], size))
+            offset += size
+        manifest = fast_json.dumps({
+            "version": BUNDLE_VERSION,
+            "scenario": scenario,
+            "blobs": entries,
+            # 본문이 없어 포함하지 못한 GLB id
+            "missing_glb_ids": sorted(set(missing))
+        })
+        return cls(blob_store, manifest, blobs)
+
+    @property
+    def content_length(self) -> int:
+        return len(self.header) + len(self.manifest) + sum(size for _, size in self.blobs)
+
+    def _read(self, digest: str, offset: int, size: int) -> bytes:
+        with open(self.blob_store.path_for(digest), "rb") as f:
+            f.seek(offset)
+            data = f.read(size)
+        if len(data) != size:
+            raise IOError(f"Blob {digest} is shorter than expected")
+        return data
+
+    async def iter_bytes(self, chunk_size: int, read_ahead: int) -> AsyncIterator[bytes]:
+        """헤더, manifest, 파일 본문 청크 순서로 전송. 최대 read_ahead개 청크를 동시에 읽는다"""
+        yield self.header + self.manifest
+        loop = asyncio.get_running_loop()
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            for digest, size in self.blobs:
+                for offset in range(0, size, chunk_size):
+                    pending.append(loop.run_in_executor(None, self._read, digest, offset, min(chunk_size, size - offset)))
+                    if len(pending) >= read_ahead:
+                        yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            # 클라이언트가 끊긴 경우 남은 읽기 취소
+            for future in pending:
+                future.cancel()
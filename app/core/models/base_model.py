@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, List, Literal
 from abc import ABC, abstractmethod
 import asyncio
 import queue
@@ -11,11 +11,30 @@ class DBSelect(BaseModel):
         table: str
         columns: list
         filters: dict
+    
+    Optional Value:
+        order_by: list ("col" 오름차순, "-col" 내림차순)
+        limit: int (페이지 크기, 응답에 다음 페이지용 next_cursor 포함)
+        cursor: str (이전 응답의 next_cursor)
+        stream: "ndjson" | "json" (대용량 조회를 서버 측 커서로 스트리밍, 캐시 미사용)
     """
     
     table: str
     columns: Optional[list] = None
     filters: Optional[dict] = None
+    order_by: Optional[List[str]] = None
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    stream: Optional[Literal["ndjson", "json"]] = None
+
+class DBSelectBatch(BaseModel):
+    """DB Batch Query Model : For Post
+
+    Required Value: 
+        queries: list (DBSelect)
+    """
+    
+    queries: List[DBSelect]
 
 class DBInsert(BaseModel):
     """DB Insert Model : For Post
@@ -28,6 +47,17 @@ class DBInsert(BaseModel):
     table: str
     data: dict
 
+class DBInsertMany(BaseModel):
+    """DB Bulk Insert Model : For Post
+
+    Required Value: 
+        table: str
+        rows: list (dict, 모든 행의 컬럼이 같아야 함)
+    """
+    
+    table: str
+    rows: List[dict]
+
 class DBDelete(BaseModel):
     """DB Delete Model : For Post
 
@@ -0,0 +1,189 @@
+import asyncio
+import logging
+from typing import Optional, List, Dict, Any, Tuple, Callable
+
+from .database import DBManager
+from .cache import CacheManager
+from .schema_catalog import SchemaValidationError, INTEGER_TYPES
+
+logger = logging.getLogger(__name__)
+
+# IN 목록 하나에 넣을 최대 값 개수
+MAX_IN_VALUES = 500
+
+
+# IN 결과를 나눌 때 정확히 비교할 수 있는 정수 타입 (bit는 bytes로 돌아온다)
+_EXACT_TYPES = INTEGER_TYPES - {"bit"}
+# 대소문자 무시 collation으로 비교할 수 있는 문자열 타입
+_CI_STRING_TYPES = {"char", "varchar"}
+
+MatchKey = Callable[[Any], Any]
+
+
+def _exact_key(value: Any) -> Any:
+    return value
+
+
+def _ci_key(value: Any) -> Any:
+    """NO PAD collation (utf8mb4_0900_*_ci): 대소문자만 무시"""
+    return value.casefold() if isinstance(value, str) else value
+
+
+def _ci_pad_key(value: Any) -> Any:
+    """PAD SPACE collation (utf8mb4_general_ci 등): 대소문자와 후행 공백 무시"""
+    return value.rstrip(" ").casefold() if isinstance(value, str) else value
+
+
+def _match_key_for(db_manager: DBManager, table: str, column: str) -> Optional[MatchKey]:
+    """IN 결과를 요청별로 나눌 비교 함수. 서버 비교 규칙과 같다고 확신할 수 없으면 None (개별 조회)
+
+    카탈로그가 로드돼 필터 값이 컬럼 타입으로 변환된 경우에만 합친다. 정수 컬럼은 그대로 비교하고,
+    문자열은 대소문자 무시(_ci) collation일 때만 합친다 (_bin/_cs는 대소문자만 다른 값을 구분한다).
+    """
+    try:
+        info = db_manager.catalog.get_table(table)
+    except SchemaValidationError:
+        return None
+    column_info = info.column(column) if info is not None else None
+    if column_info is None:
+        return None
+    if column_info.data_type in _EXACT_TYPES:
+        return _exact_key
+    collation = column_info.collation
+    if column_info.data_type in _CI_STRING_TYPES and collation and collation.endswith("_ci"):
+        return _ci_key if "0900" in collation else _ci_pad_key
+    return None
+
+
+def _coalesce_key(db_manager: DBManager, spec: Dict[str, Any]) -> Optional[Tuple[str, Optional[Tuple[str, ...]], str]]:
+    """합칠 수 있는 단일 컬럼 동등 필터 조회면 (table, columns, filter column) 반환, 아니면 None"""
+    filters = spec["filters"]
+    if not filters or len(filters) != 1:
+        return None
+    column, value = next(iter(filters.items()))
+    if value is None or isinstance(value, (list, dict)):
+        return None
+    if _match_key_for(db_manager, spec["table"], column) is None:
+        return None
+    columns = tuple(spec["columns"]) if spec["columns"] else None
+    return spec["table"], columns, column
+
+
+async def _load_single(db_manager: DBManager, spec: Dict[str, Any]) -> List[Dict[str, Any]]:
+    query = db_manager.json_to_sql_select(_table=spec["table"], _columns=spec["columns"], _filters=spec["filters"])
+    return await db_manager.get_data_async(_sql=query.sql, _params=query.params)
+
+
+async def _load_group(
+    db_manager: DBManager,
+    group_key: Tuple[str, Optional[Tuple[str, ...]], str],
+    specs: List[Dict[str, Any]]
+) -> List[List[Dict[str, Any]]]:
+    """같은 (table, columns, filter column) 조회를 `WHERE col IN (...)` 하나로 합쳐 실행 후 요청별로 분배"""
+    table, columns, column = group_key
+    match_key = _match_key_for(db_manager, table, column) or _exact_key
+    # 결과를 나누려면 필터 컬럼이 결과에 있어야 한다
+    strip_column = bool(columns) and column not in columns
+    select_columns = list(columns) + [column] if strip_column else (list(columns) if columns else None)
+
+    values = list({match_key(v): v for v in (next(iter(s["filters"].values())) for s in specs)}.values())
+    rows: List[Dict[str, Any]] = []
+    for start in range(0, len(values), MAX_IN_VALUES):
+        chunk = values[start:start + MAX_IN_VALUES]
+        query = db_manager.json_to_sql_select_in(_table=table, _columns=select_columns, _column=column, _values=chunk)
+        rows.extend(await db_manager.get_data_async(_sql=query.sql, _params=query.params))
+
+    by_value: Dict[Any, List[Dict[str, Any]]] = {}
+    # 결과 컬럼명은 대소문자가 다를 수 있어 실제 키를 찾는다
+    row_column = next((k for k in rows[0] if k.lower() == column.lower()), column) if rows else column
+    for row in rows:
+        key = match_key(row.get(row_column))
+        if strip_column:
+            row = {k: v for k, v in row.items() if k != row_column}
+        by_value.setdefault(key, []).append(row)
+
+    return [by_value.get(match_key(next(iter(s["filters"].values()))), []) for s in specs]
+
+
+async def read_batch(db_manager: DBManager, cache_manager: CacheManager, queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """여러 DBSelect 조회를 캐시 MGET 한 번 + 합쳐진 DB 조회로 처리
+
+    Returns:
+        List[dict]: 요청 순서대로 {"status": "ok"|"err", "result": ...}
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+    specs: List[Tuple[int, Dict[str, Any], str]] = []
+
+    # 1. 스키마 검증 및 캐시 키 생성 (테이블 세대 번호는 한 번에 조회)
+    valid: List[Tuple[int, Dict[str, Any]]] = []
+    for index, query in enumerate(queries):
+        if query.get("order_by") or query.get("limit") is not None or query.get("cursor") or query.get("stream"):
+            results[index] = {"status": "err", "result": "order_by/limit/cursor/stream are only supported by /db/read/"}
+            continue
+        try:
+            filters = db_manager.catalog.validate_select(query["table"], query["columns"], query["filters"])
+        except SchemaValidationError as e:
+            results[index] = {"status": "err", "result": str(e)}
+            continue
+        valid.append((index, {"table": query["table"], "columns": query["columns"], "filters": filters}))
+
+    generations = await cache_manager.get_generations_async([spec["table"] for _, spec in valid])
+    for index, spec in valid:
+        key = cache_manager.make_cache_key(
+            table=spec["table"], columns=spec["columns"], filters=spec["filters"], generation=generations[spec["table"]]
+        )
+        specs.append((index, spec, key))
+
+    # 2. 캐시 키 전체를 MGET 한 번으로 조회
+    cached = await cache_manager.get_many_from_cache_async([key for _, _, key in specs])
+    misses: List[Tuple[int, Dict[str, Any], str]] = []
+    for (index, spec, key), value in zip(specs, cached):
+        if value is None:
+            misses.append((index, spec, key))
+            continue
+        results[index] = {"status": "ok", "result": value}
+
+    # 3. 같은 테이블/컬럼/단일 필터 컬럼 miss는 IN 조회 하나로 합친다
+    groups: Dict[Tuple[str, Optional[Tuple[str, ...]], str], List[Tuple[int, Dict[str, Any], str]]] = {}
+    singles: List[Tuple[int, Dict[str, Any], str]] = []
+    for miss in misses:
+        group_key = _coalesce_key(db_manager, miss[1])
+        if group_key is None:
+            singles.append(miss)
+        else:
+            groups.setdefault(group_key, []).append(miss)
+    for group_key in [k for k, members in groups.items() if len(members) == 1]:
+        singles.extend(groups.pop(group_key))
+
+    group_items = list(groups.items())
+    outcomes = await asyncio.gather(
+        *(_load_group(db_manager, key, [spec for _, spec, _ in members]) for key, members in group_items),
+        *(_load_single(db_manager, spec) for _, spec, _ in singles),
+        return_exceptions=True
+    )
+
+    resolved: List[Tuple[int, str, Any]] = []
+    for (_, members), outcome in zip(group_items, outcomes[:len(group_items)]):
+        if isinstance(outcome, Exception):
+            resolved.extend((index, key, outcome) for index, _, key in members)
+            continue
+        resolved.extend((index, key, rows) for (index, _, key), rows in zip(members, outcome))
+    for (index, _, key), outcome in zip(singles, outcomes[len(group_items):]):
+        resolved.append((index, key, outcome))
+
+    # 4. 결과 분배 및 파이프라인으로 캐시 저장
+    to_cache: List[Tuple[str, Any]] = []
+    for index, key, outcome in resolved:
+        if isinstance(outcome, Exception):
+            logger.error(f"Batch read query failed: {outcome}")
+            results[index] = {"status": "err", "result": f"SQL Error Occurred : {outcome}"}
+            continue
+        if not outcome:
+            results[index] = {"status": "err", "result": "SQL Error Occurred : No data found"}
+            continue
+        results[index] = {"status": "ok", "result": outcome}
+        to_cache.append((key, outcome))
+
+    await cache_manager.save_many_to_cache_async(to_cache)
+    logger.debug(f"Batch read: {len(queries)} queries, {len(specs) - len(misses)} cache hits, {len(groups)} coalesced groups, {len(singles)} single queries")
+    return results
@@ -0,0 +1,175 @@
+import gzip
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .file_manager import BlobStore
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 gzip 사전 압축본만 생성
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+_COPY_CHUNK = 1024 * 1024
+
+
+def compress_file(src: str, dst: str, tmp_dir: str, encoding: str, level: int) -> Optional[int]:
+    """프로세스 풀 작업자: src를 스트리밍 압축해 dst에 원자적으로 기록
+
+    압축본 크기를 반환하고, 원본보다 작지 않으면 기록하지 않고 None을 반환한다.
+    gzip은 mtime=0으로 기록해 같은 원본이면 항상 같은 바이트가 나온다.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+    try:
+        with open(src, "rb") as source, os.fdopen(fd, "wb") as target:
+            source_size = os.fstat(source.fileno()).st_size
+            if encoding == "gzip":
+                with gzip.GzipFile(fileobj=target, mode="wb", compresslevel=level, mtime=0) as compressed:
+                    shutil.copyfileobj(source, compressed, _COPY_CHUNK)
+            elif encoding == "zstd":
+                compressor = zstandard.ZstdCompressor(level=level)
+                compressor.copy_stream(source, target, size=source_size, read_size=_COPY_CHUNK, write_size=_COPY_CHUNK)
+            else:
+                raise ValueError(f"Unsupported encoding: {encoding}")
+            target.flush()
+            os.fsync(target.fileno())
+            size = target.tell()
+        if size >= source_size:
+            os.unlink(tmp_path)
+            return None
+        os.replace(tmp_path, dst)
+        return size
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class BlobCompressor:
+    """저장소 파일의 gzip/zstd 사전 압축본을 프로세스 풀에서 생성
+
+    압축은 CPU를 오래 쓰므로 이벤트 루프/스레드 풀이 아닌 별도 프로세스에서 실행하고,
+    다운로드는 Accept-Encoding에 맞는 압축본을 요청마다 다시 압축하지 않고 그대로 보낸다.
+    풀은 첫 작업 때 spawn으로 만든다 (스레드가 많은 서버 프로세스를 fork하지 않음).
+    """
+
+    def __init__(self, blob_store: BlobStore, workers: int = 2, min_bytes: int = 1024, gzip_level: int = 9, zstd_level: int = 19):
+        self.blob_store = blob_store
+        self.workers = workers
+        self.min_bytes = min_bytes
+        self.levels = {"zstd": zstd_level, "gzip": gzip_level}
+        # 서버 선호 순서 (같은 q 값이면 앞쪽을 고른다)
+        self.encodings: Tuple[str, ...] = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending: Set[Tuple[str, str]] = set()
+        self.completed = 0
+        self.not_smaller = 0
+        self.failed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _submit(self, digest: str, encoding: str) -> Optional[Future]:
+        """압축 작업 제출. 이미 진행 중이거나 압축본이 있으면 None"""
+        key = (digest, encoding)
+        with self._lock:
+            if key in self._pending:
+                return None
+            self._pending.add(key)
+        if self.blob_store.variant_path(digest, encoding).is_file():
+            with self._lock:
+                self._pending.discard(key)
+            return None
+        try:
+            future = self._get_executor().submit(
+                compress_file,
+                str(self.blob_store.path_for(digest)),
+                str(self.blob_store.variant_path(digest, encoding)),
+                str(self.blob_store.root / "tmp"),
+                encoding,
+                self.levels[encoding]
+            )
+        except BaseException:
+            with self._lock:
+                self._pending.discard(key)
+            raise
+        future.add_done_callback(lambda f: self._done(key, f))
+        return future
+
+    def _done(self, key: Tuple[str, str], future: Future):
+        with self._lock:
+            self._pending.discard(key)
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is not None:
+                self.failed += 1
+            elif future.result() is None:
+                self.not_smaller += 1
+            else:
+                self.completed += 1
+        if error is not None:
+            logger.error(f"Failed to precompress blob {key[0]} ({key[1]}): {error}")
+
+    def schedule(self, digest: str, size: int) -> List[Future]:
+        """백그라운드 압축 예약 (기다리지 않음). 작은 파일은 건너뛴다"""
+        if not self.enabled or size < self.min_bytes:
+            return []
+        futures = []
+        for encoding in self.encodings:
+            try:
+                future = self._submit(digest, encoding)
+            except Exception as e:
+                logger.error(f"Failed to schedule precompression for {digest}: {e}")
+                break
+            if future is not None:
+                futures.append(future)
+        return futures
+
+    def compress_all(self, digests: Iterable[Tuple[str, int]]) -> int:
+        """(digest, 크기) 목록의 압축본을 만들고 끝날 때까지 대기 (마이그레이션 도구용). 생성 수 반환"""
+        futures = []
+        for digest, size in digests:
+            futures.extend(self.schedule(digest, size))
+        created = 0
+        for future in futures:
+            try:
+                created += future.result() is not None
+            except Exception:
+                pass
+        return created
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "encodings": list(self.encodings),
+                "pending": len(self._pending),
+                "completed": self.completed,
+                "not_smaller": self.not_smaller,
+                "failed": self.failed
+            }
@@ -1,62 +1,245 @@
 import redis
-import json
+import redis.asyncio as aioredis
+from redis.asyncio.retry import Retry as AsyncRetry
+from redis.backoff import ExponentialBackoff
+import asyncio
 import logging
-from typing import Optional, Any, Dict, List
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from typing import Optional, Any, Dict, List, Tuple, Callable, Awaitable, Sequence, Union
 from config import config
+from .cache_codec import CacheCodec
+from .fast_json import RawJSON
+from .local_cache import LocalCache, MISS
+from .single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# 요청 단위 Redis 왕복 횟수 (미들웨어가 요청마다 [0]을 설정)
+_request_round_trips: ContextVar[Optional[List[int]]] = ContextVar("request_round_trips", default=None)
+
+# 락 토큰이 일치할 때만 삭제 (다른 워커가 다시 잡은 락을 지우지 않도록)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# 여러 테이블을 읽는 조회 결과의 키 접두사: `q:{name}:{table,table...}:g{세대.세대...}:{params}`
+TAGGED_KEY_PREFIX = "q:"
+
+# 명령 실패로 판단하는 연결 오류 (ping 대신 실제 명령 실패로 재연결을 감지)
+CONNECTION_ERRORS = (redis.ConnectionError, redis.TimeoutError)
+
+
+def begin_request_metrics() -> List[int]:
+    """현재 요청 컨텍스트에 Redis 왕복 카운터를 설정하고 반환"""
+    counter = [0]
+    _request_round_trips.set(counter)
+    return counter
+
+
+class CacheMetrics:
+    """Redis 왕복/재연결 통계"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.round_trips = 0
+        self.commands = 0
+        self.reconnects = 0
+        self.requests = 0
+        self.request_round_trips = 0
+        self.coalesced_waiters = 0
+        self.lock_waiters = 0
+        self.stale_serves = 0
+        self.background_refreshes = 0
+    
+    def record(self, commands: int = 1):
+        """왕복 1회 (파이프라인이면 commands개 명령) 기록"""
+        with self._lock:
+            self.round_trips += 1
+            self.commands += commands
+        counter = _request_round_trips.get()
+        if counter is not None:
+            counter[0] += 1
+    
+    def record_reconnect(self):
+        with self._lock:
+            self.reconnects += 1
+    
+    def record_event(self, name: str):
+        """coalesced_waiters / lock_waiters / stale_serves / background_refreshes 증가"""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def record_request(self, round_trips: int):
+        with self._lock:
+            self.requests += 1
+            self.request_round_trips += round_trips
+    
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "round_trips": self.round_trips,
+                "commands": self.commands,
+                "reconnects": self.reconnects,
+                "requests": self.requests,
+                "avg_round_trips_per_request": round(self.request_round_trips / self.requests, 3) if self.requests else 0.0,
+                "coalesced_waiters": self.coalesced_waiters,
+                "lock_waiters": self.lock_waiters,
+                "stale_serves": self.stale_serves,
+                "background_refreshes": self.background_refreshes
+            }
+
+
 class CacheManager:
+    """명시적 커넥션 풀 위의 Redis 캐시 (비동기 클라이언트, 이벤트 루프에서 사용)
+    
+    연결 상태는 매 호출 ping으로 확인하지 않고, 명령 실패 시 풀이 연결을 버리고
+    다음 명령에서 새로 연결한다 (연결 오류는 1회 자동 재시도).
+    """
+    
     def __init__(self):
         self.redis_host = config.REDIS_HOST
         self.redis_port = config.REDIS_PORT
         self.redis_password = config.REDIS_PASSWORD
         self.connection_timeout = config.REDIS_CONNECTION_TIMEOUT
         self.socket_timeout = config.REDIS_SOCKET_TIMEOUT
-        self._redis_client = None
+        self.metrics = CacheMetrics()
+        # 값 직렬화 (헤더 바이트 + msgpack/JSON, 큰 값은 압축)
+        self.codec = CacheCodec(
+            format_name=config.CACHE_CODEC,
+            compress_min_bytes=config.CACHE_COMPRESS_MIN_BYTES,
+            compress_level=config.CACHE_COMPRESS_LEVEL
+        )
+        self._async_pool: Optional[aioredis.ConnectionPool] = None
+        self._async_client: Optional[aioredis.Redis] = None
+        # 디코딩된 결과를 보관하는 프로세스 내 L1 캐시 (워커 간 일관성은 pub/sub 무효화로 유지)
+        self.local_cache = LocalCache(max_bytes=config.CACHE_L1_MAX_BYTES, ttl=config.CACHE_L1_TTL)
+        self._invalidation_task: Optional[asyncio.Task] = None
+        # 무효화 메시지 발신자 식별 (자기 메시지는 무시)
+        self._instance_id = uuid.uuid4().hex
+        # 캐시 miss 시 같은 키의 동시 DB 조회를 하나로 합침
+        self._single_flight = SingleFlight()
+        self._refresh_tasks: set = set()
+        # 테이블별 세대 번호 로컬 캐시 {table: (generation, expires_at)}
+        self._generations: Dict[str, Tuple[int, float]] = {}
+        # 요청의 테이블명 -> 실제 테이블명 (앱 lifespan에서 스키마 카탈로그로 설정)
+        self.table_resolver: Optional[Callable[[str], str]] = None
         self._initialize_redis()
     
+    def _pool_kwargs(self) -> Dict[str, Any]:
+        return {
+            "host": self.redis_host,
+            "port": self.redis_port,
+            "password": self.redis_password,
+            # 값은 코덱이 만든 바이너리이므로 응답을 문자열로 디코딩하지 않는다
+            "decode_responses": False,
+            "socket_connect_timeout": self.connection_timeout,
+            "socket_timeout": self.socket_timeout,
+            "health_check_interval": config.REDIS_HEALTH_CHECK_INTERVAL,
+            "max_connections": config.REDIS_MAX_CONNECTIONS
+        }
+    
     def _initialize_redis(self):
-        """Redis 연결 초기화"""
-        try:
-            self._redis_client = redis.StrictRedis(
-                host=self.redis_host,
-                port=self.redis_port,
-                password=self.redis_password,
-                decode_responses=True,
-                socket_connect_timeout=self.connection_timeout,
-                socket_timeout=self.socket_timeout,
-                retry_on_timeout=True,
-                health_check_interval=config.REDIS_HEALTH_CHECK_INTERVAL
-            )
-            # 연결 테스트
-            self._redis_client.ping()
-            logger.info("Redis connection initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize Redis connection: {e}")
-            self._redis_client = None
+        """Redis 커넥션 풀 및 클라이언트 초기화 (연결은 첫 명령 시 생성)"""
+        retry_errors = list(CONNECTION_ERRORS)
+        self._async_pool = aioredis.ConnectionPool(**self._pool_kwargs())
+        self._async_client = aioredis.Redis(
+            connection_pool=self._async_pool,
+            retry=AsyncRetry(ExponentialBackoff(), 1),
+            retry_on_error=retry_errors
+        )
+        logger.info(f"Redis connection pool initialized (max_connections={config.REDIS_MAX_CONNECTIONS})")
     
-    def _get_redis_client(self) -> Optional[redis.StrictRedis]:
-        """Redis 클라이언트 가져오기 (재연결 포함)"""
-        if self._redis_client is None:
-            self._initialize_redis()
-            return self._redis_client
+    @property
+    def async_client(self) -> Optional[aioredis.Redis]:
+        """비동기 Redis 클라이언트"""
+        return self._async_client
+    
+    def _on_error(self, action: str, e: Exception):
+        """명령 실패 처리. 연결 오류는 재연결로 집계 (풀이 끊긴 연결을 폐기함)"""
+        if isinstance(e, CONNECTION_ERRORS):
+            self.metrics.record_reconnect()
+            logger.warning(f"Redis connection error during {action}, connection will be re-established: {e}")
+            return
+        logger.error(f"Failed to {action}: {e}")
+    
+    @staticmethod
+    def _table_of(key: str) -> Union[str, Tuple[str, ...]]:
+        """캐시 키가 의존하는 테이블 (보통 키는 `{table}:`로 시작, 태그 키는 테이블 목록을 담는다)"""
+        if key.startswith(TAGGED_KEY_PREFIX):
+            return tuple(key.split(":", 3)[2].split(","))
+        return key.split(":", 1)[0]
+    
+    def canonical_table(self, table: str) -> str:
+        """세대 키/캐시 키/무효화에 쓰는 테이블명 ("agent"와 "Agent"가 같은 테이블이면 같은 이름)"""
+        return self.table_resolver(table) if self.table_resolver is not None else table
+    
+    @staticmethod
+    def _generation_key(table: str) -> str:
+        return f"cache:gen:{table}"
+    
+    def _local_generation(self, table: str) -> Optional[int]:
+        entry = self._generations.get(table)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+    
+    def _remember_generation(self, table: str, generation: int):
+        self._generations[table] = (generation, time.monotonic() + config.CACHE_GENERATION_TTL)
+    
+    async def get_generations_async(self, tables: List[str]) -> Dict[str, int]:
+        """여러 테이블의 세대 번호 (요청한 이름을 키로 반환). 로컬에 없는 것만 MGET 한 번으로 조회"""
+        names = {table: self.canonical_table(table) for table in tables}
+        generations: Dict[str, int] = {}
+        missing: List[str] = []
+        for table in dict.fromkeys(names.values()):
+            generation = self._local_generation(table)
+            if generation is None:
+                missing.append(table)
+            else:
+                generations[table] = generation
+        if missing:
+            try:
+                values = await self._async_client.mget([self._generation_key(t) for t in missing])
+                self.metrics.record()
+            except Exception as e:
+                self._on_error("get cache generation", e)
+                values = [None] * len(missing)
+            for table, value in zip(missing, values):
+                generations[table] = int(value or 0)
+                self._remember_generation(table, generations[table])
+        return {name: generations[table] for name, table in names.items()}
+    
+    @staticmethod
+    def make_tagged_key(name: str, tables: Sequence[str], generations: Dict[str, int], params: Dict[str, Any] = None) -> str:
+        """여러 테이블에 의존하는 결과의 캐시 키
         
-        try:
-            # 연결 상태 확인
-            self._redis_client.ping()
-            return self._redis_client
-        except Exception as e:
-            logger.warning(f"Redis connection lost, attempting to reconnect: {e}")
-            self._initialize_redis()
-            return self._redis_client
+        키에 의존 테이블 목록과 각 테이블의 세대 번호가 들어가므로, 그중 한 테이블에 쓰기가 있으면
+        그 테이블을 읽은 항목만 새 키로 바뀌고(L1은 테이블 태그로 즉시 제거) 나머지 항목은 유지된다.
+        """
+        tags = ",".join(tables)
+        versions = ".".join(str(generations[table]) for table in tables)
+        params_str = "|".join(f"{k}={v}" for k, v in sorted((params or {}).items())) or "none"
+        return f"{TAGGED_KEY_PREFIX}{name}:{tags}:g{versions}:{params_str}"
+    
+    async def make_cache_key_async(self, table: str, columns: List[str] = None, filters: Dict[str, Any] = None, page: str = None) -> str:
+        """현재 테이블 세대 번호를 넣은 캐시 키"""
+        generations = await self.get_generations_async([table])
+        return self.make_cache_key(table=table, columns=columns, filters=filters, generation=generations[table], page=page)
     
-    def make_cache_key(self, table: str, columns: List[str] = None, filters: Dict[str, Any] = None) -> str:
+    def make_cache_key(self, table: str, columns: List[str] = None, filters: Dict[str, Any] = None, generation: int = 0, page: str = None) -> str:
         """
         캐시 키를 생성하는 함수
         table, columns, filters를 모두 포함하여 고유한 키 생성
+        테이블 세대 번호를 포함하므로 테이블 쓰기(INCR) 후에는 이전 키가 더 이상 조회되지 않는다
+        page(정렬/limit/커서)가 있으면 페이지마다 따로 캐시된다
         """
-        key_parts = [table]
+        key_parts = [self.canonical_table(table), f"g{generation}"]
         
         # columns 추가
         if columns:
@@ -73,106 +256,351 @@ class CacheManager:
         else:
             key_parts.append("filters:none")
         
+        if page:
+            key_parts.append(f"page:{page}")
+        
         return ":".join(key_parts)
-
-    def get_data_from_cache(self, _table: str, _columns: List[str] = None, _filters: Dict[str, Any] = None) -> Optional[str]:
-        """캐시에서 데이터 조회"""
+    
+    @staticmethod
+    def _fresh_key(key: str) -> str:
+        """stale-while-revalidate용 신선도 표식 키 (값 키보다 TTL이 짧다)"""
+        return f"{key}:fresh"
+    
+    @classmethod
+    def _queue_store(cls, pipe: Any, key: str, payload: bytes, ttl: int) -> int:
+        """파이프라인에 값 저장 명령을 쌓는다. 쌓은 명령 수 반환
+        
+        SWR이 켜져 있으면 값은 ttl + stale 구간만큼, 신선도 표식은 ttl만큼 유지한다.
+        모든 저장 경로가 이 함수를 거쳐야 단건/일괄 조회가 같은 기준으로 신선도를 판단한다.
+        """
+        if config.CACHE_STALE_TTL <= 0:
+            pipe.setex(key, ttl, payload)
+            return 1
+        pipe.setex(key, ttl + config.CACHE_STALE_TTL, payload)
+        pipe.setex(cls._fresh_key(key), ttl, "1")
+        return 2
+    
+    async def _read_with_freshness(self, key: str) -> Tuple[Optional[bytes], bool]:
+        """(원본 값, 신선 여부). SWR이 꺼져 있으면 값이 있으면 항상 신선"""
+        if config.CACHE_STALE_TTL <= 0:
+            value = await self._async_client.get(key)
+            self.metrics.record()
+            return value, True
+        value, fresh = await self._async_client.mget([key, self._fresh_key(key)])
+        self.metrics.record()
+        return value, fresh is not None
+    
+    async def _store(self, key: str, data: Any, ttl: int):
+        """값 저장 (신선도 표식 포함, _queue_store 참조)"""
+        payload = self.codec.encode(data)
+        async with self._async_client.pipeline(transaction=False) as pipe:
+            commands = self._queue_store(pipe, key, payload, ttl)
+            await pipe.execute()
+        self.metrics.record(commands=commands)
+        self.local_cache.set(key, self._table_of(key), data, len(payload))
+    
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        """워커 간 재계산 락 (SET NX PX). 획득 시 토큰, 실패 시 None"""
+        token = uuid.uuid4().hex
+        acquired = await self._async_client.set(f"lock:{key}", token, nx=True, px=config.CACHE_LOCK_TTL_MS)
+        self.metrics.record()
+        return token if acquired else None
+    
+    async def _release_lock(self, key: str, token: str):
         try:
-            redis_client = self._get_redis_client()
-            if not redis_client:
-                logger.warning("Redis client not available")
-                return None
-            
-            key_data: str = self.make_cache_key(table=_table, columns=_columns, filters=_filters)    
-            result = redis_client.get(key_data)
-            
-            if result:
-                logger.debug(f"Cache hit for key: {key_data}")
-            else:
-                logger.debug(f"Cache miss for key: {key_data}")
-            
-            return result
+            await self._async_client.eval(RELEASE_LOCK_SCRIPT, 1, f"lock:{key}", token)
+            self.metrics.record()
         except Exception as e:
-            logger.error(f"Failed to get data from cache: {e}")
-            return None
-
-    def save_data_to_cache(self, _table: str, _columns: List[str] = None, _filters: Dict[str, Any] = None, db_data: Any = None, ttl: int = None) -> bool:
-        """캐시에 데이터를 저장하는 함수
-
-        Args:
-            _table (str): 테이블명
-            _columns (list): 컬럼 리스트
-            _filters (dict): 필터 조건
-            db_data (dict): 데이터베이스에서 가져온 데이터
-            ttl (int, optional): 캐시의 유효 시간(초). Defaults to config.CACHE_DEFAULT_TTL.
-        
-        Returns:
-            bool: 저장 성공 여부
+            self._on_error("release cache lock", e)
+    
+    async def _load_and_store(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: int) -> Any:
+        data = await loader()
+        if data:
+            try:
+                await self._store(key, data, ttl)
+            except Exception as e:
+                self._on_error("save data to cache", e)
+        return data
+    
+    async def _load_coalesced(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: int) -> Any:
+        """miss 처리: 워커 간 락을 잡은 한 요청만 loader를 실행하고, 나머지는 캐시에 값이 생길 때까지 대기"""
+        try:
+            token = await self._acquire_lock(key)
+        except Exception as e:
+            self._on_error("acquire cache lock", e)
+            return await loader()
+        
+        if token is not None:
+            try:
+                return await self._load_and_store(key, loader, ttl)
+            finally:
+                await self._release_lock(key, token)
+        
+        # 다른 워커가 계산 중: 값이 채워질 때까지 짧게 폴링, 시간 초과 시 직접 로드
+        # 값 없이 락이 풀렸으면(빈 결과는 저장하지 않음, loader 실패) 기다리지 않고 바로 직접 로드
+        self.metrics.record_event("lock_waiters")
+        deadline = time.monotonic() + config.CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(config.CACHE_LOCK_POLL_INTERVAL)
+            try:
+                async with self._async_client.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.exists(f"lock:{key}")
+                    value, locked = await pipe.execute()
+                self.metrics.record(commands=2)
+            except Exception as e:
+                self._on_error("get data from cache", e)
+                break
+            if value is not None:
+                data = self.codec.decode(value)
+                self.local_cache.set(key, self._table_of(key), data, len(value))
+                return data
+            if not locked:
+                break
+        return await self._load_and_store(key, loader, ttl)
+    
+    def _schedule_refresh(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: int):
+        """stale 값을 돌려준 뒤 백그라운드에서 한 번만 갱신"""
+        if self._single_flight.is_inflight(f"refresh:{key}"):
+            return
+        
+        async def refresh():
+            try:
+                token = await self._acquire_lock(key)
+                if token is None:
+                    return
+                try:
+                    await self._load_and_store(key, loader, ttl)
+                finally:
+                    await self._release_lock(key, token)
+            except Exception as e:
+                self._on_error("refresh stale cache entry", e)
+        
+        self.metrics.record_event("background_refreshes")
+        task = asyncio.create_task(self._single_flight.do(f"refresh:{key}", refresh))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def get_or_load_async(self, key: str, loader: Callable[[], Awaitable[Any]], ttl: int = None, raw: bool = False) -> Any:
+        """캐시 조회 후 miss면 loader로 채운다 (L1 -> Redis -> loader)
+        
+        - 같은 키의 동시 miss는 프로세스 내에서 하나로 합치고, Redis 락으로 워커 간에도 한 번만 계산
+        - CACHE_STALE_TTL > 0이면 만료된 값을 바로 돌려주고 백그라운드에서 한 번 갱신 (stale-while-revalidate)
+        - raw=True이고 값이 wire-json 포맷이면 Redis hit을 디코딩하지 않고 RawJSON으로 돌려준다
         """
-        if not db_data:
+        if ttl is None:
+            ttl = config.CACHE_DEFAULT_TTL
+        
+        local = self.local_cache.get(key)
+        if local is not MISS:
+            return local
+        
+        try:
+            value, is_fresh = await self._read_with_freshness(key)
+        except Exception as e:
+            self._on_error("get data from cache", e)
+            return await loader()
+        
+        if value is not None:
+            passthrough = self.codec.raw_json(value) if raw else None
+            if passthrough is not None:
+                data = RawJSON(passthrough)
+            else:
+                data = self.codec.decode(value)
+                if is_fresh:
+                    self.local_cache.set(key, self._table_of(key), data, len(value))
+            if is_fresh:
+                return data
+            self.metrics.record_event("stale_serves")
+            self._schedule_refresh(key, loader, ttl)
+            return data
+        
+        data, shared = await self._single_flight.do(key, lambda: self._load_coalesced(key, loader, ttl))
+        if shared:
+            self.metrics.record_event("coalesced_waiters")
+        return data
+    
+    async def get_or_load_tagged_async(
+        self,
+        name: str,
+        tables: Sequence[str],
+        params: Dict[str, Any],
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = None,
+        raw: bool = False
+    ) -> Any:
+        """조인/복수 쿼리 결과 캐시: 읽은 테이블 전부를 태그로 달아 get_or_load_async로 조회
+        
+        세대 번호는 로컬에 캐시되어 있으면(무효화 메시지로 갱신) Redis를 거치지 않으므로
+        반복 조회는 L1 hit 또는 Redis GET 한 번이다.
+        """
+        tables = tuple(dict.fromkeys(self.canonical_table(table) for table in tables))
+        generations = await self.get_generations_async(list(tables))
+        key = self.make_tagged_key(name, tables, generations, params)
+        return await self.get_or_load_async(key, loader, ttl=ttl, raw=raw)
+    
+    def _mget_keys(self, keys: List[str]) -> List[str]:
+        """일괄 조회용 MGET 키 목록 (SWR이 켜져 있으면 값 키 뒤에 신선도 표식 키를 붙인다)"""
+        if config.CACHE_STALE_TTL <= 0:
+            return keys
+        return keys + [self._fresh_key(key) for key in keys]
+    
+    @staticmethod
+    def _fresh_values(keys: List[str], values: List[Optional[bytes]]) -> List[Optional[bytes]]:
+        """_mget_keys 결과에서 신선한 값만 남긴다 (stale 구간의 값은 miss로 보고 다시 읽는다)"""
+        if len(values) == len(keys):
+            return values
+        count = len(keys)
+        return [value if fresh is not None else None for value, fresh in zip(values[:count], values[count:])]
+    
+    async def get_many_from_cache_async(self, keys: List[str]) -> List[Optional[Any]]:
+        """여러 키의 디코딩된 데이터 조회 (비동기). L1에 없는 키만 MGET 한 번으로 조회"""
+        results: List[Optional[Any]] = [None] * len(keys)
+        remote: List[int] = []
+        for index, key in enumerate(keys):
+            local = self.local_cache.get(key)
+            if local is MISS:
+                remote.append(index)
+            else:
+                results[index] = local
+        if not remote:
+            return results
+        
+        try:
+            remote_keys = [keys[i] for i in remote]
+            values = self._fresh_values(remote_keys, await self._async_client.mget(self._mget_keys(remote_keys)))
+            self.metrics.record()
+            logger.debug(f"Cache MGET: {sum(v is not None for v in values)}/{len(remote)} hits, {len(keys) - len(remote)} L1 hits")
+            for index, value in zip(remote, values):
+                if value is None:
+                    continue
+                data = self.codec.decode(value)
+                self.local_cache.set(keys[index], self._table_of(keys[index]), data, len(value))
+                results[index] = data
+        except Exception as e:
+            self._on_error("get data from cache", e)
+        return results
+    
+    async def save_many_to_cache_async(self, items: List[Tuple[str, Any]], ttl: int = None) -> bool:
+        """(key, db_data) 목록을 파이프라인 한 번으로 저장 (비동기)"""
+        items = [(key, data) for key, data in items if data]
+        if not items:
             return False
         
         if ttl is None:
             ttl = config.CACHE_DEFAULT_TTL
         
         try:
-            redis_client = self._get_redis_client()
-            if not redis_client:
-                logger.warning("Redis client not available")
-                return False
-            
-            key = self.make_cache_key(table=_table, columns=_columns, filters=_filters)
-            redis_client.setex(key, ttl, json.dumps(db_data))
-            logger.debug(f"Data saved to cache with key: {key}, TTL: {ttl}s")
+            commands = 0
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                for key, data in items:
+                    payload = self.codec.encode(data)
+                    commands += self._queue_store(pipe, key, payload, ttl)
+                    self.local_cache.set(key, self._table_of(key), data, len(payload))
+                await pipe.execute()
+            self.metrics.record(commands=commands)
+            logger.debug(f"Saved {len(items)} entries to cache, TTL: {ttl}s")
             return True
         except Exception as e:
-            logger.error(f"Failed to save data to cache: {e}")
+            self._on_error("save data to cache", e)
             return False
     
-    def clear_cache(self, pattern: str = "*") -> bool:
-        """캐시 삭제"""
+    async def invalidate_table_async(self, table: str) -> bool:
+        """테이블 쓰기 후 호출. 세대 번호를 INCR해 테이블의 모든 캐시 키를 한 번에 무효화하고
+        (이전 키는 TTL로 만료), 다른 워커에 L1/세대 캐시 무효화 메시지를 발행"""
+        table = self.canonical_table(table)
+        self._generations.pop(table, None)
+        self.local_cache.invalidate_table(table)
         try:
-            redis_client = self._get_redis_client()
-            if not redis_client:
-                return False
-            
-            keys = redis_client.keys(pattern)
-            if keys:
-                redis_client.delete(*keys)
-                logger.info(f"Cleared {len(keys)} cache entries matching pattern: {pattern}")
+            async with self._async_client.pipeline(transaction=False) as pipe:
+                pipe.incr(self._generation_key(table))
+                pipe.publish(config.CACHE_INVALIDATION_CHANNEL, f"{self._instance_id} {table}")
+                generation, _ = await pipe.execute()
+            self.metrics.record(commands=2)
+            self._remember_generation(table, int(generation))
             return True
         except Exception as e:
-            logger.error(f"Failed to clear cache: {e}")
+            self._on_error("publish cache invalidation", e)
             return False
     
-    def health_check(self) -> bool:
-        """Redis 연결 상태 확인"""
+    async def _listen_invalidations(self):
+        """다른 워커가 발행한 테이블 무효화 메시지를 받아 L1/세대 캐시에 반영"""
+        while True:
+            pubsub = self._async_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(config.CACHE_INVALIDATION_CHANNEL)
+                # 구독이 끊겼던 동안의 메시지는 알 수 없으므로 L1/세대 캐시 전체를 비운다
+                self._generations.clear()
+                self.local_cache.clear()
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    # 메시지 형식: "{발신 인스턴스 id} {table}"
+                    origin, _, table = message["data"].decode().partition(" ")
+                    if origin == self._instance_id:
+                        continue
+                    self._generations.pop(table, None)
+                    self.local_cache.invalidate_table(table)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._on_error("listen for cache invalidations", e)
+                self._generations.clear()
+                self.local_cache.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+    
+    def start_invalidation_listener(self):
+        """무효화 구독 태스크 시작 (이벤트 루프 안에서 호출)
+        
+        L1이 꺼져 있어도 시작한다: 세대 번호 로컬 캐시도 이 메시지로 비워야 다른 워커의 쓰기가 바로 보인다.
+        """
+        if self._invalidation_task is not None:
+            return
+        self._invalidation_task = asyncio.create_task(self._listen_invalidations())
+    
+    async def health_check_async(self) -> bool:
+        """Redis 연결 상태 확인 (비동기)"""
         try:
-            redis_client = self._get_redis_client()
-            if not redis_client:
-                return False
-            
-            redis_client.ping()
+            await self._async_client.ping()
             return True
         except Exception as e:
             logger.error(f"Redis health check failed: {e}")
             return False
     
-    def get_cache_stats(self) -> Dict[str, Any]:
-        """캐시 통계 정보"""
+    async def close(self):
+        """무효화 구독 중지 및 Redis 커넥션 풀 정리"""
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            try:
+                await self._invalidation_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._invalidation_task = None
+        if self._async_client is not None:
+            await self._async_client.aclose(close_connection_pool=True)
+            self._async_client = None
+        logger.info("Redis connection pool closed")
+    
+    def _format_stats(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "connected_clients": info.get("connected_clients", 0),
+            "used_memory_human": info.get("used_memory_human", "0B"),
+            "total_commands_processed": info.get("total_commands_processed", 0),
+            "keyspace_hits": info.get("keyspace_hits", 0),
+            "keyspace_misses": info.get("keyspace_misses", 0),
+            "client_metrics": self.metrics.to_dict(),
+            "local_cache": self.local_cache.stats(),
+            "codec": self.codec.stats()
+        }
+    
+    async def get_cache_stats_async(self) -> Dict[str, Any]:
+        """캐시 통계 정보 (비동기 클라이언트로 INFO 조회, 이벤트 루프를 막지 않음)"""
         try:
-            redis_client = self._get_redis_client()
-            if not redis_client:
-                return {"error": "Redis client not available"}
-            
-            info = redis_client.info()
-            return {
-                "connected_clients": info.get("connected_clients", 0),
-                "used_memory_human": info.get("used_memory_human", "0B"),
-                "total_commands_processed": info.get("total_commands_processed", 0),
-                "keyspace_hits": info.get("keyspace_hits", 0),
-                "keyspace_misses": info.get("keyspace_misses", 0)
-            }
+            info = await self._async_client.info()
+            self.metrics.record()
+            return self._format_stats(info)
         except Exception as e:
             logger.error(f"Failed to get cache stats: {e}")
-            return {"error": str(e)}
\ No newline at end of file
+            return {"error": str(e)}
@@ -0,0 +1,213 @@
+import datetime
+import decimal
+import json
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+from . import fast_json
+
+try:
+    import msgpack
+except ImportError:  # msgpack이 없으면 JSON 포맷만 사용
+    msgpack = None
+
+# 헤더 1바이트: 하위 7비트 = 포맷(버전), 최상위 비트 = zlib 압축 여부
+FORMAT_JSON = 0x01
+FORMAT_MSGPACK = 0x02
+# 응답과 같은 형식의 JSON (타입은 보존되지 않지만 응답에 그대로 전달 가능)
+FORMAT_WIRE_JSON = 0x03
+COMPRESSED_FLAG = 0x80
+
+# msgpack ExtType 코드 (pymysql이 돌려주는 MySQL 타입)
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_TIME = 3
+_EXT_TIMEDELTA = 4
+_EXT_DECIMAL = 5
+
+
+class CacheCodecError(ValueError):
+    """알 수 없는 헤더 등으로 캐시 값을 디코딩할 수 없음"""
+
+
+def _msgpack_default(value: Any) -> Any:
+    # datetime은 date의 하위 클래스이므로 먼저 검사
+    if isinstance(value, datetime.datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, datetime.date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, datetime.time):
+        return msgpack.ExtType(_EXT_TIME, value.isoformat().encode())
+    if isinstance(value, datetime.timedelta):
+        return msgpack.ExtType(_EXT_TIMEDELTA, repr(value.total_seconds()).encode())
+    if isinstance(value, decimal.Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(value).encode())
+    raise TypeError(f"Cannot encode {type(value).__name__} for cache")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    text = data.decode()
+    if code == _EXT_DATETIME:
+        return datetime.datetime.fromisoformat(text)
+    if code == _EXT_DATE:
+        return datetime.date.fromisoformat(text)
+    if code == _EXT_TIME:
+        return datetime.time.fromisoformat(text)
+    if code == _EXT_TIMEDELTA:
+        return datetime.timedelta(seconds=float(text))
+    if code == _EXT_DECIMAL:
+        return decimal.Decimal(text)
+    return msgpack.ExtType(code, data)
+
+
+# JSON 포맷에서는 MySQL 타입을 {"__t": 타입, "v": 값} 객체로 표시
+_JSON_TYPES = {
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "timedelta": lambda v: datetime.timedelta(seconds=v),
+    "decimal": decimal.Decimal,
+    "bytes": bytes.fromhex,
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"__t": "datetime", "v": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"__t": "date", "v": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"__t": "time", "v": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {"__t": "timedelta", "v": value.total_seconds()}
+    if isinstance(value, decimal.Decimal):
+        return {"__t": "decimal", "v": str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__t": "bytes", "v": bytes(value).hex()}
+    raise TypeError(f"Cannot encode {type(value).__name__} for cache")
+
+
+def _json_object_hook(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 2 and "__t" in obj and "v" in obj:
+        parse = _JSON_TYPES.get(obj["__t"])
+        if parse is not None:
+            return parse(obj["v"])
+    return obj
+
+
+class CacheCodec:
+    """캐시 값 직렬화 (헤더 1바이트 + 본문)
+
+    기본은 msgpack(설치된 경우)으로 datetime/Decimal/bytes 등 pymysql 결과 타입을 그대로
+    왕복시키고, 본문이 compress_min_bytes 이상이면 zlib로 압축한다. "wire-json"은 응답 JSON과
+    같은 바이트를 저장해 캐시 hit을 디코딩/재인코딩 없이 응답으로 보낼 수 있다 (raw_json).
+    디코딩은 헤더로 포맷을 판단하므로 설정을 바꿔도 기존 값을 읽을 수 있고,
+    헤더가 없는 이전 JSON 문자열도 읽는다.
+    """
+
+    def __init__(self, format_name: str = "msgpack", compress_min_bytes: int = 4096, compress_level: int = 1):
+        if format_name == "msgpack" and msgpack is not None:
+            self.format = FORMAT_MSGPACK
+        elif format_name == "wire-json":
+            self.format = FORMAT_WIRE_JSON
+        else:
+            self.format = FORMAT_JSON
+        self.compress_min_bytes = compress_min_bytes
+        self.compress_level = compress_level
+        self._lock = threading.Lock()
+        self.encoded = 0
+        self.compressed = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self.decoded = 0
+        self.decode_seconds = 0.0
+        self.passthrough = 0
+
+    @property
+    def format_name(self) -> str:
+        return {FORMAT_MSGPACK: "msgpack", FORMAT_WIRE_JSON: "wire-json"}.get(self.format, "json")
+
+    def _dumps(self, value: Any) -> bytes:
+        if self.format == FORMAT_MSGPACK:
+            return msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+        if self.format == FORMAT_WIRE_JSON:
+            return fast_json.dumps(value)
+        return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+    @staticmethod
+    def _loads(fmt: int, body: bytes) -> Any:
+        if fmt == FORMAT_MSGPACK:
+            if msgpack is None:
+                raise CacheCodecError("msgpack is not installed")
+            return msgpack.unpackb(body, ext_hook=_msgpack_ext_hook, raw=False, strict_map_key=False)
+        if fmt == FORMAT_JSON:
+            return json.loads(body, object_hook=_json_object_hook)
+        if fmt == FORMAT_WIRE_JSON:
+            return fast_json.loads(body)
+        raise CacheCodecError(f"Unknown cache value format: {fmt:#x}")
+
+    def encode(self, value: Any) -> bytes:
+        """값 -> 헤더 + (압축된) 본문"""
+        body = self._dumps(value)
+        raw_size = len(body)
+        header = self.format
+        if self.compress_min_bytes > 0 and raw_size >= self.compress_min_bytes:
+            compressed = zlib.compress(body, self.compress_level)
+            # 압축 이득이 없으면 원본 유지
+            if len(compressed) < raw_size:
+                body = compressed
+                header |= COMPRESSED_FLAG
+        payload = bytes((header,)) + body
+        with self._lock:
+            self.encoded += 1
+            self.compressed += bool(header & COMPRESSED_FLAG)
+            self.raw_bytes += raw_size
+            self.stored_bytes += len(payload)
+        return payload
+
+    def decode(self, payload: bytes) -> Any:
+        """헤더 + 본문 -> 값"""
+        started = time.perf_counter()
+        if isinstance(payload, str):
+            payload = payload.encode()
+        header = payload[0]
+        if header in (0x5B, 0x7B):  # '[' / '{': 헤더 없는 이전 JSON 값
+            value = json.loads(payload)
+        else:
+            body = payload[1:]
+            if header & COMPRESSED_FLAG:
+                body = zlib.decompress(body)
+            value = self._loads(header & ~COMPRESSED_FLAG, body)
+        with self._lock:
+            self.decoded += 1
+            self.decode_seconds += time.perf_counter() - started
+        return value
+
+    def raw_json(self, payload: bytes) -> Optional[bytes]:
+        """wire-json 값이면 디코딩 없이 JSON 본문 바이트, 아니면 None"""
+        header = payload[0]
+        if header & ~COMPRESSED_FLAG != FORMAT_WIRE_JSON:
+            return None
+        body = payload[1:]
+        if header & COMPRESSED_FLAG:
+            body = zlib.decompress(body)
+        with self._lock:
+            self.passthrough += 1
+        return body
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "format": self.format_name,
+                "compress_min_bytes": self.compress_min_bytes,
+                "encoded": self.encoded,
+                "compressed": self.compressed,
+                "raw_bytes": self.raw_bytes,
+                "stored_bytes": self.stored_bytes,
+                "compression_ratio": round(self.stored_bytes / self.raw_bytes, 4) if self.raw_bytes else 1.0,
+                "decoded": self.decoded,
+                "avg_decode_ms": round(self.decode_seconds / self.decoded * 1000, 4) if self.decoded else 0.0,
+                "passthrough": self.passthrough
+            }
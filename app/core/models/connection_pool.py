@@ -0,0 +1,309 @@
+import threading
+import logging
+import time
+from collections import deque
+from typing import Optional, Callable, Dict, Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PoolError(Exception):
+    """커넥션 풀 관련 기본 예외"""
+
+
+class PoolTimeoutError(PoolError):
+    """체크아웃 대기 시간 초과"""
+
+
+class PoolExhaustedError(PoolError):
+    """대기열이 가득 차 즉시 거절됨"""
+
+
+class _PooledConnection:
+    __slots__ = ("conn", "created_at", "last_used_at")
+
+    def __init__(self, conn: Any):
+        now = time.monotonic()
+        self.conn = conn
+        self.created_at = now
+        self.last_used_at = now
+
+
+class ConnectionPool:
+    """min/max 크기, 대기열, 유휴 연결 정리, 최대 수명을 지원하는 스레드 안전 커넥션 풀
+
+    연결 생성은 락 밖에서 수행하며, max_size에 도달하면 최대 max_waiters개의
+    요청만 checkout_timeout 동안 대기시키고 나머지는 즉시 거절한다.
+    """
+
+    def __init__(
+        self,
+        create_connection: Callable[[], Optional[Any]],
+        min_size: int,
+        max_size: int,
+        max_waiters: int,
+        checkout_timeout: float,
+        idle_timeout: float,
+        max_lifetime: float,
+        reap_interval: float,
+        validate_connection: Optional[Callable[[Any], bool]] = None,
+        validate_idle_after: float = 0
+    ):
+        if min_size > max_size:
+            raise ValueError("min_size must not exceed max_size")
+
+        self._create_connection = create_connection
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_waiters = max_waiters
+        self.checkout_timeout = checkout_timeout
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.reap_interval = reap_interval
+        # validate_idle_after초 이상 쉰 연결만 체크아웃 시 검증 (0이면 매번 검증)
+        self._validate_connection = validate_connection
+        self.validate_idle_after = validate_idle_after
+
+        self._cond = threading.Condition()
+        self._idle: deque = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0  # idle + in_use + 생성 중인 연결 수
+        self._waiters = 0
+        self._closed = False
+
+        # 통계
+        self._checkouts = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+        self._timeouts = 0
+        self._rejected = 0
+        self._created = 0
+        self._closed_count = 0
+        self._reaped = 0
+        self._validations = 0
+        self._validations_skipped = 0
+        self._validation_failures = 0
+
+        self._reaper_stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+
+    def start(self):
+        """최소 연결 수만큼 미리 생성하고 정리 스레드 시작"""
+        self._fill_to_min()
+        self._reaper = threading.Thread(target=self._reap_loop, name="db-pool-reaper", daemon=True)
+        self._reaper.start()
+        logger.info(f"Connection pool started (min={self.min_size}, max={self.max_size}, size={self._size})")
+
+    def _is_expired(self, item: _PooledConnection, now: float) -> bool:
+        return self.max_lifetime > 0 and now - item.created_at >= self.max_lifetime
+
+    def _close_quietly(self, items: List[_PooledConnection]):
+        for item in items:
+            try:
+                item.conn.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled connection: {e}")
+        if items:
+            with self._cond:
+                self._closed_count += len(items)
+
+    def _new_connection(self) -> _PooledConnection:
+        """슬롯을 예약한 상태에서 호출. 실패 시 슬롯을 반납한다."""
+        conn = None
+        try:
+            conn = self._create_connection()
+        finally:
+            if conn is None:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+        if conn is None:
+            raise PoolError("Failed to create database connection")
+        with self._cond:
+            self._created += 1
+        return _PooledConnection(conn)
+
+    def _checkout(self, deadline: float) -> Tuple[_PooledConnection, bool]:
+        """유휴 연결 또는 새 연결 슬롯을 얻는다. (item, 새로 생성 여부) 반환"""
+        expired: List[_PooledConnection] = []
+        item: Optional[_PooledConnection] = None
+        should_create = False
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolError("Connection pool is closed")
+
+                now = time.monotonic()
+                while self._idle:
+                    candidate = self._idle.pop()
+                    if self._is_expired(candidate, now):
+                        self._size -= 1
+                        expired.append(candidate)
+                        continue
+                    item = candidate
+                    break
+                if item:
+                    break
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    should_create = True
+                    break
+
+                if self._waiters >= self.max_waiters:
+                    self._rejected += 1
+                    raise PoolExhaustedError(f"Connection pool exhausted ({self._waiters} waiters)")
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(f"Timed out after {self.checkout_timeout}s waiting for a connection")
+
+                self._waiters += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiters -= 1
+
+        self._close_quietly(expired)
+
+        if should_create:
+            return self._new_connection(), True
+        return item, False
+
+    def _needs_validation(self, item: _PooledConnection) -> bool:
+        if self._validate_connection is None:
+            return False
+        needed = time.monotonic() - item.last_used_at >= self.validate_idle_after
+        with self._cond:
+            if needed:
+                self._validations += 1
+            else:
+                self._validations_skipped += 1
+        return needed
+
+    def acquire(self) -> Any:
+        """연결 체크아웃. 풀이 가득 차면 대기 후 PoolTimeoutError / PoolExhaustedError"""
+        start = time.monotonic()
+        deadline = start + self.checkout_timeout
+
+        while True:
+            item, is_new = self._checkout(deadline)
+            # 방금 만든 연결과 최근에 쓰인 연결은 ping 없이 신뢰한다
+            if is_new or not self._needs_validation(item) or self._validate_connection(item.conn):
+                break
+
+            logger.warning("Stale idle connection failed validation, replacing it")
+            with self._cond:
+                self._validation_failures += 1
+                self._size -= 1
+                self._cond.notify()
+            self._close_quietly([item])
+
+        waited = time.monotonic() - start
+        with self._cond:
+            self._in_use[id(item.conn)] = item
+            self._checkouts += 1
+            self._total_wait_time += waited
+            self._max_wait_time = max(self._max_wait_time, waited)
+        return item.conn
+
+    def release(self, conn: Any, discard: bool = False):
+        """연결 반환. discard=True면 풀에 되돌리지 않고 닫는다."""
+        to_close: List[_PooledConnection] = []
+        with self._cond:
+            item = self._in_use.pop(id(conn), None)
+            if item is None:
+                logger.warning("Released connection does not belong to the pool")
+                to_close.append(_PooledConnection(conn))
+            else:
+                now = time.monotonic()
+                if discard or self._closed or self._is_expired(item, now):
+                    self._size -= 1
+                    to_close.append(item)
+                else:
+                    item.last_used_at = now
+                    self._idle.append(item)
+            self._cond.notify()
+        self._close_quietly(to_close)
+
+    def reap(self):
+        """유휴 시간/수명을 초과한 연결을 정리하고 최소 연결 수를 유지"""
+        to_close: List[_PooledConnection] = []
+        with self._cond:
+            now = time.monotonic()
+            kept = deque()
+            # 오래 쉰 연결이 앞쪽(left)에 있다
+            while self._idle:
+                item = self._idle.popleft()
+                idle_too_long = self.idle_timeout > 0 and now - item.last_used_at >= self.idle_timeout
+                if self._is_expired(item, now) or (idle_too_long and self._size > self.min_size):
+                    self._size -= 1
+                    to_close.append(item)
+                    continue
+                kept.append(item)
+            self._idle = kept
+            self._reaped += len(to_close)
+            if to_close:
+                self._cond.notify_all()
+        if to_close:
+            logger.info(f"Reaped {len(to_close)} idle/expired database connections")
+        self._close_quietly(to_close)
+        self._fill_to_min()
+
+    def _fill_to_min(self):
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                item = self._new_connection()
+            except PoolError as e:
+                logger.error(f"Failed to fill connection pool to minimum size: {e}")
+                return
+            with self._cond:
+                self._idle.append(item)
+                self._cond.notify()
+
+    def _reap_loop(self):
+        while not self._reaper_stop.wait(self.reap_interval):
+            try:
+                self.reap()
+            except Exception as e:
+                logger.error(f"Connection pool reaper failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 통계 정보"""
+        with self._cond:
+            return {
+                "size": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "waiters": self._waiters,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "checkouts": self._checkouts,
+                "avg_wait_ms": round(self._total_wait_time / self._checkouts * 1000, 3) if self._checkouts else 0.0,
+                "max_wait_ms": round(self._max_wait_time * 1000, 3),
+                "timeouts": self._timeouts,
+                "rejected": self._rejected,
+                "created": self._created,
+                "closed": self._closed_count,
+                "reaped": self._reaped,
+                "validations": self._validations,
+                "pings_skipped": self._validations_skipped,
+                "validation_failures": self._validation_failures
+            }
+
+    def close(self):
+        """모든 유휴 연결을 닫고 새 체크아웃을 막는다. 사용 중인 연결은 반환 시 닫힌다."""
+        self._reaper_stop.set()
+        with self._cond:
+            self._closed = True
+            to_close = list(self._idle)
+            self._idle.clear()
+            self._size -= len(to_close)
+            self._cond.notify_all()
+        self._close_quietly(to_close)
@@ -1,27 +1,54 @@
 import pymysql
 import logging
-from typing import Optional, List, Dict, Any
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Sequence, AsyncIterator, Tuple
 from contextlib import contextmanager
 import time
 from config import config
+from .connection_pool import ConnectionPool
+from .schema_catalog import SchemaCatalog
+from .query_compiler import QueryCompiler, BoundQuery, filter_shape, filter_params, keyset_params, quote_identifier
 
 logger = logging.getLogger(__name__)
 
 class DBManager:
     def __init__(self):
-        self.connection_pool = []
         self.max_connections = config.DB_MAX_CONNECTIONS
         self.connection_timeout = config.DB_CONNECTION_TIMEOUT
+        # pymysql 호출은 블로킹이므로 이벤트 루프 대신 전용 스레드에서 실행
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.DB_EXECUTOR_WORKERS,
+            thread_name_prefix="db-worker"
+        )
+        self.connection_pool = ConnectionPool(
+            create_connection=self._create_connection,
+            min_size=config.DB_MIN_CONNECTIONS,
+            max_size=self.max_connections,
+            max_waiters=config.DB_POOL_MAX_WAITERS,
+            checkout_timeout=config.DB_POOL_CHECKOUT_TIMEOUT,
+            idle_timeout=config.DB_POOL_IDLE_TIMEOUT,
+            max_lifetime=config.DB_POOL_MAX_LIFETIME,
+            reap_interval=config.DB_POOL_REAP_INTERVAL,
+            validate_connection=self._is_connection_valid,
+            validate_idle_after=config.DB_POOL_VALIDATE_IDLE_AFTER
+        )
+        # 파라미터화된 SQL 템플릿 LRU
+        self.query_compiler = QueryCompiler(max_size=config.DB_QUERY_CACHE_SIZE)
+        self._max_allowed_packet: Optional[int] = None
+        # 테이블/컬럼 타입, 기본 키, 인덱스 카탈로그 (load_schema_async로 로드)
+        self.catalog = SchemaCatalog(
+            fetch=self.get_data,
+            schema_name=config.DB_NAME,
+            refresh_interval=config.DB_SCHEMA_REFRESH_INTERVAL
+        )
         self._initialize_connections()
     
     def _initialize_connections(self):
         """연결 풀 초기화"""
         try:
-            for _ in range(self.max_connections):
-                conn = self._create_connection()
-                if conn:
-                    self.connection_pool.append(conn)
-            logger.info(f"Database connection pool initialized with {len(self.connection_pool)} connections")
+            self.connection_pool.start()
         except Exception as e:
             logger.error(f"Failed to initialize connection pool: {e}")
     
@@ -47,27 +74,27 @@ class DBManager:
             return None
     
     def _get_connection(self) -> Optional[pymysql.Connection]:
-        """사용 가능한 연결 가져오기"""
-        if not self.connection_pool:
-            logger.warning("No available connections in pool, creating new connection")
-            return self._create_connection()
-        
-        # 연결 풀에서 연결 가져오기
-        conn = self.connection_pool.pop()
-        
-        # 연결 상태 확인
-        if self._is_connection_valid(conn):
-            return conn
-        else:
-            logger.warning("Invalid connection detected, creating new one")
-            return self._create_connection()
+        """풀에서 연결 가져오기 (풀이 가득 차면 대기, 시간 초과 시 PoolError)
+
+        ping 검증은 오래 유휴 상태였던 연결에만 풀이 수행한다.
+        """
+        return self.connection_pool.acquire()
+    
+    def _return_connection(self, conn: pymysql.Connection, broken: bool = False):
+        """연결을 풀로 반환 (끊어진 연결은 폐기)"""
+        if broken:
+            logger.warning("Broken connection not returned to pool")
+        self.connection_pool.release(conn, discard=broken)
     
-    def _return_connection(self, conn: pymysql.Connection):
-        """연결을 풀로 반환"""
-        if conn and self._is_connection_valid(conn):
-            self.connection_pool.append(conn)
-        else:
-            logger.warning("Invalid connection not returned to pool")
+    @staticmethod
+    def _is_connection_error(e: Exception) -> bool:
+        """연결 끊김으로 인한 오류인지 확인 (쿼리 자체 오류와 구분)"""
+        if isinstance(e, pymysql.err.InterfaceError):
+            return True
+        if isinstance(e, pymysql.err.OperationalError) and e.args:
+            # 2006: server has gone away, 2013: lost connection, 2055: lost connection (system error)
+            return e.args[0] in (2006, 2013, 2055)
+        return False
     
     def _is_connection_valid(self, conn: pymysql.Connection) -> bool:
         """연결이 유효한지 확인"""
@@ -87,6 +114,7 @@ class DBManager:
         """커서 컨텍스트 매니저"""
         conn = None
         cursor = None
+        broken = False
         try:
             conn = self._get_connection()
             if not conn:
@@ -95,30 +123,40 @@ class DBManager:
             cursor = conn.cursor()
             yield cursor
         except Exception as e:
+            broken = self._is_connection_error(e)
             logger.error(f"Database operation failed: {e}")
             raise
         finally:
             if cursor:
-                cursor.close()
+                try:
+                    cursor.close()
+                except Exception:
+                    broken = True
             if conn:
-                self._return_connection(conn)
+                self._return_connection(conn, broken=broken)
     
-    def get_data(self, _sql: str) -> List[Dict[str, Any]]:
-        """데이터 조회"""
-        try:
-            with self._get_cursor() as cursor:
-                cursor.execute(_sql)
-                result = cursor.fetchall()
-                return result
-        except Exception as e:
-            logger.error(f"Failed to execute query: {_sql}, Error: {e}")
-            raise
+    def get_data(self, _sql: str, _params: Optional[Sequence[Any]] = None) -> List[Dict[str, Any]]:
+        """데이터 조회 (연결 끊김 시 DB_READ_RETRIES만큼 새 연결로 재시도)"""
+        attempt = 0
+        while True:
+            try:
+                with self._get_cursor() as cursor:
+                    cursor.execute(_sql, _params)
+                    result = cursor.fetchall()
+                    return result
+            except Exception as e:
+                if self._is_connection_error(e) and attempt < config.DB_READ_RETRIES:
+                    attempt += 1
+                    logger.warning(f"Connection lost during read, retrying ({attempt}/{config.DB_READ_RETRIES})")
+                    continue
+                logger.error(f"Failed to execute query: {_sql}, Error: {e}")
+                raise
     
-    def insert_data(self, _sql: str) -> str:
+    def insert_data(self, _sql: str, _params: Optional[Sequence[Any]] = None) -> str:
         """데이터 삽입"""
         try:
             with self._get_cursor() as cursor:
-                cursor.execute(_sql)
+                cursor.execute(_sql, _params)
                 return "success"
         except pymysql.MySQLError as e:
             logger.error(f"MySQL error during insert: {e}")
@@ -127,61 +165,108 @@ class DBManager:
             logger.error(f"Unexpected error during insert: {e}")
             return f"Error: {str(e)}"
     
-    def json_to_sql_select(self, _table: str, _columns: List[str] = None, _filters: Dict[str, Any] = None) -> str:
-        """JSON을 SQL SELECT 쿼리로 변환"""
-        if not _columns:
-            columns = "*"
-        else:
-            columns = ", ".join(_columns)
+    def json_to_sql_select(
+        self,
+        _table: str,
+        _columns: List[str] = None,
+        _filters: Dict[str, Any] = None,
+        _order_by: Tuple[Tuple[str, str], ...] = (),
+        _limit: Optional[int] = None,
+        _after: Optional[Sequence[Any]] = None
+    ) -> BoundQuery:
+        """JSON을 파라미터화된 SQL SELECT 쿼리로 변환
+
+        _order_by: ((column, "asc"|"desc"), ...), _after: 이전 페이지 마지막 행의 정렬 키 값 (keyset 페이지네이션)
+        """
+        compiled = self.query_compiler.select(
+            _table, _columns, filter_shape(_filters),
+            order=tuple(_order_by), keyset=_after is not None, limit=_limit is not None
+        )
+        params = filter_params(_filters)
+        if _after is not None:
+            params += keyset_params(tuple(_order_by), _after)
+        if _limit is not None:
+            params += (_limit,)
+        return compiled.bind(params)
+    
+    def json_to_sql_select_in(self, _table: str, _columns: Optional[List[str]], _column: str, _values: Sequence[Any]) -> BoundQuery:
+        """단일 컬럼 IN 조건 SELECT 쿼리로 변환 (배치 조회용)"""
+        compiled = self.query_compiler.select_in(_table, _columns, _column, len(_values))
+        return compiled.bind(tuple(_values))
+    
+    def json_to_sql_insert(self, _table: str, _data: Dict[str, Any]) -> BoundQuery:
+        """JSON을 파라미터화된 SQL INSERT 쿼리로 변환"""
+        compiled = self.query_compiler.insert(_table, tuple(_data.keys()))
+        return compiled.bind(tuple(_data.values()))
+    
+    def _get_max_allowed_packet(self, cursor) -> int:
+        """서버 max_allowed_packet (최초 1회 조회 후 보관)"""
+        if self._max_allowed_packet is None:
+            cursor.execute("SELECT @@max_allowed_packet AS max_allowed_packet")
+            self._max_allowed_packet = int(cursor.fetchone()["max_allowed_packet"])
+        return self._max_allowed_packet
+    
+    def insert_many(self, _table: str, _rows: List[Dict[str, Any]]) -> List[int]:
+        """여러 행을 다중 행 VALUES INSERT로 나눠 하나의 트랜잭션에서 삽입
+
+        청크는 max_allowed_packet의 90%와 DB_BULK_INSERT_MAX_ROWS를 넘지 않도록 자른다.
+        실패 시 전체 롤백 후 예외를 던진다.
+
+        Returns:
+            List[int]: 청크별 삽입된 행 수
+        """
+        if not _rows:
+            return []
         
-        if not _filters:
-            return f"SELECT {columns} FROM {_table};"
+        columns = tuple(_rows[0].keys())
+        for row in _rows:
+            if tuple(row.keys()) != columns and set(row.keys()) != set(columns):
+                raise ValueError("All rows must have the same columns")
         
-        conditions = []
-        for key, value in _filters.items():
-            if isinstance(value, str):
-                value = value.replace("'", "''")
-                conditions.append(f"{key}='{value}'")
-            else:
-                conditions.append(f"{key}={value}")
+        prefix = self.query_compiler.insert_many(_table, columns).sql
+        row_template = "(" + ", ".join(["%s"] * len(columns)) + ")"
         
-        where_clause = " AND ".join(conditions)
-        return f"SELECT {columns} FROM {_table} WHERE {where_clause};"
-    
-    def json_to_sql_insert(self, _table: str, _data: Dict[str, Any]) -> str:
-        """JSON을 SQL INSERT 쿼리로 변환"""
-        columns = ", ".join(_data.keys())
-        values = []
-        for value in _data.values():
-            if isinstance(value, str):
-                value = value.replace("'", "''")  # SQL escape
-                values.append(f"'{value}'")
-            else:
-                values.append(str(value))
-        values_str = ", ".join(values)
-        return f"INSERT INTO {_table} ({columns}) VALUES ({values_str});"
+        with self._get_cursor() as cursor:
+            budget = int(self._get_max_allowed_packet(cursor) * 0.9) - len(prefix.encode("utf-8"))
+            conn = cursor.connection
+            chunk_counts: List[int] = []
+            conn.begin()
+            try:
+                literals: List[str] = []
+                size = 0
+                for row in _rows:
+                    literal = cursor.mogrify(row_template, tuple(row[c] for c in columns))
+                    literal_size = len(literal.encode("utf-8")) + 1
+                    if literals and (size + literal_size > budget or len(literals) >= config.DB_BULK_INSERT_MAX_ROWS):
+                        cursor.execute(prefix + ",".join(literals))
+                        chunk_counts.append(cursor.rowcount)
+                        literals, size = [], 0
+                    literals.append(literal)
+                    size += literal_size
+                if literals:
+                    cursor.execute(prefix + ",".join(literals))
+                    chunk_counts.append(cursor.rowcount)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        
+        logger.info(f"Bulk inserted {sum(chunk_counts)} rows into {_table} in {len(chunk_counts)} chunks")
+        return chunk_counts
     
-    def json_to_sql_delete(self, _table: str, _filters: Dict[str, Any]) -> str:
-        """JSON을 SQL DELETE 쿼리로 변환"""
+    def json_to_sql_delete(self, _table: str, _filters: Dict[str, Any]) -> BoundQuery:
+        """JSON을 파라미터화된 SQL DELETE 쿼리로 변환"""
         if not _filters:
             raise ValueError("DELETE operation requires filters for safety")
         
-        conditions = []
-        for key, value in _filters.items():
-            if isinstance(value, str):
-                value = value.replace("'", "''")  # SQL escape
-                conditions.append(f"{key}='{value}'")
-            else:
-                conditions.append(f"{key}={value}")
-        
-        where_clause = " AND ".join(conditions)
-        return f"DELETE FROM {_table} WHERE {where_clause};"
+        compiled = self.query_compiler.delete(_table, filter_shape(_filters))
+        return compiled.bind(filter_params(_filters))
     
-    def delete_data(self, _sql: str) -> str:
+    def delete_data(self, _sql: str, _params: Optional[Sequence[Any]] = None) -> str:
         """데이터 삭제"""
         try:
             with self._get_cursor() as cursor:
-                cursor.execute(_sql)
+                cursor.execute(_sql, _params)
                 affected_rows = cursor.rowcount
                 if affected_rows > 0:
                     logger.info(f"Successfully deleted {affected_rows} rows")
@@ -196,16 +281,110 @@ class DBManager:
             logger.error(f"Unexpected error during delete: {e}")
             return f"Error: {str(e)}"
     
+    async def _run_in_executor(self, func: Callable, *args, **kwargs) -> Any:
+        """블로킹 함수를 DB 전용 스레드 풀에서 실행하고 결과를 await"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def get_data_async(self, _sql: str, _params: Optional[Sequence[Any]] = None) -> List[Dict[str, Any]]:
+        """데이터 조회 (비동기)"""
+        return await self._run_in_executor(self.get_data, _sql, _params)
+    
+    def _open_stream(self, _sql: str, _params: Optional[Sequence[Any]] = None) -> Tuple[pymysql.Connection, Any]:
+        """풀 연결에 서버 측(unbuffered) 커서를 열고 쿼리 실행"""
+        conn = self._get_connection()
+        if not conn:
+            raise Exception("Failed to get database connection")
+        try:
+            cursor = conn.cursor(pymysql.cursors.SSDictCursor)
+            cursor.execute(_sql, _params)
+            return conn, cursor
+        except Exception as e:
+            logger.error(f"Failed to execute streaming query: {_sql}, Error: {e}")
+            self._return_connection(conn, broken=self._is_connection_error(e))
+            raise
+    
+    async def stream_data_async(
+        self, _sql: str, _params: Optional[Sequence[Any]] = None, _batch_size: Optional[int] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """서버 측 커서로 조회해 최대 _batch_size 행씩 반환 (전체 결과를 메모리에 올리지 않음)
+        
+        스트림이 끝날 때까지 연결 하나를 점유한다. 중간에 중단되면 남은 행을 읽어 버리는 대신 연결을 폐기한다.
+        """
+        batch_size = _batch_size or config.DB_STREAM_BATCH_SIZE
+        conn, cursor = await self._run_in_executor(self._open_stream, _sql, _params)
+        loop = asyncio.get_running_loop()
+        fetch: Optional[asyncio.Future] = None
+        exhausted = False
+        try:
+            while True:
+                # shield: 요청이 취소돼도 실행 중인 fetchmany를 계속 추적한다
+                fetch = loop.run_in_executor(self._executor, cursor.fetchmany, batch_size)
+                rows = await asyncio.shield(fetch)
+                if not rows:
+                    exhausted = True
+                    break
+                yield rows
+        finally:
+            if fetch is not None and not fetch.done():
+                # fetchmany 도중 취소됨: 스레드가 아직 같은 소켓을 읽고 있으므로 끝난 뒤에 폐기
+                fetch.add_done_callback(lambda _: self._discard_stream(conn, fetch))
+            else:
+                if exhausted:
+                    try:
+                        cursor.close()
+                    except Exception:
+                        exhausted = False
+                if exhausted:
+                    self._return_connection(conn)
+                else:
+                    self._discard_stream(conn)
+    
+    def _discard_stream(self, conn: pymysql.Connection, fetch: Optional[asyncio.Future] = None):
+        """끝까지 읽지 않은 스트림의 연결 폐기 (클라이언트 연결 끊김 등 정상적인 중단)"""
+        if fetch is not None and not fetch.cancelled():
+            # 이미 중단된 스트림이므로 마지막 fetchmany의 결과/오류는 버린다
+            fetch.exception()
+        logger.debug("Streaming query aborted, discarding connection")
+        self.connection_pool.release(conn, discard=True)
+    
+    async def insert_data_async(self, _sql: str, _params: Optional[Sequence[Any]] = None) -> str:
+        """데이터 삽입 (비동기)"""
+        return await self._run_in_executor(self.insert_data, _sql, _params)
+    
+    async def insert_many_async(self, _table: str, _rows: List[Dict[str, Any]]) -> List[int]:
+        """다중 행 삽입 (비동기)"""
+        return await self._run_in_executor(self.insert_many, _table, _rows)
+    
+    async def delete_data_async(self, _sql: str, _params: Optional[Sequence[Any]] = None) -> str:
+        """데이터 삭제 (비동기)"""
+        return await self._run_in_executor(self.delete_data, _sql, _params)
+    
+    async def load_schema_async(self) -> bool:
+        """스키마 카탈로그 로드 후 주기적 갱신 시작"""
+        loaded = await self._run_in_executor(self.catalog.load)
+        self.catalog.start_auto_refresh()
+        return loaded
+    
+    async def refresh_schema_async(self) -> bool:
+        """스키마 카탈로그 즉시 갱신"""
+        return await self._run_in_executor(self.catalog.load)
+    
+    async def health_check_async(self) -> bool:
+        """데이터베이스 연결 상태 확인 (비동기)"""
+        return await self._run_in_executor(self.health_check)
+    
     def close_all_connections(self):
         """모든 연결 닫기"""
-        for conn in self.connection_pool:
-            try:
-                conn.close()
-            except Exception as e:
-                logger.error(f"Error closing connection: {e}")
-        self.connection_pool.clear()
+        self.catalog.stop_auto_refresh()
+        self._executor.shutdown(wait=False)
+        self.connection_pool.close()
         logger.info("All database connections closed")
     
+    def pool_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 통계 (in-use, idle, waiters, wait time 등)"""
+        return self.connection_pool.stats()
+    
     def health_check(self) -> bool:
         """데이터베이스 연결 상태 확인"""
         try:
@@ -217,40 +396,58 @@ class DBManager:
             logger.error(f"Database health check failed: {e}")
             return False
         
-    def glb_by_id(self, _id: int, _table: str):
+    def glb_by_id(self, _id: int, _table: str) -> BoundQuery:
+        table = quote_identifier(_table)
         sql = f"""
         SELECT 
-            main_table.name as {_table}_name, 
-            main_table.description as {_table}_description, 
+            main_table.name as `{_table}_name`, 
+            main_table.description as `{_table}_description`, 
+            GLB.id as glb_id,
             GLB.name as glb_name,
             GLB.description as glb_description,
-            GLB.data as glb_data
-        FROM {_table} main_table
+            GLB.sha256 as glb_sha256,
+            GLB.file_size as glb_file_size
+        FROM {table} main_table
         INNER JOIN GLB ON main_table.glb_id = GLB.id
-        WHERE main_table.id = {_id}
+        WHERE main_table.id = %s
         """
             
-        return sql
+        return BoundQuery(sql, (_id,))
             
-    def glb_by_scenario(self, _id: int)    :
-        sql = f"""
+    def scenario_queries(self, _id: int) -> Dict[str, BoundQuery]:
+        """시나리오 문서를 구성하는 관계별 조회 (각각 scenario_id 인덱스로 조회, 관계끼리 곱해지지 않음)"""
+        glb_columns = """
+                    g.id                 AS glb_id,
+                    g.name               AS glb_name,
+                    g.sha256             AS glb_sha256,
+                    g.file_size          AS glb_file_size"""
+        return {
+            "scenario": BoundQuery("""
+                SELECT s.id, s.name, s.description
+                FROM Scenario s
+                WHERE s.id = %s
+            """, (_id,)),
+            "agents": BoundQuery(f"""
                 SELECT
-                    s.id                 AS scenario_id,
-                    s.name               AS scenario_name,
-                    s.description        AS scenario_desc,
-
-                    a.id                 AS agent_id,
-                    a.name               AS agent_name,
-                    a.description        AS agent_desc,
-                    aglb.id              AS agent_glb_id,      
-
-                    t.id                 AS terrian_id,
-                    t.name               AS terrian_name,
-                    t.description        AS terrian_desc,
-                    tglb.id              AS terrian_glb_id, 
-
-                    e.id                 AS env_id,
-                    e.name               AS env_name,
+                    a.id, a.name, a.description,{glb_columns}
+                FROM Scenario_Agent sa
+                INNER JOIN Agent a ON a.id = sa.agent_id
+                LEFT JOIN GLB g ON g.id = a.glb_id
+                WHERE sa.scenario_id = %s
+                ORDER BY a.id
+            """, (_id,)),
+            "terrains": BoundQuery(f"""
+                SELECT
+                    t.id, t.name, t.description,{glb_columns}
+                FROM Scenario_Terrian st
+                INNER JOIN Terrian t ON t.id = st.terrian_id
+                LEFT JOIN GLB g ON g.id = t.glb_id
+                WHERE st.scenario_id = %s
+                ORDER BY t.id
+            """, (_id,)),
+            "environments": BoundQuery("""
+                SELECT
+                    e.id, e.name,
                     e.weather_type,
                     e.lighting_intensity,
                     e.sun_angle,
@@ -264,24 +461,11 @@ class DBManager:
                     e.wave_clarity,
                     e.buoyancy_strength,
                     e.sea_level
-
-                FROM 
-                    Scenario s
-                LEFT JOIN 
-                    Scenario_Agent sa ON sa.scenario_id = s.id
-                LEFT JOIN Agent a ON a.id = sa.agent_id
-                LEFT JOIN GLB aglb ON aglb.id = a.glb_id
-
-                LEFT JOIN Scenario_Terrian st ON st.scenario_id = s.id
-                LEFT JOIN Terrian t ON t.id = st.terrian_id
-                LEFT JOIN GLB tglb ON tglb.id = t.glb_id
-
-                LEFT JOIN Scenario_Environment se  ON se.scenario_id = s.id
-                LEFT JOIN Environment e ON e.id = se.env_id
-
-                WHERE s.id = {_id}
-                ORDER BY a.id, t.id, e.id;
-        """
-        return sql
+                FROM Scenario_Environment se
+                INNER JOIN Environment e ON e.id = se.env_id
+                WHERE se.scenario_id = %s
+                ORDER BY e.id
+            """, (_id,))
+        }
         
     
\ No newline at end of file
@@ -0,0 +1,51 @@
+import base64
+import datetime
+import decimal
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 같은 형식을 만든다
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """orjson/json이 직접 처리하지 못하는 pymysql 결과 타입 변환 (FastAPI jsonable_encoder와 같은 규칙)"""
+    if isinstance(value, decimal.Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(value)).decode("ascii")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    # 표준 json 경로에서만 필요 (orjson은 날짜/시간을 직접 직렬화)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """값을 한 번에 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class RawJSON:
+    """이미 JSON으로 직렬화된 바이트 (응답에 그대로 이어붙인다)"""
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __bool__(self) -> bool:
+        # 빈 결과 캐시는 저장하지 않으므로 "[]"도 비어있음으로 본다
+        return self.data not in (b"", b"[]", b"null")
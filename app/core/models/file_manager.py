@@ -0,0 +1,266 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Tuple, AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# GLB 파일은 "glTF" 매직 넘버로 시작
+GLB_MAGIC = b"glTF"
+# GLB 헤더: magic(4) + version(uint32 LE) + 전체 길이(uint32 LE)
+GLB_HEADER_SIZE = 12
+GLB_VERSION = 2
+
+
+# 사전 압축본 파일 접미사 (원본 경로 + 접미사, nginx gzip_static과 같은 규칙)
+VARIANT_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+class GLBValidationError(ValueError):
+    """GLB 헤더가 잘못되었거나 크기 제한을 넘음 (status_code: 응답 상태 코드)"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def parse_glb_header(header: bytes) -> int:
+    """12바이트 GLB 헤더 검증, 헤더에 선언된 전체 파일 길이 반환"""
+    if len(header) < GLB_HEADER_SIZE or header[:4] != GLB_MAGIC:
+        raise GLBValidationError("Missing glTF magic")
+    version, length = struct.unpack_from("<II", header, 4)
+    if version != GLB_VERSION:
+        raise GLBValidationError(f"Unsupported GLB version: {version}")
+    if length < GLB_HEADER_SIZE:
+        raise GLBValidationError(f"Invalid GLB length: {length}")
+    return length
+
+
+async def iter_glb_chunks(read: Callable[[int], Awaitable[bytes]], chunk_size: int, max_size: int) -> AsyncIterator[bytes]:
+    """업로드를 chunk_size씩 읽으며 헤더(매직/버전/길이)와 크기 제한을 검증하는 청크 스트림
+
+    헤더의 길이가 max_size를 넘으면 본문을 읽기 전에, 실제 크기가 선언된 길이와
+    다르면 읽는 도중/끝에 GLBValidationError를 낸다.
+    """
+    header = b""
+    declared = None
+    total = 0
+    while True:
+        chunk = await read(chunk_size)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_size:
+            raise GLBValidationError(f"File exceeds {max_size} bytes", status_code=413)
+        if declared is None:
+            header += chunk[:GLB_HEADER_SIZE - len(header)]
+            if len(header) == GLB_HEADER_SIZE:
+                declared = parse_glb_header(header)
+                if declared > max_size:
+                    raise GLBValidationError(f"File exceeds {max_size} bytes", status_code=413)
+        if declared is not None and total > declared:
+            raise GLBValidationError(f"File is longer than the GLB header length ({declared} bytes)")
+        yield chunk
+    if declared is None:
+        raise GLBValidationError("File is too short for a GLB header")
+    if total != declared:
+        raise GLBValidationError(f"File is {total} bytes, GLB header says {declared}")
+
+
+def decode_legacy_glb(value: Any) -> Optional[bytes]:
+    """GLB.data 컬럼의 이전 저장 형식(Base64 문자열 또는 원본 바이트)을 GLB 바이트로 변환. 알 수 없으면 None"""
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        if bytes(value[:4]) == GLB_MAGIC:
+            return bytes(value)
+        value = bytes(value).decode("ascii", errors="ignore")
+    try:
+        data = base64.b64decode(value, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return data if data[:4] == GLB_MAGIC else None
+
+
+class BlobWriter:
+    """청크 단위 기록 (SHA-256을 점진적으로 계산하며 임시 파일에 기록, 메모리 사용은 청크 크기)"""
+
+    def __init__(self, store: "BlobStore"):
+        self._store = store
+        fd, self.tmp_path = tempfile.mkstemp(dir=store._tmp_dir)
+        self._file = os.fdopen(fd, "wb")
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, chunk: bytes):
+        self._hash.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self) -> Tuple[str, int, bool]:
+        """기록 완료. (sha256 hex, 크기, 새로 기록했는지) 반환"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        digest = self._hash.hexdigest()
+        return digest, self.size, self._store._commit(self.tmp_path, digest)
+
+    def abort(self):
+        self._file.close()
+        if os.path.exists(self.tmp_path):
+            os.unlink(self.tmp_path)
+
+
+class BlobStore:
+    """SHA-256 기반 내용 주소 지정(content-addressed) 파일 저장소
+
+    `{root}/{hash[:2]}/{hash[2:4]}/{hash}` 경로에 한 번만 기록하므로 같은 내용의
+    업로드는 파일 하나를 공유한다. 기록은 임시 파일 + fsync + rename으로 원자적이라
+    읽는 쪽은 완성된 파일만 본다. 참조가 없는 파일 정리는 migrate_glb_blobs.py --gc로 한다.
+    """
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self._tmp_dir = self.root / "tmp"
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.dedup_hits = 0
+        self.reads = 0
+
+    @staticmethod
+    def _check_digest(digest: str) -> str:
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return digest
+
+    def path_for(self, digest: str) -> Path:
+        digest = self._check_digest(digest)
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def variant_path(self, digest: str, encoding: str) -> Path:
+        """사전 압축본 경로 (encoding: VARIANT_SUFFIXES의 키)"""
+        path = self.path_for(digest)
+        return path.with_name(path.name + VARIANT_SUFFIXES[encoding])
+
+    def exists(self, digest: str) -> bool:
+        return self.path_for(digest).is_file()
+
+    def size(self, digest: str) -> int:
+        return self.path_for(digest).stat().st_size
+
+    def _commit(self, tmp_path: str, digest: str) -> bool:
+        """임시 파일을 최종 경로로 옮긴다. 이미 같은 내용이 있으면 임시 파일을 버리고 False"""
+        path = self.path_for(digest)
+        if path.is_file():
+            os.unlink(tmp_path)
+            # 참조가 다시 생겼으므로 GC 유예 기간을 새로 시작
+            os.utime(path)
+            with self._lock:
+                self.dedup_hits += 1
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.writes += 1
+        return True
+
+    def put(self, data: bytes) -> Tuple[str, int, bool]:
+        """바이트 저장. (sha256 hex, 크기, 새로 기록했는지) 반환"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path_for(digest)
+        if path.is_file():
+            os.utime(path)
+            with self._lock:
+                self.dedup_hits += 1
+            return digest, len(data), False
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            created = self._commit(tmp_path, digest)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return digest, len(data), created
+
+    @contextmanager
+    def open_mmap(self, digest: str) -> Iterator[Any]:
+        """읽기 전용 mmap (페이지 캐시를 그대로 사용, 전체를 힙에 복사하지 않음)"""
+        with open(self.path_for(digest), "rb") as f:
+            with self._lock:
+                self.reads += 1
+            # 빈 파일은 mmap할 수 없다
+            if os.fstat(f.fileno()).st_size == 0:
+                yield b""
+                return
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    def read_base64(self, digest: str) -> str:
+        """Base64 문자열로 읽기 (JSON 다운로드 응답 호환용, mmap에서 바로 인코딩)"""
+        with self.open_mmap(digest) as mapped:
+            return base64.b64encode(mapped).decode("ascii")
+
+    def delete(self, digest: str) -> bool:
+        """파일과 사전 압축본 삭제"""
+        for encoding in VARIANT_SUFFIXES:
+            try:
+                os.unlink(self.variant_path(digest, encoding))
+            except FileNotFoundError:
+                pass
+        try:
+            os.unlink(self.path_for(digest))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def iter_digests(self) -> Iterator[Tuple[str, float]]:
+        """저장된 원본 파일 (digest, mtime) 순회"""
+        for first in self.root.iterdir():
+            if len(first.name) != 2 or not first.is_dir():
+                continue
+            for second in first.iterdir():
+                for path in second.iterdir():
+                    # 사전 압축본(.gz/.zst)은 제외
+                    if len(path.name) == 64 and path.is_file():
+                        yield path.name, path.stat().st_mtime
+
+    async def put_stream_async(self, chunks: AsyncIterator[bytes]) -> Tuple[str, int, bool]:
+        """청크 스트림 저장 (전체 파일을 메모리에 올리지 않음). 스트림이 예외를 내면 임시 파일 삭제"""
+        loop = asyncio.get_running_loop()
+        writer = await loop.run_in_executor(None, BlobWriter, self)
+        try:
+            async for chunk in chunks:
+                await loop.run_in_executor(None, writer.write, chunk)
+            return await loop.run_in_executor(None, writer.commit)
+        except BaseException:
+            writer.abort()
+            raise
+
+    async def read_base64_async(self, digest: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(None, self.read_base64, digest)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "root": str(self.root),
+                "writes": self.writes,
+                "dedup_hits": self.dedup_hits,
+                "reads": self.reads
+            }
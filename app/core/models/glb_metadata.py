@@ -0,0 +1,180 @@
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+from . import fast_json
+from .file_manager import BlobStore, GLBValidationError, GLB_HEADER_SIZE, parse_glb_header
+
+# 내용 해시(sha256)별 GLB 메타데이터 (같은 내용의 GLB 행들이 한 행을 공유)
+GLB_META_TABLE = "GLB_META"
+
+# 청크 헤더: 길이(uint32 LE) + 타입
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+# glTF primitive mode 4 = TRIANGLES (기본값)
+MODE_TRIANGLES = 4
+
+META_COLUMNS = (
+    "sha256", "glb_version", "file_size", "json_chunk_size", "bin_chunk_size",
+    "node_count", "mesh_count", "primitive_count", "material_count", "texture_count",
+    "image_count", "animation_count", "vertex_count", "triangle_count",
+    "min_x", "min_y", "min_z", "max_x", "max_y", "max_z",
+    "generator", "extensions_used"
+)
+
+# 응답의 metadata 항목 (sha256/file_size는 GLB 행에 이미 있음)
+META_FIELDS = tuple(c for c in META_COLUMNS if c not in ("sha256", "file_size"))
+
+# 목록 조회에서 범위 필터를 허용하는 컬럼 (인덱스 있음)
+RANGE_COLUMNS = ("file_size", "mesh_count", "material_count", "triangle_count")
+
+CREATE_TABLE_SQL = f"""
+CREATE TABLE IF NOT EXISTS `{GLB_META_TABLE}` (
+    `sha256` CHAR(64) NOT NULL,
+    `glb_version` INT UNSIGNED NOT NULL,
+    `file_size` BIGINT UNSIGNED NOT NULL,
+    `json_chunk_size` INT UNSIGNED NOT NULL,
+    `bin_chunk_size` BIGINT UNSIGNED NOT NULL,
+    `node_count` INT UNSIGNED NOT NULL,
+    `mesh_count` INT UNSIGNED NOT NULL,
+    `primitive_count` INT UNSIGNED NOT NULL,
+    `material_count` INT UNSIGNED NOT NULL,
+    `texture_count` INT UNSIGNED NOT NULL,
+    `image_count` INT UNSIGNED NOT NULL,
+    `animation_count` INT UNSIGNED NOT NULL,
+    `vertex_count` BIGINT UNSIGNED NOT NULL,
+    `triangle_count` BIGINT UNSIGNED NOT NULL,
+    `min_x` DOUBLE NULL,
+    `min_y` DOUBLE NULL,
+    `min_z` DOUBLE NULL,
+    `max_x` DOUBLE NULL,
+    `max_y` DOUBLE NULL,
+    `max_z` DOUBLE NULL,
+    `generator` VARCHAR(255) NULL,
+    `extensions_used` VARCHAR(1024) NULL,
+    `created_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (`sha256`),
+    KEY `idx_glb_meta_file_size` (`file_size`),
+    KEY `idx_glb_meta_mesh_count` (`mesh_count`),
+    KEY `idx_glb_meta_material_count` (`material_count`),
+    KEY `idx_glb_meta_triangle_count` (`triangle_count`)
+)
+"""
+
+UPSERT_SQL = (
+    f"INSERT INTO `{GLB_META_TABLE}` ({', '.join(f'`{c}`' for c in META_COLUMNS)}) "
+    f"VALUES ({', '.join(['%s'] * len(META_COLUMNS))}) "
+    f"ON DUPLICATE KEY UPDATE "
+    + ", ".join(f"`{c}` = VALUES(`{c}`)" for c in META_COLUMNS if c != "sha256")
+)
+
+
+def _accessor_count(gltf: Dict[str, Any], index: Optional[int]) -> int:
+    accessors = gltf.get("accessors") or []
+    if index is None or not 0 <= index < len(accessors):
+        return 0
+    return int(accessors[index].get("count", 0))
+
+
+def _summarize(gltf: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON 청크 요약 (개수, 정점/삼각형 수, POSITION 경계 상자)"""
+    meshes = gltf.get("meshes") or []
+    accessors = gltf.get("accessors") or []
+    primitive_count = 0
+    triangle_count = 0
+    position_accessors = set()
+    for mesh in meshes:
+        for primitive in mesh.get("primitives") or []:
+            primitive_count += 1
+            position = (primitive.get("attributes") or {}).get("POSITION")
+            if position is not None:
+                position_accessors.add(position)
+            if primitive.get("mode", MODE_TRIANGLES) == MODE_TRIANGLES:
+                if primitive.get("indices") is not None:
+                    triangle_count += _accessor_count(gltf, primitive["indices"]) // 3
+                else:
+                    triangle_count += _accessor_count(gltf, position) // 3
+
+    bounds_min = [None, None, None]
+    bounds_max = [None, None, None]
+    for index in position_accessors:
+        if not 0 <= index < len(accessors):
+            continue
+        accessor = accessors[index]
+        for axis, value in enumerate((accessor.get("min") or [])[:3]):
+            bounds_min[axis] = value if bounds_min[axis] is None else min(bounds_min[axis], value)
+        for axis, value in enumerate((accessor.get("max") or [])[:3]):
+            bounds_max[axis] = value if bounds_max[axis] is None else max(bounds_max[axis], value)
+
+    generator = (gltf.get("asset") or {}).get("generator")
+    extensions = gltf.get("extensionsUsed") or []
+    return {
+        "node_count": len(gltf.get("nodes") or []),
+        "mesh_count": len(meshes),
+        "primitive_count": primitive_count,
+        "material_count": len(gltf.get("materials") or []),
+        "texture_count": len(gltf.get("textures") or []),
+        "image_count": len(gltf.get("images") or []),
+        "animation_count": len(gltf.get("animations") or []),
+        "vertex_count": sum(_accessor_count(gltf, index) for index in position_accessors),
+        "triangle_count": triangle_count,
+        "min_x": bounds_min[0], "min_y": bounds_min[1], "min_z": bounds_min[2],
+        "max_x": bounds_max[0], "max_y": bounds_max[1], "max_z": bounds_max[2],
+        "generator": str(generator)[:255] if generator else None,
+        "extensions_used": ",".join(sorted(map(str, extensions)))[:1024] or None
+    }
+
+
+def parse_glb_metadata(buffer: Any) -> Dict[str, Any]:
+    """GLB 컨테이너(bytes 또는 mmap)에서 헤더/청크 크기/JSON 청크 요약을 추출
+
+    경계 상자는 POSITION accessor의 min/max를 합친 메시 로컬 좌표 기준이다
+    (노드 변환은 적용하지 않음). 본문 중 JSON 청크만 복사해 파싱한다.
+    """
+    length = parse_glb_header(bytes(buffer[:GLB_HEADER_SIZE]))
+    version = struct.unpack_from("<I", buffer, 4)[0]
+    if length != len(buffer):
+        raise GLBValidationError(f"File is {len(buffer)} bytes, GLB header says {length}")
+    if len(buffer) < GLB_HEADER_SIZE + 8:
+        raise GLBValidationError("Missing JSON chunk")
+    json_size, json_type = struct.unpack_from("<II", buffer, GLB_HEADER_SIZE)
+    json_start = GLB_HEADER_SIZE + 8
+    if json_type != CHUNK_JSON or json_start + json_size > len(buffer):
+        raise GLBValidationError("First chunk is not a valid JSON chunk")
+    try:
+        gltf = fast_json.loads(bytes(buffer[json_start:json_start + json_size]))
+    except ValueError as e:
+        raise GLBValidationError(f"Invalid JSON chunk: {e}")
+    if not isinstance(gltf, dict):
+        raise GLBValidationError("JSON chunk is not an object")
+
+    bin_size = 0
+    bin_header = json_start + json_size
+    if bin_header + 8 <= len(buffer):
+        chunk_size, chunk_type = struct.unpack_from("<II", buffer, bin_header)
+        if chunk_type == CHUNK_BIN:
+            bin_size = chunk_size
+
+    try:
+        summary = _summarize(gltf)
+    except (TypeError, ValueError, AttributeError) as e:
+        raise GLBValidationError(f"Malformed glTF JSON: {e}")
+    return {
+        "glb_version": version,
+        "file_size": len(buffer),
+        "json_chunk_size": json_size,
+        "bin_chunk_size": bin_size,
+        **summary
+    }
+
+
+def read_blob_metadata(blob_store: BlobStore, sha256: str) -> Dict[str, Any]:
+    """저장소 파일을 mmap으로 열어 메타데이터 추출 (sha256 포함)"""
+    with blob_store.open_mmap(sha256) as mapped:
+        meta = parse_glb_metadata(mapped)
+    meta["sha256"] = sha256
+    return meta
+
+
+def upsert_params(meta: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple(meta.get(column) for column in META_COLUMNS)
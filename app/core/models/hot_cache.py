@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import mmap
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없는 플랫폼(Windows)에서는 캐시 비활성
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 작업자 공용 카운터: hits, misses, bytes_served, stores, evictions, invalidations (uint64, 누적)
+_COUNTERS = ("hits", "misses", "bytes_served", "stores", "evictions", "invalidations")
+_COUNTER_STRUCT = struct.Struct(f"<{len(_COUNTERS)}Q")
+# 현재 항목 수와 총 크기 (카운터 뒤에 위치, .lock을 잡고만 갱신)
+_USAGE_STRUCT = struct.Struct("<QQ")
+_STATS_SIZE = _COUNTER_STRUCT.size + _USAGE_STRUCT.size
+
+
+class HotBlobCache:
+    """자주 받는 GLB 페이로드(Base64 등)를 uvicorn 작업자 프로세스가 함께 쓰는 바이트 예산 LRU
+
+    항목 하나가 디렉터리(기본 /dev/shm, 메모리 기반 tmpfs)의 파일 하나다. 기록은 임시 파일 +
+    rename이라 다른 작업자는 완성된 항목만 보고, 읽는 중에 축출돼도 열린 파일은 그대로 읽힌다.
+    LRU 순서는 hit 때 갱신하는 mtime이고, 축출과 카운터 갱신은 flock으로 작업자 간 직렬화한다.
+    총 크기는 공유 카운터로 추적해 예산을 넘었을 때만 디렉터리를 순회한다 (순회 결과로 다시 맞춘다).
+    키는 호출하는 쪽이 정한다 (저장소 파일은 sha256이라 재업로드되면 키가 바뀐다).
+    """
+
+    def __init__(self, root: str, max_bytes: int, max_entry_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self._counters: Optional[mmap.mmap] = None
+        self._stats_fd: Optional[int] = None
+        self._lock_fd: Optional[int] = None
+        if not self.enabled:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock_fd = os.open(self.root / ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        self._stats_fd = os.open(self.root / ".stats", os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked(self._lock_fd):
+            resync = False
+            with self._locked(self._stats_fd):
+                if os.fstat(self._stats_fd).st_size < _STATS_SIZE:
+                    os.ftruncate(self._stats_fd, _STATS_SIZE)
+                    resync = True
+            self._counters = mmap.mmap(self._stats_fd, _STATS_SIZE)
+            if resync:
+                # 새 카운터 파일: 이미 있는 항목으로 사용량을 맞춘다
+                self._evict_locked()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and fcntl is not None
+
+    @contextmanager
+    def _locked(self, fd: int) -> Iterator[None]:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _count(self, **deltas: int):
+        with self._locked(self._stats_fd):
+            self._count_locked(**deltas)
+
+    def _count_locked(self, **deltas: int):
+        """.stats를 잡은 상태에서만 호출"""
+        values = list(_COUNTER_STRUCT.unpack_from(self._counters))
+        for index, name in enumerate(_COUNTERS):
+            values[index] += deltas.get(name, 0)
+        _COUNTER_STRUCT.pack_into(self._counters, 0, *values)
+
+    def _usage(self) -> Tuple[int, int]:
+        """(항목 수, 총 크기)"""
+        return _USAGE_STRUCT.unpack_from(self._counters, _COUNTER_STRUCT.size)
+
+    def _set_usage(self, entries: int, size: int):
+        """.lock을 잡은 상태에서만 호출"""
+        _USAGE_STRUCT.pack_into(self._counters, _COUNTER_STRUCT.size, max(entries, 0), max(size, 0))
+
+    @staticmethod
+    def _file_size(path: Path) -> Optional[int]:
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            return None
+
+    def _path(self, key: str) -> Path:
+        if not key or key.startswith(".") or "/" in key or "\\" in key:
+            raise ValueError(f"Invalid cache key: {key!r}")
+        return self.root / key
+
+    def get(self, key: str) -> Optional[memoryview]:
+        """항목 내용의 읽기 전용 뷰 (파일을 mmap해 tmpfs 페이지를 복사 없이 그대로 쓴다)
+
+        뷰는 연 시점의 파일을 가리키므로 이후 축출/교체돼도 유효하다.
+        """
+        if not self.enabled:
+            return None
+        try:
+            f = open(self._path(key), "rb")
+        except FileNotFoundError:
+            self._count(misses=1)
+            return None
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            # 길이 0인 파일은 mmap할 수 없다
+            view = memoryview(mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) if size else b"")
+            with self._locked(self._stats_fd):
+                # LRU 순서 갱신과 카운터를 한 번의 락으로 (열린 파일 기준이라 그 사이 축출돼도 무해)
+                os.utime(f.fileno())
+                self._count_locked(hits=1, bytes_served=size)
+        return view
+
+    def put(self, key: str, data: bytes) -> bool:
+        """항목 기록 후 예산을 넘으면 오래된 항목부터 축출. 너무 크면 기록하지 않고 False"""
+        if not self.enabled or len(data) > self.max_entry_bytes:
+            return False
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        try:
+            # 본문 기록은 락 밖에서, 교체와 사용량 갱신만 락 안에서
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            with self._locked(self._lock_fd):
+                previous = self._file_size(path)
+                os.replace(tmp_path, path)
+                entries, size = self._usage()
+                if previous is None:
+                    entries += 1
+                size += len(data) - (previous or 0)
+                self._set_usage(entries, size)
+                evicted = self._evict_locked() if size > self.max_bytes else 0
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        self._count(stores=1, evictions=evicted)
+        return True
+
+    def _evict_locked(self) -> int:
+        """디렉터리를 순회해 예산 안으로 오래된 항목부터 삭제하고 사용량을 실제 값으로 맞춘다 (.lock 필요)"""
+        entries = []
+        total = 0
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    stat_result = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat_result.st_mtime, entry.path, stat_result.st_size))
+                total += stat_result.st_size
+        evicted = 0
+        for _, entry_path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(entry_path)
+                evicted += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._set_usage(len(entries) - evicted, total)
+        return evicted
+
+    def invalidate(self, *keys: str) -> int:
+        if not self.enabled:
+            return 0
+        removed = 0
+        with self._locked(self._lock_fd):
+            entries, size = self._usage()
+            for key in keys:
+                path = self._path(key)
+                previous = self._file_size(path)
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    continue
+                removed += 1
+                entries -= 1
+                size -= previous or 0
+            self._set_usage(entries, size)
+        if removed:
+            self._count(invalidations=removed)
+        return removed
+
+    async def get_async(self, key: str) -> Optional[memoryview]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    async def put_async(self, key: str, data: bytes) -> bool:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, self.put, key, data)
+        except OSError as e:
+            # tmpfs가 가득 찬 경우 등: 캐시 기록 실패는 응답에 영향을 주지 않는다
+            logger.warning(f"Failed to store hot cache entry {key}: {e}")
+            return False
+
+    async def invalidate_async(self, *keys: str) -> int:
+        return await asyncio.get_running_loop().run_in_executor(None, self.invalidate, *keys)
+
+    async def stats_async(self) -> Dict[str, Any]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.stats)
+
+    def close(self):
+        if self._counters is not None:
+            self._counters.close()
+            self._counters = None
+        for fd in (self._stats_fd, self._lock_fd):
+            if fd is not None:
+                os.close(fd)
+        self._stats_fd = self._lock_fd = None
+
+    def stats(self) -> Dict[str, Any]:
+        """전체 작업자 합산 카운터와 현재 사용량"""
+        if not self.enabled:
+            return {"enabled": False}
+        with self._locked(self._stats_fd):
+            counters = dict(zip(_COUNTERS, _COUNTER_STRUCT.unpack_from(self._counters)))
+        entries, size = self._usage()
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "enabled": True,
+            "root": str(self.root),
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hit_ratio": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+            **counters
+        }
@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Set, Tuple, Union
+
+# get()에서 "없음"과 None 값을 구분하기 위한 표식
+MISS = object()
+
+
+class LocalCache:
+    """프로세스 내 L1 캐시 (LRU + TTL + 바이트 예산)
+
+    디코딩이 끝난 결과를 보관해 Redis 왕복과 역직렬화를 생략한다. 항목마다
+    읽은 테이블(여러 개일 수 있음)을 기록해 두고 테이블 쓰기 시 해당 테이블 항목만 무효화한다.
+    크기는 호출자가 알려주는 직렬화된 바이트 수로 계산한다.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Any, Tuple[str, ...], int, float]]" = OrderedDict()
+        self._table_keys: Dict[str, Set[str]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def _remove(self, key: str):
+        """락을 잡은 상태에서 호출"""
+        value, tables, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        for table in tables:
+            keys = self._table_keys.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._table_keys[table]
+
+    def get(self, key: str) -> Any:
+        """값 조회. 없거나 만료되었으면 MISS"""
+        if not self.enabled:
+            return MISS
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS
+            if entry[3] <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, table: Union[str, Tuple[str, ...]], value: Any, size: int):
+        """값 저장 (table: 테이블 또는 테이블 튜플). 예산을 넘으면 오래 안 쓴 항목부터 제거"""
+        if not self.enabled or size > self.max_bytes:
+            return
+        tables = (table,) if isinstance(table, str) else tuple(table)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, tables, size, time.monotonic() + self.ttl)
+            for name in tables:
+                self._table_keys.setdefault(name, set()).add(key)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_table(self, table: str) -> int:
+        """테이블의 모든 항목 제거"""
+        with self._lock:
+            keys = list(self._table_keys.get(table, ()))
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._table_keys.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
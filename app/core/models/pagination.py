@@ -0,0 +1,139 @@
+import base64
+from typing import Optional, List, Dict, Any, Tuple
+
+from config import config
+from .cache_codec import CacheCodec
+from .schema_catalog import SchemaCatalog
+
+# 커서 값은 datetime/Decimal 등 타입을 보존해야 하므로 타입 태그가 붙는 JSON 포맷으로 직렬화
+_cursor_codec = CacheCodec(format_name="json", compress_min_bytes=0)
+
+
+class PaginationError(ValueError):
+    """잘못된 정렬/페이지 크기/커서"""
+
+
+def parse_order_by(order_by: Optional[List[str]]) -> Tuple[Tuple[str, str], ...]:
+    """["col", "-col"] -> (("col", "asc"), ("col", "desc"))"""
+    order = []
+    for item in order_by or []:
+        if not isinstance(item, str) or not item.lstrip("-"):
+            raise PaginationError(f"Invalid order_by item: {item!r}")
+        if item.startswith("-"):
+            order.append((item[1:], "desc"))
+        else:
+            order.append((item, "asc"))
+    return tuple(order)
+
+
+def _row_value(row: Dict[str, Any], column: str) -> Any:
+    # 결과 컬럼명은 요청과 대소문자가 다를 수 있다
+    if column in row:
+        return row[column]
+    lowered = column.lower()
+    return next(value for key, value in row.items() if key.lower() == lowered)
+
+
+class PageRequest:
+    """DBSelect의 order_by/limit/cursor를 검증된 정렬과 keyset 값으로 변환
+
+    커서는 마지막 행의 정렬 키 값을 담은 불투명 문자열이며, 다음 페이지는
+    OFFSET 대신 `정렬 키 > 커서 값` 조건으로 인덱스에서 바로 이어 읽는다.
+    다음 페이지 존재 여부는 limit + 1행을 읽어 판단한다.
+    """
+
+    def __init__(
+        self,
+        table: str,
+        columns: Optional[List[str]],
+        order: Tuple[Tuple[str, str], ...] = (),
+        limit: Optional[int] = None,
+        after: Optional[List[Any]] = None,
+        cursor: Optional[str] = None
+    ):
+        self.table = table
+        self.columns = columns
+        self.order = order
+        self.limit = limit
+        self.after = after
+        self.cursor = cursor
+
+    @classmethod
+    def from_query(
+        cls,
+        catalog: SchemaCatalog,
+        table: str,
+        columns: Optional[List[str]],
+        order_by: Optional[List[str]],
+        limit: Optional[int],
+        cursor: Optional[str]
+    ) -> "PageRequest":
+        if limit is not None and not 0 < limit <= config.DB_MAX_PAGE_SIZE:
+            raise PaginationError(f"limit must be between 1 and {config.DB_MAX_PAGE_SIZE}")
+        keyset = limit is not None or cursor is not None
+        order = catalog.validate_order_by(table, parse_order_by(order_by), keyset=keyset)
+        if keyset and not order:
+            raise PaginationError("Pagination requires order_by (primary key unknown)")
+        after = cls._decode_cursor(cursor, table, order) if cursor else None
+        return cls(table, columns, order, limit, after, cursor)
+
+    @staticmethod
+    def _signature(table: str, order: Tuple[Tuple[str, str], ...]) -> str:
+        return table.lower() + ":" + ",".join(f"{column.lower()} {direction}" for column, direction in order)
+
+    @classmethod
+    def _encode_cursor(cls, table: str, order: Tuple[Tuple[str, str], ...], values: List[Any]) -> str:
+        payload = _cursor_codec.encode({"s": cls._signature(table, order), "v": values})
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+    @classmethod
+    def _decode_cursor(cls, cursor: str, table: str, order: Tuple[Tuple[str, str], ...]) -> List[Any]:
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            data = _cursor_codec.decode(payload)
+            signature, values = data["s"], data["v"]
+        except Exception:
+            # 클라이언트가 보낸 임의 문자열이므로 디코딩 실패는 모두 잘못된 커서로 본다
+            raise PaginationError("Invalid cursor")
+        # 다른 테이블/정렬로 만든 커서는 거절
+        if signature != cls._signature(table, order) or len(values) != len(order):
+            raise PaginationError("Cursor does not match table/order_by")
+        return values
+
+    @property
+    def paginated(self) -> bool:
+        return self.limit is not None
+
+    @property
+    def select_columns(self) -> Optional[List[str]]:
+        """커서를 만들 수 있도록 정렬 컬럼을 포함한 조회 컬럼"""
+        if not self.columns or not self.paginated:
+            return self.columns
+        selected = {column.lower() for column in self.columns}
+        return list(self.columns) + [column for column, _ in self.order if column.lower() not in selected]
+
+    @property
+    def query_limit(self) -> Optional[int]:
+        """다음 페이지 유무를 알기 위해 한 행 더 읽는다"""
+        return self.limit + 1 if self.paginated else None
+
+    def cache_part(self) -> Optional[str]:
+        """캐시 키에 넣을 페이지 식별 문자열 (정렬/페이지 없으면 None)"""
+        if not self.order and not self.paginated and self.after is None:
+            return None
+        order = ",".join(("-" if direction == "desc" else "") + column for column, direction in self.order)
+        return f"order:{order}|limit:{self.limit}|after:{self.cursor or ''}"
+
+    def finish(self, rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """limit + 1행 결과 -> (페이지 행, 다음 커서 또는 None)"""
+        has_more = len(rows) > self.limit
+        rows = rows[:self.limit]
+        next_cursor = None
+        if has_more and rows:
+            values = [_row_value(rows[-1], column) for column, _ in self.order]
+            next_cursor = self._encode_cursor(self.table, self.order, values)
+        extra = self.select_columns[len(self.columns):] if self.columns else []
+        if extra:
+            extra_keys = {column.lower() for column in extra}
+            rows = [{k: v for k, v in row.items() if k.lower() not in extra_keys} for row in rows]
+        return rows, next_cursor
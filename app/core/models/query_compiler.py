@@ -0,0 +1,218 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, NamedTuple, Callable, Hashable, Sequence
+
+# 테이블/컬럼명은 바인딩할 수 없으므로 화이트리스트 패턴으로 검증 후 백틱으로 감싼다
+IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_$]{0,63}$")
+
+
+class QueryCompileError(ValueError):
+    """잘못된 테이블/컬럼명 등으로 쿼리 템플릿을 만들 수 없음"""
+
+
+class BoundQuery(NamedTuple):
+    """템플릿 SQL + 바인딩할 파라미터"""
+    sql: str
+    params: Tuple[Any, ...]
+
+
+class CompiledQuery:
+    """파라미터화된 SQL 템플릿과 템플릿별 사용 통계"""
+    __slots__ = ("sql", "hits", "misses")
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.hits = 0
+        self.misses = 1
+
+    def bind(self, params: Tuple[Any, ...]) -> BoundQuery:
+        return BoundQuery(self.sql, params)
+
+
+def quote_identifier(name: str) -> str:
+    """식별자를 검증하고 백틱으로 감싼다"""
+    if not isinstance(name, str) or not IDENTIFIER_PATTERN.match(name):
+        raise QueryCompileError(f"Invalid identifier: {name!r}")
+    return f"`{name}`"
+
+
+def filter_shape(filters: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    """필터 값에서 템플릿 형태만 추출 (키 순서 유지, NULL은 IS NULL)"""
+    if not filters:
+        return ()
+    return tuple((key, "null" if value is None else "eq") for key, value in filters.items())
+
+
+def filter_params(filters: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+    """filter_shape 순서에 맞는 바인딩 값"""
+    if not filters:
+        return ()
+    return tuple(value for value in filters.values() if value is not None)
+
+
+def keyset_params(order: Tuple[Tuple[str, str], ...], values: Sequence[Any]) -> Tuple[Any, ...]:
+    """QueryCompiler.select의 keyset 조건에 맞는 바인딩 값 (정렬 방향이 섞이면 조건이 풀어 쓰여 값이 반복된다)"""
+    if len({direction for _, direction in order}) <= 1:
+        return tuple(values)
+    params: List[Any] = []
+    for index in range(len(order)):
+        params.extend(values[:index + 1])
+    return tuple(params)
+
+
+class QueryCompiler:
+    """(table, columns, filter keys) -> 파라미터화된 SQL 템플릿을 만들고 LRU로 보관
+
+    절약은 클라이언트 쪽뿐이다: 쿼리 형태마다 템플릿 조립과 식별자 검증/따옴표 처리를 한 번만 한다.
+    값은 PyMySQL이 클라이언트에서 이스케이프해 문장에 넣으므로 서버는 매 호출마다 값이 들어간
+    다른 문장 텍스트를 받아 파싱한다 (서버 측 prepared statement가 아님).
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._templates: "OrderedDict[Hashable, CompiledQuery]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _get_or_compile(self, key: Hashable, build: Callable[[], str]) -> CompiledQuery:
+        with self._lock:
+            compiled = self._templates.get(key)
+            if compiled is not None:
+                self._templates.move_to_end(key)
+                compiled.hits += 1
+                self._hits += 1
+                return compiled
+
+        # 검증/조립은 락 밖에서 수행 (동시에 같은 키를 컴파일해도 결과는 동일)
+        compiled = CompiledQuery(build())
+        with self._lock:
+            self._misses += 1
+            self._templates[key] = compiled
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+                self._evictions += 1
+        return compiled
+
+    @staticmethod
+    def _where_clause(shape: Tuple[Tuple[str, str], ...]) -> str:
+        conditions = []
+        for key, op in shape:
+            column = quote_identifier(key)
+            conditions.append(f"{column} IS NULL" if op == "null" else f"{column}=%s")
+        return " AND ".join(conditions)
+
+    @staticmethod
+    def _keyset_clause(order: Tuple[Tuple[str, str], ...]) -> str:
+        """정렬 키가 커서 값 "이후"인 행 조건 (OFFSET 없이 인덱스 범위 조회)
+
+        방향이 모두 같으면 `(a, b) > (%s, %s)` 행 비교, 섞여 있으면
+        `(a > %s) OR (a = %s AND b < %s) ...`로 풀어 쓴다.
+        """
+        columns = [quote_identifier(column) for column, _ in order]
+        directions = {direction for _, direction in order}
+        if len(directions) == 1:
+            op = ">" if "asc" in directions else "<"
+            if len(columns) == 1:
+                return f"{columns[0]} {op} %s"
+            return f"({', '.join(columns)}) {op} ({', '.join(['%s'] * len(columns))})"
+        terms = []
+        for index, (_, direction) in enumerate(order):
+            conditions = [f"{column}=%s" for column in columns[:index]]
+            conditions.append(f"{columns[index]} {'>' if direction == 'asc' else '<'} %s")
+            terms.append("(" + " AND ".join(conditions) + ")")
+        return "(" + " OR ".join(terms) + ")"
+
+    def select(
+        self,
+        table: str,
+        columns: Optional[List[str]],
+        shape: Tuple[Tuple[str, str], ...],
+        order: Tuple[Tuple[str, str], ...] = (),
+        keyset: bool = False,
+        limit: bool = False
+    ) -> CompiledQuery:
+        """SELECT 템플릿
+
+        order: ((column, "asc"|"desc"), ...), keyset: 정렬 키 이후 조건 추가 (값은 keyset_params),
+        limit: `LIMIT %s` 추가. 바인딩 순서는 필터 -> keyset -> limit.
+        """
+        columns_key = tuple(columns) if columns else None
+        if keyset and not order:
+            raise QueryCompileError("Keyset pagination requires an order")
+
+        def build() -> str:
+            columns_sql = ", ".join(quote_identifier(c) for c in columns_key) if columns_key else "*"
+            sql = f"SELECT {columns_sql} FROM {quote_identifier(table)}"
+            conditions = []
+            if shape:
+                conditions.append(self._where_clause(shape))
+            if keyset:
+                conditions.append(self._keyset_clause(order))
+            if conditions:
+                sql += f" WHERE {' AND '.join(conditions)}"
+            if order:
+                sql += " ORDER BY " + ", ".join(
+                    f"{quote_identifier(column)} {'DESC' if direction == 'desc' else 'ASC'}" for column, direction in order
+                )
+            if limit:
+                sql += " LIMIT %s"
+            return sql
+
+        return self._get_or_compile(("select", table, columns_key, shape, order, keyset, limit), build)
+
+    def select_in(self, table: str, columns: Optional[List[str]], column: str, count: int) -> CompiledQuery:
+        """`WHERE column IN (%s, ...)` SELECT 템플릿 (값 개수별로 캐시)"""
+        columns_key = tuple(columns) if columns else None
+
+        def build() -> str:
+            columns_sql = ", ".join(quote_identifier(c) for c in columns_key) if columns_key else "*"
+            placeholders = ", ".join(["%s"] * count)
+            return f"SELECT {columns_sql} FROM {quote_identifier(table)} WHERE {quote_identifier(column)} IN ({placeholders})"
+
+        return self._get_or_compile(("select_in", table, columns_key, column, count), build)
+
+    def insert(self, table: str, columns: Tuple[str, ...]) -> CompiledQuery:
+        """단일 행 INSERT 템플릿"""
+        def build() -> str:
+            columns_sql = ", ".join(quote_identifier(c) for c in columns)
+            placeholders = ", ".join(["%s"] * len(columns))
+            return f"INSERT INTO {quote_identifier(table)} ({columns_sql}) VALUES ({placeholders})"
+
+        return self._get_or_compile(("insert", table, columns), build)
+
+    def insert_many(self, table: str, columns: Tuple[str, ...]) -> CompiledQuery:
+        """다중 행 INSERT의 고정 앞부분 (`INSERT INTO t (...) VALUES `). 행 리터럴은 호출자가 이어붙인다."""
+        def build() -> str:
+            columns_sql = ", ".join(quote_identifier(c) for c in columns)
+            return f"INSERT INTO {quote_identifier(table)} ({columns_sql}) VALUES "
+
+        return self._get_or_compile(("insert_many", table, columns), build)
+
+    def delete(self, table: str, shape: Tuple[Tuple[str, str], ...]) -> CompiledQuery:
+        """DELETE 템플릿 (필터 필수)"""
+        if not shape:
+            raise QueryCompileError("DELETE operation requires filters for safety")
+
+        def build() -> str:
+            return f"DELETE FROM {quote_identifier(table)} WHERE {self._where_clause(shape)}"
+
+        return self._get_or_compile(("delete", table, shape), build)
+
+    def stats(self) -> Dict[str, Any]:
+        """템플릿 캐시 통계 (전체 및 템플릿별 hit/miss)"""
+        with self._lock:
+            return {
+                "size": len(self._templates),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "templates": [
+                    {"sql": compiled.sql, "hits": compiled.hits, "misses": compiled.misses}
+                    for compiled in reversed(self._templates.values())
+                ]
+            }
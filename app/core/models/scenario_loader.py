@@ -0,0 +1,57 @@
+import asyncio
+import logging
+from typing import Optional, Dict, Any
+
+from .database import DBManager
+from .cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+# 시나리오 문서가 읽는 테이블 (하나라도 쓰기가 있으면 캐시 키가 바뀐다)
+SCENARIO_TABLES = (
+    "Scenario",
+    "Scenario_Agent", "Agent",
+    "Scenario_Terrian", "Terrian",
+    "Scenario_Environment", "Environment",
+    "GLB"
+)
+
+
+def _glb_ref(row: Dict[str, Any]) -> Dict[str, Any]:
+    """glb_* 컬럼을 중첩 객체로 묶는다 (GLB가 없으면 None)"""
+    glb = {key[4:]: row.pop(key) for key in ("glb_id", "glb_name", "glb_sha256", "glb_file_size")}
+    row["glb"] = glb if glb["id"] is not None else None
+    return row
+
+
+async def fetch_scenario(db_manager: DBManager, scenario_id: int) -> Optional[Dict[str, Any]]:
+    """관계별 조회를 동시에 실행해 {scenario, agents[], terrains[], environments[]} 문서로 조립
+
+    LEFT JOIN 한 번으로 읽으면 행 수가 agents x terrains x environments로 곱해지지만,
+    관계마다 따로 읽으면 행 수와 응답 크기가 합으로만 늘어난다. 시나리오가 없으면 None.
+    """
+    queries = db_manager.scenario_queries(scenario_id)
+    results = await asyncio.gather(*(
+        db_manager.get_data_async(_sql=query.sql, _params=query.params) for query in queries.values()
+    ))
+    parts = dict(zip(queries.keys(), results))
+    if not parts["scenario"]:
+        return None
+    return {
+        "scenario": parts["scenario"][0],
+        "agents": [_glb_ref(row) for row in parts["agents"]],
+        "terrains": [_glb_ref(row) for row in parts["terrains"]],
+        "environments": parts["environments"]
+    }
+
+
+async def load_scenario(db_manager: DBManager, cache_manager: CacheManager, scenario_id: int, raw: bool = False) -> Any:
+    """캐시된 시나리오 문서 (문서 단위로 캐시, SCENARIO_TABLES 중 하나라도 쓰기가 있으면 무효화)
+
+    raw=True면 캐시 hit을 디코딩 없이 응답에 넣을 수 있는 RawJSON으로 받을 수 있다.
+    """
+    return await cache_manager.get_or_load_tagged_async(
+        "scenario", SCENARIO_TABLES, {"id": scenario_id},
+        lambda: fetch_scenario(db_manager, scenario_id),
+        raw=raw
+    )
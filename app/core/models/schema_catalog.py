@@ -0,0 +1,266 @@
+import json
+import logging
+import threading
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Optional, List, Dict, Any, Callable, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+INTEGER_TYPES = {"tinyint", "smallint", "mediumint", "int", "integer", "bigint", "bit", "year"}
+DECIMAL_TYPES = {"decimal", "numeric"}
+FLOAT_TYPES = {"float", "double", "real"}
+STRING_TYPES = {"char", "varchar", "tinytext", "text", "mediumtext", "longtext", "enum", "set", "time"}
+
+COLUMNS_SQL = """
+    SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name, DATA_TYPE AS data_type,
+           IS_NULLABLE AS is_nullable, COLUMN_KEY AS column_key, COLLATION_NAME AS collation_name
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_SCHEMA = %s
+    ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+INDEXES_SQL = """
+    SELECT TABLE_NAME AS table_name, INDEX_NAME AS index_name, COLUMN_NAME AS column_name,
+           NON_UNIQUE AS non_unique
+    FROM INFORMATION_SCHEMA.STATISTICS
+    WHERE TABLE_SCHEMA = %s
+    ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+"""
+
+
+class SchemaValidationError(ValueError):
+    """카탈로그에 없는 테이블/컬럼이거나 값을 컬럼 타입으로 변환할 수 없음"""
+
+
+class ColumnInfo:
+    __slots__ = ("name", "data_type", "is_nullable", "collation")
+
+    def __init__(self, name: str, data_type: str, is_nullable: bool, collation: Optional[str] = None):
+        self.name = name
+        self.data_type = data_type
+        self.is_nullable = is_nullable
+        # 문자열 컬럼의 collation (그 외 타입은 None)
+        self.collation = collation
+
+
+class TableInfo:
+    """테이블의 컬럼 타입, 기본 키, 인덱스 정보"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.columns: Dict[str, ColumnInfo] = {}
+        self._columns_lower: Dict[str, ColumnInfo] = {}
+        self.primary_key: List[str] = []
+        self.indexes: Dict[str, List[str]] = {}
+        self.unique_indexes: set = set()
+
+    def add_column(self, column: ColumnInfo):
+        self.columns[column.name] = column
+        self._columns_lower[column.name.lower()] = column
+
+    def column(self, name: str) -> Optional[ColumnInfo]:
+        """컬럼 조회 (MySQL과 같이 대소문자 무시)"""
+        return self.columns.get(name) or self._columns_lower.get(str(name).lower())
+
+    def is_indexed(self, column: str) -> bool:
+        """컬럼이 어떤 인덱스의 선두 컬럼인지 (단일 컬럼 조회에 인덱스를 쓸 수 있는지)"""
+        return any(columns and columns[0].lower() == column.lower() for columns in self.indexes.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "columns": {name: col.data_type for name, col in self.columns.items()},
+            "primary_key": self.primary_key,
+            "indexes": self.indexes
+        }
+
+
+def coerce_value(table: str, column: ColumnInfo, value: Any) -> Any:
+    """요청 값을 컬럼 타입에 맞는 파이썬 값으로 변환"""
+    if value is None:
+        return None
+
+    data_type = column.data_type
+    try:
+        if data_type in INTEGER_TYPES:
+            if isinstance(value, bool):
+                return int(value)
+            if isinstance(value, float):
+                if not value.is_integer():
+                    raise ValueError
+                return int(value)
+            return int(value)
+        if data_type in DECIMAL_TYPES:
+            return Decimal(str(value))
+        if data_type in FLOAT_TYPES:
+            return float(value)
+        if data_type == "date":
+            return value if isinstance(value, date) else date.fromisoformat(str(value))
+        if data_type in ("datetime", "timestamp"):
+            return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+        if data_type == "json":
+            return value if isinstance(value, str) else json.dumps(value)
+        if data_type in STRING_TYPES:
+            if isinstance(value, (dict, list)):
+                raise ValueError
+            return str(value)
+    except (ValueError, TypeError, InvalidOperation):
+        raise SchemaValidationError(f"Column {table}.{column.name}: cannot convert {value!r} to {data_type}")
+
+    # blob/binary/geometry 등은 그대로 전달
+    return value
+
+
+class SchemaCatalog:
+    """INFORMATION_SCHEMA에서 읽어온 테이블/컬럼/인덱스 정보를 메모리에 보관
+
+    요청을 DB에 보내기 전에 테이블/컬럼명을 검증하고 필터 값을 컬럼 타입으로
+    변환한다. 카탈로그가 아직 로드되지 않았으면(DB 장애 등) 검증을 건너뛴다.
+    """
+
+    def __init__(self, fetch: Callable[[str, Sequence[Any]], List[Dict[str, Any]]], schema_name: str, refresh_interval: float = 0):
+        self._fetch = fetch
+        self.schema_name = schema_name
+        self.refresh_interval = refresh_interval
+        self._tables: Dict[str, TableInfo] = {}
+        self._tables_lower: Dict[str, TableInfo] = {}
+        self.is_loaded = False
+        self.loaded_at: Optional[datetime] = None
+        self._refresh_stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    def load(self) -> bool:
+        """카탈로그 (재)로드. 실패 시 이전 카탈로그 유지"""
+        try:
+            column_rows = self._fetch(COLUMNS_SQL, (self.schema_name,))
+            index_rows = self._fetch(INDEXES_SQL, (self.schema_name,))
+        except Exception as e:
+            logger.error(f"Failed to load schema catalog: {e}")
+            return False
+
+        tables: Dict[str, TableInfo] = {}
+        for row in column_rows:
+            table = tables.setdefault(row["table_name"], TableInfo(row["table_name"]))
+            table.add_column(ColumnInfo(
+                name=row["column_name"],
+                data_type=str(row["data_type"]).lower(),
+                is_nullable=row["is_nullable"] == "YES",
+                collation=str(row["collation_name"]).lower() if row.get("collation_name") else None
+            ))
+        for row in index_rows:
+            table = tables.get(row["table_name"])
+            if table is None:
+                continue
+            table.indexes.setdefault(row["index_name"], []).append(row["column_name"])
+            if not int(row["non_unique"]):
+                table.unique_indexes.add(row["index_name"])
+            if row["index_name"] == "PRIMARY":
+                table.primary_key.append(row["column_name"])
+
+        # 참조 교체로 원자적으로 반영
+        self._tables_lower = {name.lower(): info for name, info in tables.items()}
+        self._tables = tables
+        self.is_loaded = True
+        self.loaded_at = datetime.now()
+        logger.info(f"Schema catalog loaded: {len(tables)} tables")
+        return True
+
+    def start_auto_refresh(self):
+        """refresh_interval 주기로 카탈로그를 다시 읽는 스레드 시작"""
+        if self.refresh_interval <= 0 or self._refresher is not None:
+            return
+        self._refresher = threading.Thread(target=self._refresh_loop, name="schema-catalog-refresh", daemon=True)
+        self._refresher.start()
+
+    def stop_auto_refresh(self):
+        self._refresh_stop.set()
+
+    def _refresh_loop(self):
+        while not self._refresh_stop.wait(self.refresh_interval):
+            self.load()
+
+    def get_table(self, name: str) -> Optional[TableInfo]:
+        """테이블 정보 (카탈로그 미로드 시 None)"""
+        if not self.is_loaded:
+            return None
+        table = self._tables.get(name) or self._tables_lower.get(str(name).lower())
+        if table is None:
+            raise SchemaValidationError(f"Unknown table: {name}")
+        return table
+
+    def canonical_table(self, name: str) -> str:
+        """카탈로그에 기록된 실제 테이블명 (미로드이거나 없는 테이블이면 그대로)
+
+        MySQL은 테이블명을 대소문자 무시로 찾을 수 있으므로, 캐시 세대 키/무효화에는 이 이름을 쓴다.
+        """
+        table = self._tables.get(name) or self._tables_lower.get(str(name).lower())
+        return table.name if table is not None else name
+
+    def _column(self, table: TableInfo, name: str) -> ColumnInfo:
+        column = table.column(name)
+        if column is None:
+            raise SchemaValidationError(f"Unknown column: {table.name}.{name}")
+        return column
+
+    def _coerce_values(self, table: TableInfo, values: Optional[Dict[str, Any]], allow_null: bool) -> Optional[Dict[str, Any]]:
+        if not values:
+            return values
+        coerced = {}
+        for key, value in values.items():
+            column = self._column(table, key)
+            if value is None and not allow_null and not column.is_nullable:
+                raise SchemaValidationError(f"Column {table.name}.{column.name} is not nullable")
+            coerced[column.name] = coerce_value(table.name, column, value)
+        return coerced
+
+    def validate_select(self, table: str, columns: Optional[List[str]], filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """SELECT 요청 검증, 타입 변환된 필터 반환"""
+        info = self.get_table(table)
+        if info is None:
+            return filters
+        for name in columns or []:
+            self._column(info, name)
+        return self._coerce_values(info, filters, allow_null=True)
+
+    def validate_order_by(self, table: str, order: Sequence[Tuple[str, str]], keyset: bool) -> Tuple[Tuple[str, str], ...]:
+        """정렬 컬럼 검증, 컬럼명 정규화
+
+        keyset=True(페이지네이션)면 순서가 유일하도록 기본 키 컬럼을 뒤에 붙이고,
+        NULL 값은 keyset 비교로 이어갈 수 없으므로 NULL 허용 컬럼은 거절한다.
+        """
+        info = self.get_table(table)
+        if info is None:
+            return tuple(order)
+        normalized = []
+        for name, direction in order:
+            column = self._column(info, name)
+            if keyset and column.is_nullable:
+                raise SchemaValidationError(f"Column {info.name}.{column.name} is nullable and cannot be used for pagination")
+            normalized.append((column.name, direction))
+        if keyset:
+            ordered = {name.lower() for name, _ in normalized}
+            # 기본 키는 마지막 정렬 방향을 따른다 (방향이 같으면 행 비교 조건을 쓸 수 있다)
+            direction = normalized[-1][1] if normalized else "asc"
+            normalized.extend((name, direction) for name in info.primary_key if name.lower() not in ordered)
+        return tuple(normalized)
+
+    def validate_insert(self, table: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """INSERT 요청 검증, 타입 변환된 데이터 반환"""
+        info = self.get_table(table)
+        if info is None:
+            return data
+        return self._coerce_values(info, data, allow_null=False)
+
+    def validate_delete(self, table: str, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """DELETE 요청 검증, 타입 변환된 필터 반환"""
+        info = self.get_table(table)
+        if info is None:
+            return filters
+        return self._coerce_values(info, filters, allow_null=True)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.is_loaded,
+            "loaded_at": self.loaded_at.isoformat() if self.loaded_at else None,
+            "tables": {name: info.to_dict() for name, info in self._tables.items()}
+        }
@@ -0,0 +1,34 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """같은 키에 대한 동시 로드를 하나로 합친다 (프로세스 내, asyncio)
+
+    첫 호출자(leader)가 func를 별도 태스크로 시작하고, 그동안 들어온 호출자와 함께 같은 결과(또는 예외)를
+    기다린다. 각 호출자는 shield로 기다리므로 한 요청이 취소(클라이언트 연결 끊김)되어도 로드는 계속되고
+    나머지 호출자는 결과를 받는다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def is_inflight(self, key: str) -> bool:
+        return key in self._inflight
+
+    def _finish(self, key: str, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 기다리는 쪽이 없으면 "exception was never retrieved" 경고가 나지 않도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """(결과, 다른 호출의 결과를 공유했는지) 반환"""
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task), shared
@@ -2,23 +2,31 @@ from fastapi import APIRouter, Depends, Request, responses, status, Response, Bo
 from typing import Dict, Any
 from ..models.database import DBManager 
 from ..models.cache import CacheManager
-from ..models.base_model import DBSelect, DBInsert, DBDelete
+from ..models.base_model import DBSelect, DBSelectBatch, DBInsert, DBInsertMany, DBDelete
+from ..models.batch_read import read_batch
+from ..models.scenario_loader import load_scenario
+from ..models.schema_catalog import SchemaValidationError
+from ..models.pagination import PageRequest, PaginationError
+from ..dependencies import get_db_manager, get_cache_manager
 import json
+import pymysql
 from .response_format import ResponseFormat
 import queue
 import io
 from starlette.responses import StreamingResponse
 
-db_manager = DBManager()
-cache_manager = CacheManager()
-
 router = APIRouter()
 
 @router.post("/read/")
-async def read(dbquery: DBSelect):    
+async def read(
+    dbquery: DBSelect,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
+):    
     """
     지정된 테이블, 컬럼, 필터 조건에 따라 데이터를 조회합니다.
     우선 캐시(예: Redis)에서 데이터를 검색하고, 없을 경우 DB에서 조회 후 캐시에 저장합니다.
+    stream이 지정되면 캐시 없이 결과를 NDJSON 또는 청크 JSON으로 스트리밍합니다.
     조회 결과가 없으면 실패 메시지를 반환합니다.
     """
     try:
@@ -28,35 +36,98 @@ async def read(dbquery: DBSelect):
         columns = dict_data["columns"]
         filters = dict_data["filters"]
         
-        result = cache_manager.get_data_from_cache(_table=table, _columns=columns, _filters=filters)
+        # 카탈로그로 테이블/컬럼 검증 및 필터 타입 변환 (DB 왕복 없이 거절)
+        try:
+            filters = db_manager.catalog.validate_select(table, columns, filters)
+            page = PageRequest.from_query(
+                db_manager.catalog, table, columns, dict_data["order_by"], dict_data["limit"], dict_data["cursor"]
+            )
+        except (SchemaValidationError, PaginationError) as e:
+            return ResponseFormat.sql_fail(e)
         
-        # Return DB Data
-        if not result:            
-            result = db_manager.get_data(_sql=db_manager.json_to_sql_select(_table=table, _columns=columns, _filters=filters))
-            if not result:
+        # 스트리밍 모드: 캐시를 거치지 않고 서버 측 커서에서 읽은 행을 바로 전송
+        if dict_data["stream"]:
+            query = db_manager.json_to_sql_select(
+                _table=table, _columns=columns, _filters=filters,
+                _order_by=page.order, _limit=page.limit, _after=page.after
+            )
+            batches = db_manager.stream_data_async(_sql=query.sql, _params=query.params)
+            try:
+                first_rows = await anext(batches, None)
+            except Exception as e:
+                return ResponseFormat.sql_fail(e)
+            if first_rows is None:
                 return ResponseFormat.sql_fail("No data found")
-            
-            cache_manager.save_data_to_cache(_table=table, _columns=columns, _filters=filters, db_data=result)
-            # print("Data fetched from DB and saved to cache")
-            
-            return ResponseFormat.sql_success(result)      
+            return ResponseFormat.sql_stream(first_rows, batches, dict_data["stream"])
+        
+        cache_key = await cache_manager.make_cache_key_async(table=table, columns=columns, filters=filters, page=page.cache_part())
+        
+        async def load_from_db():
+            query = db_manager.json_to_sql_select(
+                _table=table, _columns=page.select_columns, _filters=filters,
+                _order_by=page.order, _limit=page.query_limit, _after=page.after
+            )
+            return await db_manager.get_data_async(_sql=query.sql, _params=query.params)
+        
+        # 캐시 -> (miss 시 동일 키 요청을 하나로 합쳐) DB 조회 후 캐시 저장
+        # 페이지는 커서를 만들려면 행이 필요하므로 디코딩된 값으로 받는다
+        result = await cache_manager.get_or_load_async(cache_key, load_from_db, raw=not page.paginated)
+        if not result:
+            return ResponseFormat.sql_fail("No data found")
+        
+        if page.paginated:
+            rows, next_cursor = page.finish(result)
+            return ResponseFormat.sql_success(rows, next_cursor=next_cursor)
+        return ResponseFormat.sql_success(result)
+        
+    except Exception as e:
+        return "Unknown error occurred: " + str(e)
 
-        # Return Cached Data
-        # print("Result From Redis")
-        return ResponseFormat.sql_success(json.loads(result))
+@router.post("/read-batch/")
+async def read_many(
+    dbquery: DBSelectBatch,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
+):
+    """
+    여러 조회를 한 번에 처리합니다.
+    캐시는 MGET 한 번으로 확인하고, 같은 테이블/단일 컬럼 동등 필터의 miss는
+    `WHERE col IN (...)` 조회 하나로 합친 뒤 요청별로 나눠 캐시에 저장합니다.
+    결과는 요청 순서대로 {"status", "result"} 목록입니다.
+    """
+    try:
+        if not dbquery.queries:
+            return ResponseFormat.sql_fail("No queries")
+        
+        results = await read_batch(db_manager, cache_manager, [dict(query) for query in dbquery.queries])
+        return ResponseFormat.sql_success(results)
         
     except Exception as e:
         return "Unknown error occurred: " + str(e)
 
 @router.post("/insert/")
-async def insert(dbquery: DBInsert):    
+async def insert(
+    dbquery: DBInsert,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
+):    
     try:
         dict_data: dict = dict(dbquery)
         
         table = dict_data["table"]
         data = dict_data["data"]
         
-        result = db_manager.insert_data(_sql=db_manager.json_to_sql_insert(_table=table, _data=data))
+        try:
+            data = db_manager.catalog.validate_insert(table, data)
+        except SchemaValidationError as e:
+            return ResponseFormat.sql_fail(e)
+        
+        query = db_manager.json_to_sql_insert(_table=table, _data=data)
+        result = await db_manager.insert_data_async(_sql=query.sql, _params=query.params)
+        
+        # 다른 워커의 L1 캐시까지 테이블 무효화
+        if result == "success":
+            await cache_manager.invalidate_table_async(table)
         
         # if result == "success":
         #     return ResponseFormat.sql_success(result)
@@ -68,8 +139,45 @@ async def insert(dbquery: DBInsert):
     except Exception as e:
         return "Unknown error occurred: " + str(e)
 
+@router.post("/insert-many/")
+async def insert_many(
+    dbquery: DBInsertMany,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
+):
+    """
+    한 테이블에 여러 행을 다중 행 INSERT로 묶어 하나의 트랜잭션에서 삽입합니다.
+    실패 시 전체가 롤백되며, 성공 시 청크별 삽입 행 수를 반환합니다.
+    """
+    try:
+        table = dbquery.table
+        rows = dbquery.rows
+        
+        if not rows:
+            return ResponseFormat.sql_fail("No rows to insert")
+        
+        try:
+            rows = [db_manager.catalog.validate_insert(table, row) for row in rows]
+        except SchemaValidationError as e:
+            return ResponseFormat.sql_fail(e)
+        
+        try:
+            chunk_counts = await db_manager.insert_many_async(_table=table, _rows=rows)
+        except (ValueError, pymysql.MySQLError) as e:
+            return ResponseFormat.sql_fail(e)
+        
+        await cache_manager.invalidate_table_async(table)
+        return ResponseFormat.sql_success({"rows": sum(chunk_counts), "chunks": chunk_counts})
+        
+    except Exception as e:
+        return "Unknown error occurred: " + str(e)
+
 @router.post("/delete/")
-async def delete(dbquery: DBDelete):    
+async def delete(
+    dbquery: DBDelete,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
+):    
     try:
         dict_data: dict = dict(dbquery)
         
@@ -80,12 +188,18 @@ async def delete(dbquery: DBDelete):
         if not filters:
             return ResponseFormat.sql_fail("DELETE operation requires filters for safety")
         
+        try:
+            filters = db_manager.catalog.validate_delete(table, filters)
+        except SchemaValidationError as e:
+            return ResponseFormat.sql_fail(e)
+        
         # DELETE 쿼리 생성 및 실행
-        result = db_manager.delete_data(_sql=db_manager.json_to_sql_delete(_table=table, _filters=filters))
+        query = db_manager.json_to_sql_delete(_table=table, _filters=filters)
+        result = await db_manager.delete_data_async(_sql=query.sql, _params=query.params)
         
-        # 캐시에서 관련 데이터 삭제
+        # 테이블 세대 번호 증가로 관련 캐시 무효화
         try:
-            cache_manager.clear_cache(pattern=f"{table}:*")
+            await cache_manager.invalidate_table_async(table)
         except Exception as cache_error:
             # 캐시 삭제 실패는 로그만 남기고 계속 진행
             print(f"Cache clear warning: {cache_error}")
@@ -103,13 +217,24 @@ async def delete(dbquery: DBDelete):
 @router.get("/data-by-glb/")
 async def get_data_by_glb(
     id: int,
-    table: str
+    table: str,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
 ):
     try:
-        sql = db_manager.glb_by_id(_id=id, _table=table)
-        if not sql:
+        # 대소문자만 다른 테이블명도 같은 캐시 키/세대를 쓰도록 실제 테이블명으로 바꾼다
+        table = cache_manager.canonical_table(table)
+        query = db_manager.glb_by_id(_id=id, _table=table)
+        if not query:
             return {"error": "SQL 생성에 실패했습니다."}
-        result = db_manager.get_data(_sql=sql)
+        
+        async def load_from_db():
+            return await db_manager.get_data_async(_sql=query.sql, _params=query.params)
+        
+        # 조인한 두 테이블 중 어느 쪽에 쓰기가 있어도 무효화
+        result = await cache_manager.get_or_load_tagged_async(
+            "data-by-glb", (table, "GLB"), {"table": table, "id": id}, load_from_db, raw=True
+        )
         if not result:
             return {"error": "데이터를 찾을 수 없습니다."}
         return ResponseFormat.sql_success(result)
@@ -119,15 +244,28 @@ async def get_data_by_glb(
   
 @router.get("/scenario-by-glb/")
 async def get_scenario_by_glb(
-    id: int
+    id: int,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
 ):
+    """시나리오와 agents/terrains/environments를 중첩 문서로 반환 (관계별 동시 조회, 문서 단위 캐시)"""
     try:
-        sql = db_manager.glb_by_scenario(_id=id)
-        if not sql:
-            return {"error": "SQL 생성에 실패했습니다."}
-        result = db_manager.get_data(_sql=sql)
+        result = await load_scenario(db_manager, cache_manager, id, raw=True)
         if not result:
             return {"error": "데이터를 찾을 수 없습니다."}
         return ResponseFormat.sql_success(result)
     except Exception as e:
-        return {"error": f"알 수 없는 오류 발생: {str(e)}"}
\ No newline at end of file
+        return {"error": f"알 수 없는 오류 발생: {str(e)}"}
+
+
+@router.post("/schema/refresh/")
+async def refresh_schema(
+    db_manager: DBManager = Depends(get_db_manager)
+):
+    """INFORMATION_SCHEMA에서 스키마 카탈로그를 즉시 다시 읽습니다."""
+    try:
+        if not await db_manager.refresh_schema_async():
+            return ResponseFormat.sql_fail("Failed to refresh schema catalog")
+        return ResponseFormat.sql_success(list(db_manager.catalog.summary()["tables"].keys()))
+    except Exception as e:
+        return {"error": f"알 수 없는 오류 발생: {str(e)}"}
@@ -1,18 +1,210 @@
-from fastapi import APIRouter, Depends, Request, responses, status, Response, Body, FastAPI, File, UploadFile
-from fastapi.responses import FileResponse, JSONResponse
-from typing import Dict, Any, Optional
+from fastapi import APIRouter, Depends, Request, responses, status, Response, Body, FastAPI, File, UploadFile, Query
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from typing import Dict, Any, Optional, Tuple, List, Union
 from ..models.base_model import DBInsert, DBSelect, GLBUploadRequest, GLBDownloadResponse
 from ..models.database import DBManager
+from ..models.cache import CacheManager
+from ..models.file_manager import BlobStore, GLBValidationError, decode_legacy_glb, iter_glb_chunks
+from ..models.blob_compressor import BlobCompressor
+from ..models.glb_metadata import GLB_META_TABLE, META_FIELDS, RANGE_COLUMNS, UPSERT_SQL, read_blob_metadata, upsert_params
+from ..models.scenario_loader import load_scenario
+from ..models.asset_bundle import ScenarioBundle
+from ..models.hot_cache import HotBlobCache
+from ..dependencies import get_db_manager, get_cache_manager, get_blob_store, get_blob_compressor, get_hot_cache
 import json
-from .response_format import ResponseFormat
+from .response_format import ResponseFormat, BlobFileResponse, accepted_encodings
+from config import config
+import asyncio
+import hashlib
+import pymysql
+import logging
 import queue
 import io
 import base64
 import os
+from urllib.parse import quote
 from pydantic import BaseModel
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
-db_manager = DBManager()
+
+# GLB 메타데이터 테이블 (파일 본문은 BlobStore, 행에는 sha256/file_size만 저장)
+GLB_TABLE = "GLB"
+
+# glb-info/glb-list 조회 컬럼 (GLB 행 + GLB_META 요약, 파일 본문은 읽지 않음)
+GLB_INFO_SELECT = (
+    "SELECT g.id, g.name, g.description, g.sha256, g.file_size, "
+    + ", ".join(f"m.`{field}`" for field in META_FIELDS)
+    + f" FROM {GLB_TABLE} g LEFT JOIN {GLB_META_TABLE} m ON m.sha256 = g.sha256"
+)
+
+
+def _file_info(row: Dict[str, Any]) -> Dict[str, Any]:
+    """조회 행 -> {GLB 필드..., "metadata": {...} 또는 None(미색인)}"""
+    info = {key: row[key] for key in ("id", "name", "description", "sha256", "file_size")}
+    info["metadata"] = {field: row[field] for field in META_FIELDS} if row.get("glb_version") is not None else None
+    return info
+
+
+async def _index_glb_metadata(db_manager: DBManager, cache_manager: CacheManager, blob_store: BlobStore, sha256: str, created: bool):
+    """업로드된 GLB의 컨테이너 메타데이터를 GLB_META에 저장 (같은 내용이 이미 색인돼 있으면 생략)
+
+    잘못된 JSON 청크 등은 GLBValidationError. 테이블이 없는 등 DB 오류는 업로드를 막지 않고
+    경고만 남긴다 (migrate_glb_blobs.py가 빠진 메타데이터를 채운다).
+    """
+    if not created:
+        try:
+            rows = await db_manager.get_data_async(f"SELECT sha256 FROM {GLB_META_TABLE} WHERE sha256 = %s", (sha256,))
+        except pymysql.MySQLError as e:
+            logger.warning(f"Failed to check GLB metadata for {sha256}: {e}")
+            return
+        if rows:
+            return
+    meta = await asyncio.get_running_loop().run_in_executor(None, read_blob_metadata, blob_store, sha256)
+    result = await db_manager.insert_data_async(UPSERT_SQL, upsert_params(meta))
+    if result == "success":
+        await cache_manager.invalidate_table_async(GLB_META_TABLE)
+    else:
+        logger.warning(f"Failed to index GLB metadata for {sha256}: {result}")
+
+
+def _hot_cache_keys(file_id: int, sha256: Optional[str]) -> List[str]:
+    """GLB 행의 작업자 공용 캐시 키 (저장소 파일은 내용 해시, 옮기지 않은 행은 id 기준)"""
+    keys = [f"id-{file_id}.glb", f"id-{file_id}.b64"]
+    if sha256:
+        keys.append(f"{sha256}.b64")
+    return keys
+
+
+async def _legacy_glb_bytes(db_manager: DBManager, hot_cache: HotBlobCache, file_id: int) -> Optional[Union[bytes, memoryview]]:
+    """아직 저장소로 옮기지 않은 행의 data 컬럼 (디코딩한 바이트를 공용 캐시에 보관, hit이면 캐시 파일의 뷰)"""
+    key = f"id-{file_id}.glb"
+    data = await hot_cache.get_async(key)
+    if data is not None:
+        return data
+    rows = await db_manager.get_data_async(f"SELECT data FROM {GLB_TABLE} WHERE id = %s", (file_id,))
+    data = decode_legacy_glb(rows[0]["data"]) if rows else None
+    if data is not None:
+        await hot_cache.put_async(key, data)
+    return data
+
+
+def _base64_size(encoded: Union[bytes, memoryview]) -> int:
+    return len(encoded) * 3 // 4 - bytes(encoded[-2:]).count(b"=")
+
+
+async def _glb_base64(db_manager: DBManager, blob_store: BlobStore, hot_cache: HotBlobCache, file_info: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+    """GLB 본문의 (Base64, 원본 크기). 아직 저장소로 옮기지 않은 행은 data 컬럼에서 읽는다
+
+    인코딩 결과는 작업자 공용 캐시에 보관해 자주 받는 파일을 요청마다 다시 읽고 인코딩하지 않는다.
+    """
+    sha256 = file_info.get("sha256")
+    key = f"{sha256}.b64" if sha256 else f"id-{file_info['id']}.b64"
+    encoded = await hot_cache.get_async(key)
+    if encoded is None:
+        if sha256:
+            encoded = (await blob_store.read_base64_async(sha256)).encode("ascii")
+        else:
+            data = await _legacy_glb_bytes(db_manager, hot_cache, file_info["id"])
+            if data is None:
+                return None
+            encoded = base64.b64encode(data)
+        await hot_cache.put_async(key, encoded)
+    # 캐시 hit이면 mmap 뷰에서 바로 문자열로 (중간 bytes 복사 없음)
+    return str(encoded, "ascii"), _base64_size(encoded)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교: W/ 접두사 무시)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _content_disposition(filename: str) -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def _find_variant(blob_store: BlobStore, sha256: str, encodings: List[str]) -> Optional[Tuple[str, Any, os.stat_result]]:
+    """선호 순서대로 존재하는 첫 사전 압축본 (encoding, 경로, stat)"""
+    for encoding in encodings:
+        path = blob_store.variant_path(sha256, encoding)
+        try:
+            return encoding, path, os.stat(path)
+        except FileNotFoundError:
+            continue
+    return None
+
+
+async def _glb_raw_response(
+    request: Request,
+    db_manager: DBManager,
+    blob_store: BlobStore,
+    blob_compressor: BlobCompressor,
+    hot_cache: HotBlobCache,
+    file_info: Dict[str, Any]
+) -> Response:
+    """GLB 원본 바이트 응답 (application/octet-stream)
+
+    Accept-Encoding이 허용하는 사전 압축본(zstd/gzip)이 있으면 Content-Encoding을 붙여 그대로 보낸다.
+    내용 해시(+인코딩)가 곧 ETag(strong)이므로 If-None-Match 일치 시 파일을 열지 않고 304를 돌려준다.
+    Range/If-Range는 BlobFileResponse(FileResponse)가 처리한다 (압축본이면 압축된 바이트 기준).
+    """
+    media_type = "application/octet-stream"
+    headers = {
+        # 매번 ETag로 재검증 (같은 id/이름이 다른 파일을 가리키게 될 수 있다)
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+        "Content-Disposition": _content_disposition(file_info["name"])
+    }
+    sha256 = file_info.get("sha256")
+    data = None
+    if not sha256:
+        # 아직 저장소로 옮기지 않은 행: data 컬럼에서 읽어 메모리에서 전송 (Range 미지원)
+        data = await _legacy_glb_bytes(db_manager, hot_cache, file_info["id"])
+        if data is None:
+            return JSONResponse(status_code=404, content={"error": "파일 데이터를 찾을 수 없습니다."})
+        sha256 = hashlib.sha256(data).hexdigest()
+
+    variant = None
+    # X-Accel-Redirect 모드에서는 프록시(nginx gzip_static)가 같은 경로의 .gz를 고른다
+    if data is None and not config.GLB_ACCEL_REDIRECT_PREFIX:
+        encodings = accepted_encodings(request.headers.get("accept-encoding"), blob_compressor.encodings)
+        if encodings:
+            variant = await asyncio.get_running_loop().run_in_executor(None, _find_variant, blob_store, sha256, encodings)
+
+    # 인코딩마다 바이트가 다르므로 ETag도 다르다
+    etag = f'"{sha256}-{variant[0]}"' if variant else f'"{sha256}"'
+    headers["ETag"] = etag
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        del headers["Content-Disposition"]
+        return Response(status_code=304, headers=headers)
+
+    if data is not None:
+        return Response(content=data, media_type=media_type, headers=headers)
+
+    if variant:
+        encoding, path, stat_result = variant
+        headers["Content-Encoding"] = encoding
+        return BlobFileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
+
+    path = blob_store.path_for(sha256)
+    if config.GLB_ACCEL_REDIRECT_PREFIX:
+        # 프록시(nginx internal location)가 Range 처리와 sendfile 전송을 맡는다
+        headers["X-Accel-Redirect"] = f"{config.GLB_ACCEL_REDIRECT_PREFIX}/{path.relative_to(blob_store.root).as_posix()}"
+        return Response(media_type=media_type, headers=headers)
+
+    try:
+        stat_result = await asyncio.get_running_loop().run_in_executor(None, os.stat, path)
+    except FileNotFoundError:
+        return JSONResponse(status_code=404, content={"error": "파일 데이터를 찾을 수 없습니다."})
+    return BlobFileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
 
 
 # GLB 파일 바이너리 업로드 (바이너리 형태로 직접 받기)
@@ -20,9 +212,13 @@ db_manager = DBManager()
 async def upload_glb_binary(
     file: UploadFile = File(...),
     name: Optional[str] = None,
-    description: Optional[str] = ""
+    description: Optional[str] = "",
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    blob_store: BlobStore = Depends(get_blob_store),
+    blob_compressor: BlobCompressor = Depends(get_blob_compressor)
 ):
-    table = "GLB"
+    table = GLB_TABLE
     try:
         # 파일명 설정
         if not name:
@@ -35,35 +231,54 @@ async def upload_glb_binary(
                 content={"error": "파일명은 .glb 확장자여야 합니다."}
             )
         
-        # 파일 데이터 읽기
-        file_data = await file.read()
+        # 청크 단위로 읽으며 헤더 검증/해시 계산/저장 (파일 전체를 메모리에 올리지 않음)
+        # 본문은 내용 해시 경로에 한 번만 저장 (같은 파일 재업로드 시 기존 파일 공유)
+        try:
+            sha256, file_size, created = await blob_store.put_stream_async(
+                iter_glb_chunks(file.read, config.GLB_UPLOAD_CHUNK_SIZE, config.GLB_MAX_UPLOAD_BYTES)
+            )
+        except GLBValidationError as e:
+            if e.status_code == 413:
+                message = f"파일이 너무 큽니다 (최대 {config.GLB_MAX_UPLOAD_BYTES} bytes)."
+            else:
+                message = f"유효하지 않은 GLB 파일입니다: {e}"
+            return JSONResponse(
+                status_code=e.status_code,
+                content={"error": message}
+            )
         
-        # GLB 파일 헤더 검증 (GLB 파일은 "glTF"로 시작)
-        if len(file_data) < 4 or file_data[:4] != b'glTF':
+        # 헤더/JSON 청크 요약 색인 (glb-info/glb-list는 파일을 읽지 않고 이 테이블로 응답)
+        try:
+            await _index_glb_metadata(db_manager, cache_manager, blob_store, sha256, created)
+        except GLBValidationError as e:
             return JSONResponse(
                 status_code=400,
-                content={"error": "유효하지 않은 GLB 파일입니다."}
+                content={"error": f"유효하지 않은 GLB 파일입니다: {e}"}
             )
         
-        # 바이너리 데이터를 Base64로 인코딩하여 저장
-        file_data_base64 = base64.b64encode(file_data).decode('utf-8')
-        
-        # 기존 테이블 구조에 맞춰 저장 (id, data, name, description)
+        # DB에는 메타데이터와 해시만 저장
         insert_data = {
-            "data": file_data_base64,
             "name": name,
-            "description": description
+            "description": description,
+            "sha256": sha256,
+            "file_size": file_size
         }
         
         # 파라미터화된 쿼리를 사용하여 안전하게 데이터 삽입
-        result = db_manager.insert_data(db_manager.json_to_sql_insert(table, insert_data))
+        query = db_manager.json_to_sql_insert(table, insert_data)
+        result = await db_manager.insert_data_async(query.sql, query.params)
         
         if result == "success":
+            await cache_manager.invalidate_table_async(table)
+            # gzip/zstd 사전 압축본은 프로세스 풀에서 백그라운드로 생성 (응답을 기다리게 하지 않음)
+            blob_compressor.schedule(sha256, file_size)
             return {
                 "success": True,
                 "name": name,
                 "description": description,
-                "file_size": len(file_data),
+                "file_size": file_size,
+                "sha256": sha256,
+                "deduplicated": not created,
                 "message": "GLB 파일이 성공적으로 업로드되었습니다."
             }
         else:
@@ -80,18 +295,21 @@ async def upload_glb_binary(
 
 # GLB 파일 다운로드 (Unity C# 호환)
 @router.get("/download-glb/{file_id}", response_model=GLBDownloadResponse)
-async def download_glb(file_id: int):
+async def download_glb(
+    file_id: int,
+    db_manager: DBManager = Depends(get_db_manager),
+    blob_store: BlobStore = Depends(get_blob_store),
+    hot_cache: HotBlobCache = Depends(get_hot_cache)
+):
     try:
-        db_manager = DBManager()
-        
-        # 파일 정보 조회
+        # 파일 정보 조회 (본문은 저장소에서 읽는다)
         select_sql = f"""
-        SELECT id, name, data, description
-        FROM glb_files 
-        WHERE id = {file_id}
+        SELECT id, name, description, sha256, file_size
+        FROM {GLB_TABLE} 
+        WHERE id = %s
         """
         
-        files = db_manager.get_data(select_sql)
+        files = await db_manager.get_data_async(select_sql, (file_id,))
         
         if not files:
             return JSONResponse(
@@ -102,14 +320,19 @@ async def download_glb(file_id: int):
         file_info = files[0]
         
         # Base64 인코딩 (Unity C#에서 사용할 수 있도록)
-        data_base64 = base64.b64encode(file_info['data']).decode('utf-8')
+        content = await _glb_base64(db_manager, blob_store, hot_cache, file_info)
+        if content is None:
+            return JSONResponse(
+                status_code=404,
+                content={"error": "파일 데이터를 찾을 수 없습니다."}
+            )
         
         # Unity C#에서 사용하기 적합한 응답 형태
         return GLBDownloadResponse(
             name=file_info['name'],
-            description=file_info['description'],
-            data=data_base64,
-            file_size=len(file_info['data']),
+            description=file_info['description'] or "",
+            data=content[0],
+            file_size=content[1],
             success=True
         )
         
@@ -121,18 +344,21 @@ async def download_glb(file_id: int):
 
 # GLB 파일 다운로드 (파일명 기반, Unity C# 호환)
 @router.get("/download-glb-by-name/{filename}", response_model=GLBDownloadResponse)
-async def download_glb_by_filename(filename: str):
+async def download_glb_by_filename(
+    filename: str,
+    db_manager: DBManager = Depends(get_db_manager),
+    blob_store: BlobStore = Depends(get_blob_store),
+    hot_cache: HotBlobCache = Depends(get_hot_cache)
+):
     try:
-        db_manager = DBManager()
-        
-        # 파일 정보 조회
+        # 파일 정보 조회 (본문은 저장소에서 읽는다)
         select_sql = f"""
-        SELECT id, name, data, descriptio
-        FROM glb_files 
-        WHERE name = '{filename}'
+        SELECT id, name, description, sha256, file_size
+        FROM {GLB_TABLE} 
+        WHERE name = %s
         """
         
-        files = db_manager.get_data(select_sql)
+        files = await db_manager.get_data_async(select_sql, (filename,))
         
         if not files:
             return JSONResponse(
@@ -143,14 +369,19 @@ async def download_glb_by_filename(filename: str):
         file_info = files[0]
         
         # Base64 인코딩 (Unity C#에서 사용할 수 있도록)
-        data_base64 = base64.b64encode(file_info['data']).decode('utf-8')
+        content = await _glb_base64(db_manager, blob_store, hot_cache, file_info)
+        if content is None:
+            return JSONResponse(
+                status_code=404,
+                content={"error": "파일 데이터를 찾을 수 없습니다."}
+            )
         
         # Unity C#에서 사용하기 적합한 응답 형태
         return GLBDownloadResponse(
             name=file_info['name'],
-            description=file_info['descriptio'],
-            data=data_base64,
-            file_size=len(file_info['data']),
+            description=file_info['description'] or "",
+            data=content[0],
+            file_size=content[1],
             success=True
         )
         
@@ -160,15 +391,72 @@ async def download_glb_by_filename(filename: str):
             content={"error": f"파일 다운로드 중 오류가 발생했습니다: {str(e)}"}
         )
 
+# GLB 파일 원본 다운로드 (application/octet-stream, Range/ETag 지원, 이어받기 가능)
+@router.api_route("/download-glb-raw/{file_id}", methods=["GET", "HEAD"])
+async def download_glb_raw(
+    file_id: int,
+    request: Request,
+    db_manager: DBManager = Depends(get_db_manager),
+    blob_store: BlobStore = Depends(get_blob_store),
+    blob_compressor: BlobCompressor = Depends(get_blob_compressor),
+    hot_cache: HotBlobCache = Depends(get_hot_cache)
+):
+    try:
+        files = await db_manager.get_data_async(f"SELECT id, name, sha256 FROM {GLB_TABLE} WHERE id = %s", (file_id,))
+        
+        if not files:
+            return JSONResponse(
+                status_code=404,
+                content={"error": "파일을 찾을 수 없습니다."}
+            )
+        
+        return await _glb_raw_response(request, db_manager, blob_store, blob_compressor, hot_cache, files[0])
+        
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content={"error": f"파일 다운로드 중 오류가 발생했습니다: {str(e)}"}
+        )
+
+# GLB 파일 원본 다운로드 (파일명 기반)
+@router.api_route("/download-glb-raw-by-name/{filename}", methods=["GET", "HEAD"])
+async def download_glb_raw_by_filename(
+    filename: str,
+    request: Request,
+    db_manager: DBManager = Depends(get_db_manager),
+    blob_store: BlobStore = Depends(get_blob_store),
+    blob_compressor: BlobCompressor = Depends(get_blob_compressor),
+    hot_cache: HotBlobCache = Depends(get_hot_cache)
+):
+    try:
+        files = await db_manager.get_data_async(f"SELECT id, name, sha256 FROM {GLB_TABLE} WHERE name = %s", (filename,))
+        
+        if not files:
+            return JSONResponse(
+                status_code=404,
+                content={"error": "파일을 찾을 수 없습니다."}
+            )
+        
+        return await _glb_raw_response(request, db_manager, blob_store, blob_compressor, hot_cache, files[0])
+        
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content={"error": f"파일 다운로드 중 오류가 발생했습니다: {str(e)}"}
+        )
+
 # GLB 파일 삭제
 @router.delete("/delete-glb/{file_id}")
-async def delete_glb_file(file_id: int):
+async def delete_glb_file(
+    file_id: int,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    hot_cache: HotBlobCache = Depends(get_hot_cache)
+):
     try:
-        db_manager = DBManager()
-        
         # 파일 존재 여부 확인
-        check_sql = f"SELECT name FROM glb_files WHERE id = {file_id}"
-        files = db_manager.get_data(check_sql)
+        check_sql = f"SELECT name, sha256 FROM {GLB_TABLE} WHERE id = %s"
+        files = await db_manager.get_data_async(check_sql, (file_id,))
         
         if not files:
             return JSONResponse(
@@ -176,11 +464,13 @@ async def delete_glb_file(file_id: int):
                 content={"error": "파일을 찾을 수 없습니다."}
             )
         
-        # 파일 삭제
-        delete_sql = f"DELETE FROM glb_files WHERE id = {file_id}"
-        result = db_manager.insert_data(delete_sql)
+        # 행 삭제 (저장소 파일은 다른 행과 공유될 수 있어 migrate_glb_blobs.py --gc로 정리)
+        delete_sql = f"DELETE FROM {GLB_TABLE} WHERE id = %s"
+        result = await db_manager.insert_data_async(delete_sql, (file_id,))
         
         if result == "success":
+            await cache_manager.invalidate_table_async(GLB_TABLE)
+            await hot_cache.invalidate_async(*_hot_cache_keys(file_id, files[0]["sha256"]))
             return {"success": True, "message": "파일이 성공적으로 삭제되었습니다."}
         else:
             return JSONResponse(
@@ -194,19 +484,49 @@ async def delete_glb_file(file_id: int):
             content={"error": f"파일 삭제 중 오류가 발생했습니다: {str(e)}"}
         )
 
-# GLB 파일 정보 조회
+# 시나리오 번들 다운로드 (시나리오 문서 + 참조 GLB 본문을 한 응답으로, 형식은 asset_bundle.py 참조)
+@router.get("/scenario-bundle/{scenario_id}")
+async def download_scenario_bundle(
+    scenario_id: int,
+    request: Request,
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    blob_store: BlobStore = Depends(get_blob_store)
+):
+    try:
+        scenario = await load_scenario(db_manager, cache_manager, scenario_id)
+        if scenario is None:
+            return JSONResponse(
+                status_code=404,
+                content={"error": "시나리오를 찾을 수 없습니다."}
+            )
+
+        bundle = await ScenarioBundle.build(blob_store, scenario)
+        headers = {"Cache-Control": "no-cache", "ETag": bundle.etag}
+        if _etag_matches(request.headers.get("if-none-match"), bundle.etag):
+            return Response(status_code=304, headers=headers)
+
+        headers["Content-Length"] = str(bundle.content_length)
+        headers["Content-Disposition"] = _content_disposition(f"scenario_{scenario_id}.fdtb")
+        return StreamingResponse(
+            bundle.iter_bytes(config.GLB_BUNDLE_CHUNK_SIZE, max(config.GLB_BUNDLE_READ_AHEAD, 1)),
+            media_type="application/octet-stream",
+            headers=headers
+        )
+
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content={"error": f"시나리오 번들 생성 중 오류가 발생했습니다: {str(e)}"}
+        )
+
+# GLB 파일 정보 조회 (메타데이터 색인에서 응답, 파일 본문은 읽지 않음)
 @router.get("/glb-info/{file_id}")
-async def get_glb_info(file_id: int):
+async def get_glb_info(file_id: int, db_manager: DBManager = Depends(get_db_manager)):
     try:
-        db_manager = DBManager()
-        
-        select_sql = f"""
-        SELECT id, name, descriptio, LENGTH(data) as file_size
-        FROM glb_files 
-        WHERE id = {file_id}
-        """
+        select_sql = f"{GLB_INFO_SELECT} WHERE g.id = %s"
         
-        files = db_manager.get_data(select_sql)
+        files = await db_manager.get_data_async(select_sql, (file_id,))
         
         if not files:
             return JSONResponse(
@@ -214,7 +534,7 @@ async def get_glb_info(file_id: int):
                 content={"error": "파일을 찾을 수 없습니다."}
             )
         
-        return {"success": True, "file_info": files[0]}
+        return {"success": True, "file_info": _file_info(files[0])}
         
     except Exception as e:
         return JSONResponse(
@@ -222,6 +542,76 @@ async def get_glb_info(file_id: int):
             content={"error": f"파일 정보 조회 중 오류가 발생했습니다: {str(e)}"}
         )
 
+# GLB 파일 목록 조회 (메타데이터 필터, id 순 keyset 페이지: 다음 페이지는 after_id=next_after_id)
+@router.get("/glb-list/")
+async def list_glb_files(
+    name_prefix: Optional[str] = None,
+    extension: Optional[str] = Query(None, description="extensionsUsed에 포함된 확장 (예: KHR_draco_mesh_compression)"),
+    min_file_size: Optional[int] = None,
+    max_file_size: Optional[int] = None,
+    min_mesh_count: Optional[int] = None,
+    max_mesh_count: Optional[int] = None,
+    min_material_count: Optional[int] = None,
+    max_material_count: Optional[int] = None,
+    min_triangle_count: Optional[int] = None,
+    max_triangle_count: Optional[int] = None,
+    after_id: Optional[int] = None,
+    limit: int = Query(100, ge=1, le=config.DB_MAX_PAGE_SIZE),
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
+):
+    conditions: List[str] = ["m.sha256 IS NOT NULL"]
+    params: List[Any] = []
+    if name_prefix:
+        escaped = name_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        conditions.append("g.name LIKE %s")
+        params.append(escaped + "%")
+    if extension:
+        conditions.append("FIND_IN_SET(%s, m.extensions_used)")
+        params.append(extension)
+    ranges = dict(zip(RANGE_COLUMNS, (
+        (min_file_size, max_file_size),
+        (min_mesh_count, max_mesh_count),
+        (min_material_count, max_material_count),
+        (min_triangle_count, max_triangle_count)
+    )))
+    for column, (low, high) in ranges.items():
+        if low is not None:
+            conditions.append(f"m.`{column}` >= %s")
+            params.append(low)
+        if high is not None:
+            conditions.append(f"m.`{column}` <= %s")
+            params.append(high)
+    if after_id is not None:
+        conditions.append("g.id > %s")
+        params.append(after_id)
+    
+    # 다음 페이지 유무를 알기 위해 한 행 더 읽는다
+    select_sql = f"{GLB_INFO_SELECT} WHERE {' AND '.join(conditions)} ORDER BY g.id LIMIT %s"
+    params.append(limit + 1)
+    
+    async def load_from_db():
+        rows = await db_manager.get_data_async(select_sql, tuple(params))
+        return [_file_info(row) for row in rows]
+    
+    try:
+        # GLB 행(업로드/삭제/마이그레이션)과 GLB_META(색인/백필) 어느 쪽에 쓰기가 있어도 새 키가 된다
+        query = {
+            "name_prefix": name_prefix, "extension": extension, "after_id": after_id, "limit": limit,
+            **{f"{column}_range": bounds for column, bounds in ranges.items() if bounds != (None, None)}
+        }
+        files = await cache_manager.get_or_load_tagged_async(
+            "glb-list", (GLB_TABLE, GLB_META_TABLE), {k: v for k, v in query.items() if v is not None}, load_from_db
+        )
+    except Exception as e:
+        return JSONResponse(
+            status_code=500,
+            content={"error": f"파일 목록 조회 중 오류가 발생했습니다: {str(e)}"}
+        )
+    
+    next_after_id = files[limit - 1]["id"] if len(files) > limit else None
+    return {"success": True, "files": files[:limit], "next_after_id": next_after_id}
+
 # Unity C#에서 사용할 수 있는 간단한 상태 확인 엔드포인트
 @router.get("/health")
 async def health_check():
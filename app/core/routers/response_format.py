@@ -1,12 +1,127 @@
-import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from ..models import fast_json
+from ..models.fast_json import RawJSON
+
+logger = logging.getLogger(__name__)
+
+
+class FastJSONResponse(Response):
+    """행 데이터를 한 번에 JSON 바이트로 직렬화하는 응답 (jsonable_encoder/json.dumps 이중 변환 없음)"""
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return fast_json.dumps(content)
+
+
+def accepted_encodings(accept_encoding: Optional[str], available: Sequence[str]) -> List[str]:
+    """Accept-Encoding에서 허용된 available 인코딩을 q 값 내림차순(같으면 available 순)으로"""
+    if not accept_encoding:
+        return []
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        coding = coding.strip().lower()
+        weights["gzip" if coding == "x-gzip" else coding] = q
+    default = weights.get("*", 0.0)
+    ranked = [(weights.get(coding, default), -index, coding) for index, coding in enumerate(available)]
+    return [coding for q, _, coding in sorted(ranked, reverse=True) if q > 0]
+
+
+class BlobFileResponse(FileResponse):
+    """디스크 파일 응답 (Range/If-Range/HEAD 처리는 FileResponse)
+
+    서버가 ASGI `http.response.pathsend` 또는 `http.response.zerocopysend` 확장을
+    지원하면 파일 경로/디스크립터만 넘겨 서버가 sendfile로 보내게 하고(복사 없음),
+    아니면 큰 청크로 읽어 보낸다.
+    """
+    chunk_size = 256 * 1024
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self._extensions = scope.get("extensions") or {}
+        await super().__call__(scope, receive, send)
+
+    async def _zerocopy(self, send: Send, status_code: int, offset: int, count: int) -> None:
+        await send({"type": "http.response.start", "status": status_code, "headers": self.raw_headers})
+        with open(self.path, "rb") as file:
+            await send({"type": "http.response.zerocopysend", "file": file, "offset": offset, "count": count, "more_body": False})
+
+    async def _handle_simple(self, send: Send, send_header_only: bool) -> None:
+        if not send_header_only and "http.response.pathsend" in self._extensions:
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+        elif not send_header_only and "http.response.zerocopysend" in self._extensions:
+            await self._zerocopy(send, self.status_code, 0, int(self.headers["content-length"]))
+        else:
+            await super()._handle_simple(send, send_header_only)
+
+    async def _handle_single_range(self, send: Send, start: int, end: int, file_size: int, send_header_only: bool) -> None:
+        if not send_header_only and "http.response.zerocopysend" in self._extensions:
+            self.headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+            self.headers["content-length"] = str(end - start)
+            await self._zerocopy(send, 206, start, end - start)
+        else:
+            await super()._handle_single_range(send, start, end, file_size, send_header_only)
+
 
 class ResponseFormat:
     @staticmethod
-    def sql_success(result):
-        return json.dumps({"status": "ok", "result" : f"{result}"}), 200    
+    def sql_success(result, **extra):
+        """extra: 본문에 함께 넣을 필드 (예: next_cursor)"""
+        # 캐시에 저장된 JSON 바이트는 디코딩 없이 그대로 이어붙인다
+        if isinstance(result, RawJSON) and not extra:
+            return Response(b'{"status":"ok","result":' + result.data + b"}", status_code=200, media_type="application/json")
+        return FastJSONResponse({"status": "ok", "result": result, **extra}, status_code=200)
     
+    @staticmethod
     def sql_fail(result):
-        return json.dumps({"status": "err", "result" : f"SQL Error Occurred : {result}"}), 400
+        return FastJSONResponse({"status": "err", "result": f"SQL Error Occurred : {result}"}, status_code=400)
+    
+    @staticmethod
+    def sql_stream(first_rows: List[Dict[str, Any]], batches: AsyncIterator[List[Dict[str, Any]]], stream_format: str = "ndjson"):
+        """행 묶음을 받는 대로 내보내는 응답
+        
+        - ndjson: 한 줄에 한 행 (application/x-ndjson)
+        - json: sql_success와 같은 {"status": "ok", "result": [...]} 본문을 청크로 전송
+        """
+        ndjson = stream_format == "ndjson"
+        
+        async def body():
+            try:
+                if not ndjson:
+                    yield b'{"status":"ok","result":['
+                rows = first_rows
+                separator = b""
+                while rows is not None:
+                    if ndjson:
+                        yield b"".join(fast_json.dumps(row) + b"\n" for row in rows)
+                    else:
+                        yield separator + b",".join(fast_json.dumps(row) for row in rows)
+                        separator = b","
+                    rows = await anext(batches, None)
+                if not ndjson:
+                    yield b"]}"
+            except Exception as e:
+                # 헤더를 이미 보냈으므로 상태 코드를 바꿀 수 없다: 연결을 끊어 잘린 응답으로 알린다
+                logger.error(f"Streaming response aborted: {e}")
+                raise
+            finally:
+                await batches.aclose()
+        
+        media_type = "application/x-ndjson" if ndjson else "application/json"
+        return StreamingResponse(body(), status_code=200, media_type=media_type)
     
     # @staticmethod
     # def ok_command(ip, cmd):
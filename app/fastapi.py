@@ -9,6 +9,7 @@ from datetime import timedelta
 import logging
 import sys
 from datetime import datetime
+from contextlib import asynccontextmanager
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
@@ -16,6 +17,13 @@ from starlette.responses import RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.routers import db_route, file_manage
+from app.core.models.database import DBManager
+from app.core.models.cache import CacheManager, begin_request_metrics
+from app.core.models.file_manager import BlobStore
+from app.core.models.blob_compressor import BlobCompressor
+from app.core.models.hot_cache import HotBlobCache
+from config import config
+from app.core.dependencies import get_db_manager, get_cache_manager, get_blob_store, get_blob_compressor, get_hot_cache
 
 BASE_DIR = dirname(abspath(__file__))
 # templates = Jinja2Templates(directory=str(Path(BASE_DIR, 'core/templates')))
@@ -50,7 +58,63 @@ def setup_logging():
 # 로깅 설정 적용
 logger = setup_logging()
 
-app = FastAPI()
+# 애플리케이션 시작/종료: 프로세스 공용 DB/캐시 매니저 생성 및 정리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("FastAPI application started")
+    app.state.db_manager = DBManager()
+    app.state.cache_manager = CacheManager()
+    # 캐시 세대 키/무효화는 카탈로그의 실제 테이블명 기준
+    app.state.cache_manager.table_resolver = app.state.db_manager.catalog.canonical_table
+    app.state.cache_manager.start_invalidation_listener()
+    app.state.blob_store = BlobStore(config.GLB_BLOB_DIR)
+    app.state.blob_compressor = BlobCompressor(
+        app.state.blob_store,
+        workers=config.GLB_COMPRESS_WORKERS,
+        min_bytes=config.GLB_COMPRESS_MIN_BYTES,
+        gzip_level=config.GLB_GZIP_LEVEL,
+        zstd_level=config.GLB_ZSTD_LEVEL
+    )
+    try:
+        app.state.hot_cache = HotBlobCache(
+            config.GLB_HOT_CACHE_DIR,
+            max_bytes=config.GLB_HOT_CACHE_MAX_BYTES,
+            max_entry_bytes=config.GLB_HOT_CACHE_MAX_ENTRY_BYTES
+        )
+    except OSError as e:
+        logger.warning(f"GLB hot cache disabled ({config.GLB_HOT_CACHE_DIR}): {e}")
+        app.state.hot_cache = HotBlobCache(config.GLB_HOT_CACHE_DIR, max_bytes=0, max_entry_bytes=0)
+    
+    # DB 연결 풀 초기화 확인
+    try:
+        if await app.state.db_manager.health_check_async():
+            logger.info("Database connection pool initialized successfully")
+        else:
+            logger.error("Database connection pool initialization failed")
+    except Exception as e:
+        logger.error(f"Failed to initialize database connections: {e}")
+    
+    # 스키마 카탈로그 로드 (실패 시 요청 검증 없이 동작)
+    if not await app.state.db_manager.load_schema_async():
+        logger.warning("Schema catalog not loaded, request validation disabled until next refresh")
+    
+    yield
+    
+    logger.info("FastAPI application shutdown")
+    # DB 연결 풀 / Redis 연결 정리
+    try:
+        app.state.db_manager.close_all_connections()
+        logger.info("Database connections closed successfully")
+    except Exception as e:
+        logger.error(f"Failed to close database connections: {e}")
+    try:
+        await app.state.cache_manager.close()
+    except Exception as e:
+        logger.error(f"Failed to close cache connections: {e}")
+    app.state.blob_compressor.shutdown()
+    app.state.hot_cache.close()
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "*"
@@ -73,11 +137,16 @@ async def log_requests(request: Request, call_next):
     logger.info(f"Request started: {request.method} {request.url}")
     logger.info(f"Client: {request.client.host}:{request.client.port}")
     
+    # 요청별 Redis 왕복 횟수 집계
+    round_trips = begin_request_metrics()
+    
     response = await call_next(request)
     
     # 응답 시간 계산 및 로깅
     process_time = datetime.now() - start_time
-    logger.info(f"Request completed: {request.method} {request.url} - Status: {response.status_code} - Time: {process_time.total_seconds():.3f}s")
+    request.app.state.cache_manager.metrics.record_request(round_trips[0])
+    response.headers["X-Redis-Round-Trips"] = str(round_trips[0])
+    logger.info(f"Request completed: {request.method} {request.url} - Status: {response.status_code} - Time: {process_time.total_seconds():.3f}s - Redis round-trips: {round_trips[0]}")
     
     return response
 
@@ -88,43 +157,19 @@ app.include_router(db_route.router, prefix="/db", tags=["db"])
 app.include_router(file_manage.router, prefix="/file", tags=["file"])
 # app.include_router(glb_database_route.router, prefix="/glb-db", tags=["glb-database"])
 
-# 애플리케이션 시작/종료 로깅
-@app.on_event("startup")
-async def startup_event():
-    logger.info("FastAPI application started")
-    # DB 연결 풀 초기화 확인
-    try:
-        from app.core.routers.db_route import db_manager
-        if db_manager.health_check():
-            logger.info("Database connection pool initialized successfully")
-        else:
-            logger.error("Database connection pool initialization failed")
-    except Exception as e:
-        logger.error(f"Failed to initialize database connections: {e}")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info("FastAPI application shutdown")
-    # DB 연결 풀 정리
-    try:
-        from app.core.routers.db_route import db_manager
-        db_manager.close_all_connections()
-        logger.info("Database connections closed successfully")
-    except Exception as e:
-        logger.error(f"Failed to close database connections: {e}")
-
 # 헬스 체크 엔드포인트 추가
 @app.get("/health")
-async def health_check():
+async def health_check(
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager)
+):
     """애플리케이션 및 데이터베이스 상태 확인"""
     try:
-        from app.core.routers.db_route import db_manager, cache_manager
-        
         # DB 상태 확인
-        db_healthy = db_manager.health_check()
+        db_healthy = await db_manager.health_check_async()
         
         # Redis 상태 확인
-        redis_healthy = cache_manager.health_check()
+        redis_healthy = await cache_manager.health_check_async()
         
         # 전체 상태 결정
         overall_healthy = db_healthy and redis_healthy
@@ -146,28 +191,39 @@ async def health_check():
         }
 
 @app.get("/health/detailed")
-async def detailed_health_check():
+async def detailed_health_check(
+    db_manager: DBManager = Depends(get_db_manager),
+    cache_manager: CacheManager = Depends(get_cache_manager),
+    blob_store: BlobStore = Depends(get_blob_store),
+    blob_compressor: BlobCompressor = Depends(get_blob_compressor),
+    hot_cache: HotBlobCache = Depends(get_hot_cache)
+):
     """상세한 헬스 체크 정보"""
     try:
-        from app.core.routers.db_route import db_manager, cache_manager
-        
         # DB 상태 확인
-        db_healthy = db_manager.health_check()
+        db_healthy = await db_manager.health_check_async()
         
         # Redis 상태 확인
-        redis_healthy = cache_manager.health_check()
-        redis_stats = cache_manager.get_cache_stats() if redis_healthy else {"error": "Redis not available"}
+        redis_healthy = await cache_manager.health_check_async()
+        redis_stats = await cache_manager.get_cache_stats_async() if redis_healthy else {"error": "Redis not available"}
+        # flock + 디렉터리 순회는 스레드 풀에서
+        hot_cache_stats = await hot_cache.stats_async()
         
         return {
             "status": "healthy" if (db_healthy and redis_healthy) else "unhealthy",
             "database": {
                 "status": "connected" if db_healthy else "disconnected",
-                "connection_pool_size": len(db_manager.connection_pool) if hasattr(db_manager, 'connection_pool') else 0
+                "connection_pool": db_manager.pool_stats(),
+                "query_cache": db_manager.query_compiler.stats(),
+                "schema_catalog_loaded": db_manager.catalog.is_loaded
             },
             "redis": {
                 "status": "connected" if redis_healthy else "disconnected",
                 "stats": redis_stats
             },
+            "blob_store": blob_store.stats(),
+            "blob_compressor": blob_compressor.stats(),
+            "glb_hot_cache": hot_cache_stats,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
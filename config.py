@@ -17,6 +17,29 @@ class Config:
     DB_CONNECTION_TIMEOUT = int(os.getenv("DB_CONNECTION_TIMEOUT"))
     DB_READ_TIMEOUT = int(os.getenv("DB_READ_TIMEOUT"))
     DB_WRITE_TIMEOUT = int(os.getenv("DB_WRITE_TIMEOUT"))
+    # Connection Pool Settings
+    DB_MIN_CONNECTIONS = int(os.getenv("DB_MIN_CONNECTIONS", "1"))
+    DB_POOL_MAX_WAITERS = int(os.getenv("DB_POOL_MAX_WAITERS", "100"))
+    DB_POOL_CHECKOUT_TIMEOUT = float(os.getenv("DB_POOL_CHECKOUT_TIMEOUT", "10"))
+    DB_POOL_IDLE_TIMEOUT = float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300"))
+    DB_POOL_MAX_LIFETIME = float(os.getenv("DB_POOL_MAX_LIFETIME", "3600"))
+    DB_POOL_REAP_INTERVAL = float(os.getenv("DB_POOL_REAP_INTERVAL", "30"))
+    # 이 시간(초) 이상 유휴 상태였던 연결만 체크아웃 시 ping으로 검증
+    DB_POOL_VALIDATE_IDLE_AFTER = float(os.getenv("DB_POOL_VALIDATE_IDLE_AFTER", "30"))
+    # 연결 끊김으로 실패한 조회(멱등 쿼리) 재시도 횟수
+    DB_READ_RETRIES = int(os.getenv("DB_READ_RETRIES", "1"))
+    # 파라미터화된 SQL 템플릿 캐시 크기
+    DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "256"))
+    # 다중 행 INSERT 청크당 최대 행 수 (바이트 상한은 max_allowed_packet 기준)
+    DB_BULK_INSERT_MAX_ROWS = int(os.getenv("DB_BULK_INSERT_MAX_ROWS", "1000"))
+    # 페이지 조회(limit) 최대 행 수
+    DB_MAX_PAGE_SIZE = int(os.getenv("DB_MAX_PAGE_SIZE", "1000"))
+    # 스트리밍 조회 시 서버 측 커서에서 한 번에 읽는 행 수 (메모리 상한)
+    DB_STREAM_BATCH_SIZE = int(os.getenv("DB_STREAM_BATCH_SIZE", "500"))
+    # 스키마 카탈로그 자동 갱신 주기(초), 0이면 시작 시 1회만 로드
+    DB_SCHEMA_REFRESH_INTERVAL = float(os.getenv("DB_SCHEMA_REFRESH_INTERVAL", "600"))
+    # 블로킹 DB 호출을 이벤트 루프 밖에서 실행할 전용 스레드 수
+    DB_EXECUTOR_WORKERS = int(os.getenv("DB_EXECUTOR_WORKERS", os.getenv("DB_MAX_CONNECTIONS")))
 
     # Redis Connection Settings
     REDIS_HOST = os.getenv("REDIS_HOST")
@@ -25,10 +48,51 @@ class Config:
     REDIS_CONNECTION_TIMEOUT = int(os.getenv("REDIS_CONNECTION_TIMEOUT"))
     REDIS_SOCKET_TIMEOUT = int(os.getenv("REDIS_SOCKET_TIMEOUT"))
     REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL"))
+    # 동기/비동기 클라이언트 각각의 커넥션 풀 최대 크기
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+
+    # GLB 파일 저장소 (SHA-256 내용 주소 지정 디렉터리, MySQL에는 메타데이터와 해시만 저장)
+    GLB_BLOB_DIR = os.getenv("GLB_BLOB_DIR", os.path.join(os.path.dirname(__file__), "data", "glb_blobs"))
+    # nginx 등 앞단 프록시가 파일을 직접 보내도록 할 때 X-Accel-Redirect 경로 접두사 (예: "/_glb_blobs", 비우면 앱이 전송)
+    GLB_ACCEL_REDIRECT_PREFIX = os.getenv("GLB_ACCEL_REDIRECT_PREFIX", "").rstrip("/")
+    # 업로드 최대 크기와 스트리밍 기록 청크 크기 (bytes)
+    GLB_MAX_UPLOAD_BYTES = int(os.getenv("GLB_MAX_UPLOAD_BYTES", str(512 * 1024 * 1024)))
+    GLB_UPLOAD_CHUNK_SIZE = int(os.getenv("GLB_UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+    # 업로드된 GLB의 gzip/zstd 사전 압축 (프로세스 풀 작업자 수, 0이면 비활성)
+    GLB_COMPRESS_WORKERS = int(os.getenv("GLB_COMPRESS_WORKERS", "2"))
+    GLB_COMPRESS_MIN_BYTES = int(os.getenv("GLB_COMPRESS_MIN_BYTES", "1024"))
+    GLB_GZIP_LEVEL = int(os.getenv("GLB_GZIP_LEVEL", "9"))
+    GLB_ZSTD_LEVEL = int(os.getenv("GLB_ZSTD_LEVEL", "19"))
+    # 시나리오 번들 전송 청크 크기 (bytes)와 동시에 미리 읽는 청크 수
+    GLB_BUNDLE_CHUNK_SIZE = int(os.getenv("GLB_BUNDLE_CHUNK_SIZE", str(1024 * 1024)))
+    GLB_BUNDLE_READ_AHEAD = int(os.getenv("GLB_BUNDLE_READ_AHEAD", "4"))
+    # 작업자 공용 GLB 페이로드 캐시 (tmpfs 디렉터리, 바이트 예산 0이면 비활성화)
+    # Docker 기본 /dev/shm은 64MB이므로 --shm-size를 예산보다 크게 잡는다
+    GLB_HOT_CACHE_DIR = os.getenv("GLB_HOT_CACHE_DIR", "/dev/shm/fastdbtool_glb_hot")
+    GLB_HOT_CACHE_MAX_BYTES = int(os.getenv("GLB_HOT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+    GLB_HOT_CACHE_MAX_ENTRY_BYTES = int(os.getenv("GLB_HOT_CACHE_MAX_ENTRY_BYTES", str(64 * 1024 * 1024)))
 
     # Cache Settings
     CACHE_DEFAULT_TTL = int(os.getenv("CACHE_DEFAULT_TTL"))
     CACHE_MAX_TTL = int(os.getenv("CACHE_MAX_TTL"))
+    # 프로세스 내 L1 캐시 (바이트 예산 0이면 비활성화)
+    CACHE_L1_MAX_BYTES = int(os.getenv("CACHE_L1_MAX_BYTES", str(64 * 1024 * 1024)))
+    CACHE_L1_TTL = float(os.getenv("CACHE_L1_TTL", "30"))
+    # 테이블 세대 번호를 로컬에 보관하는 시간(초). pub/sub 메시지 유실 시 최대 지연
+    CACHE_GENERATION_TTL = float(os.getenv("CACHE_GENERATION_TTL", "5"))
+    # 캐시 값 포맷 (msgpack | json | wire-json, msgpack 미설치 시 json) 및 압축 기준 크기(바이트, 0이면 압축 안 함)/zlib 레벨
+    # wire-json은 응답과 같은 JSON을 저장해 Redis hit을 디코딩 없이 응답으로 전달한다 (타입은 JSON 기본 타입으로 바뀜)
+    CACHE_CODEC = os.getenv("CACHE_CODEC", "msgpack")
+    CACHE_COMPRESS_MIN_BYTES = int(os.getenv("CACHE_COMPRESS_MIN_BYTES", "4096"))
+    CACHE_COMPRESS_LEVEL = int(os.getenv("CACHE_COMPRESS_LEVEL", "1"))
+    # stale-while-revalidate: TTL 만료 후에도 이 시간(초) 동안 이전 값을 제공하며 백그라운드 갱신 (0이면 비활성화)
+    CACHE_STALE_TTL = int(os.getenv("CACHE_STALE_TTL", "0"))
+    # miss 재계산 워커 간 락 유지 시간(ms), 락 대기 최대 시간/폴링 간격(초)
+    CACHE_LOCK_TTL_MS = int(os.getenv("CACHE_LOCK_TTL_MS", "5000"))
+    CACHE_LOCK_WAIT = float(os.getenv("CACHE_LOCK_WAIT", "3"))
+    CACHE_LOCK_POLL_INTERVAL = float(os.getenv("CACHE_LOCK_POLL_INTERVAL", "0.05"))
+    # 워커 간 L1 무효화 pub/sub 채널
+    CACHE_INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
 
 config = Config()
 
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+GLB.data 컬럼(Base64)을 내용 주소 지정 파일 저장소(GLB_BLOB_DIR)로 옮기는 마이그레이션 스크립트
+
+1. GLB 테이블에 sha256/file_size 컬럼과 sha256 인덱스를 추가하고 data 컬럼을 NULL 허용으로 변경,
+   GLB_META(컨테이너 메타데이터) 테이블 생성
+2. sha256이 없는 행의 data를 디코딩해 저장소에 기록하고 sha256/file_size를 채운 뒤 data를 비움
+   (--keep-data 없이 다시 실행하면 이전에 --keep-data로 남겨 둔 data도 비움)
+3. GLB_META에 없는 파일의 메타데이터 추출/저장
+   (--compress) 기존 파일의 gzip/zstd 사전 압축본 생성
+4. (--gc) 어떤 행도 참조하지 않는 저장소 파일(과 메타데이터)을 유예 기간이 지난 뒤 삭제
+
+여러 번 실행해도 안전하다 (이미 옮긴 행과 이미 있는 파일은 건너뜀).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Set
+
+from config import config
+from app.core.models.database import DBManager
+from app.core.models.cache import CacheManager
+from app.core.models.file_manager import BlobStore, GLBValidationError, decode_legacy_glb
+from app.core.models.blob_compressor import BlobCompressor
+from app.core.models.glb_metadata import GLB_META_TABLE, CREATE_TABLE_SQL, UPSERT_SQL, read_blob_metadata, upsert_params
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('glb_migration.log'),
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger(__name__)
+
+GLB_TABLE = "GLB"
+
+
+class GLBBlobMigrator:
+    def __init__(self, db_manager: DBManager, blob_store: BlobStore, dry_run: bool = False):
+        self.db_manager = db_manager
+        self.blob_store = blob_store
+        self.dry_run = dry_run
+        # sha256/file_size 컬럼과 GLB_META가 있는지 (dry-run에서는 스키마를 바꾸지 않으므로 없을 수 있다)
+        self.schema_ready = True
+
+    def _execute(self, sql: str, params=None):
+        if self.dry_run:
+            logger.info(f"[dry-run] {' '.join(sql.split())} {params or ''}")
+            return
+        result = self.db_manager.insert_data(sql, params)
+        if result != "success":
+            raise RuntimeError(result)
+
+    def _columns(self, table: str):
+        return {
+            row["column_name"].lower(): row
+            for row in self.db_manager.get_data(
+                """
+                SELECT COLUMN_NAME AS column_name, COLUMN_TYPE AS column_type, IS_NULLABLE AS is_nullable
+                FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
+                """,
+                (config.DB_NAME, table)
+            )
+        }
+
+    def ensure_schema(self):
+        """sha256/file_size 컬럼, sha256 인덱스 추가 및 data 컬럼 NULL 허용"""
+        columns = self._columns(GLB_TABLE)
+        if not columns:
+            raise RuntimeError(f"Table {GLB_TABLE} not found in schema {config.DB_NAME}")
+
+        changes = []
+        if "sha256" not in columns:
+            changes += ["ADD COLUMN `sha256` CHAR(64) NULL", "ADD INDEX `idx_glb_sha256` (`sha256`)"]
+        if "file_size" not in columns:
+            changes.append("ADD COLUMN `file_size` BIGINT UNSIGNED NULL")
+        data_column = columns.get("data")
+        if data_column is not None and data_column["is_nullable"] != "YES":
+            changes.append(f"MODIFY COLUMN `data` {data_column['column_type']} NULL")
+
+        if self.dry_run and (changes or not self._columns(GLB_META_TABLE)):
+            # 이후 단계는 새 컬럼/테이블 없이 읽기만 한다
+            self.schema_ready = False
+        self._execute(CREATE_TABLE_SQL)
+        if not changes:
+            logger.info("Schema already up to date")
+            return
+        self._execute(f"ALTER TABLE `{GLB_TABLE}` " + ", ".join(changes))
+        logger.info(f"Schema updated: {', '.join(changes)}")
+
+    def migrate(self, batch_size: int = 20, keep_data: bool = False) -> int:
+        """sha256이 없는 행을 id 순으로 batch_size개씩 옮긴다. 옮긴 행 수 반환"""
+        last_id = 0
+        migrated = 0
+        skipped = 0
+        # dry-run에서 sha256 컬럼이 아직 없으면 모든 행이 대상
+        pending = "sha256 IS NULL AND " if self.schema_ready else ""
+        while True:
+            rows = self.db_manager.get_data(
+                f"SELECT id, data FROM `{GLB_TABLE}` WHERE {pending}id > %s ORDER BY id LIMIT %s",
+                (last_id, batch_size)
+            )
+            if not rows:
+                break
+            for row in rows:
+                last_id = row["id"]
+                data = decode_legacy_glb(row["data"])
+                if data is None:
+                    skipped += 1
+                    logger.warning(f"GLB id={row['id']}: data is empty or not a valid GLB, skipped")
+                    continue
+
+                if self.dry_run:
+                    logger.info(f"[dry-run] GLB id={row['id']}: {len(data)} bytes")
+                    migrated += 1
+                    continue
+
+                sha256, file_size, created = self.blob_store.put(data)
+                if keep_data:
+                    self._execute(f"UPDATE `{GLB_TABLE}` SET sha256 = %s, file_size = %s WHERE id = %s", (sha256, file_size, row["id"]))
+                else:
+                    self._execute(f"UPDATE `{GLB_TABLE}` SET sha256 = %s, file_size = %s, data = NULL WHERE id = %s", (sha256, file_size, row["id"]))
+                migrated += 1
+                logger.info(f"GLB id={row['id']}: {file_size} bytes -> {sha256}{'' if created else ' (deduplicated)'}")
+
+        logger.info(f"Migration finished: {migrated} migrated, {skipped} skipped")
+        return migrated
+
+    def clear_migrated_data(self, batch_size: int = 100) -> int:
+        """이미 옮긴 행(--keep-data로 실행했던 행)의 data 컬럼을 비운다. 비운 행 수 반환
+
+        저장소에 파일이 있는 행만 비운다.
+        """
+        if not self.schema_ready:
+            logger.info("[dry-run] schema not migrated yet, skip clearing data")
+            return 0
+        last_id = 0
+        cleared = 0
+        missing = 0
+        while True:
+            rows = self.db_manager.get_data(
+                f"SELECT id, sha256 FROM `{GLB_TABLE}` WHERE sha256 IS NOT NULL AND data IS NOT NULL AND id > %s ORDER BY id LIMIT %s",
+                (last_id, batch_size)
+            )
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            ids = []
+            for row in rows:
+                if self.blob_store.exists(row["sha256"]):
+                    ids.append(row["id"])
+                else:
+                    missing += 1
+                    logger.warning(f"GLB id={row['id']}: blob {row['sha256']} is missing, data kept")
+            if ids:
+                self._execute(
+                    f"UPDATE `{GLB_TABLE}` SET data = NULL WHERE id IN ({', '.join(['%s'] * len(ids))})",
+                    tuple(ids)
+                )
+                cleared += len(ids)
+        logger.info(f"Data clearing finished: {cleared} rows cleared, {missing} kept (blob missing)")
+        return cleared
+
+    def index_metadata(self, batch_size: int = 100) -> int:
+        """GLB_META에 없는 저장소 파일의 메타데이터 추출/저장. 색인한 수 반환"""
+        if not self.schema_ready:
+            logger.info("[dry-run] schema not migrated yet, skip metadata indexing")
+            return 0
+        last_digest = ""
+        indexed = 0
+        while True:
+            rows = self.db_manager.get_data(
+                f"""
+                SELECT DISTINCT g.sha256 FROM `{GLB_TABLE}` g
+                LEFT JOIN `{GLB_META_TABLE}` m ON m.sha256 = g.sha256
+                WHERE g.sha256 IS NOT NULL AND m.sha256 IS NULL AND g.sha256 > %s
+                ORDER BY g.sha256 LIMIT %s
+                """,
+                (last_digest, batch_size)
+            )
+            if not rows:
+                break
+            for row in rows:
+                last_digest = row["sha256"]
+                try:
+                    meta = read_blob_metadata(self.blob_store, last_digest)
+                except (GLBValidationError, FileNotFoundError) as e:
+                    logger.warning(f"Blob {last_digest}: cannot read metadata ({e}), skipped")
+                    continue
+                self._execute(UPSERT_SQL, upsert_params(meta))
+                indexed += 1
+        logger.info(f"Metadata indexing finished: {indexed} indexed")
+        return indexed
+
+    def precompress(self, compressor: BlobCompressor) -> int:
+        """사전 압축본이 없는 저장소 파일을 압축 (프로세스 풀에서 병렬). 생성한 압축본 수 반환"""
+        digests = [(digest, self.blob_store.size(digest)) for digest, _ in self.blob_store.iter_digests()]
+        if self.dry_run:
+            logger.info(f"[dry-run] precompress up to {len(digests)} blobs ({', '.join(compressor.encodings)})")
+            return 0
+        created = compressor.compress_all(digests)
+        logger.info(f"Precompression finished: {created} variants created")
+        return created
+
+    def _referenced_digests(self) -> Set[str]:
+        rows = self.db_manager.get_data(f"SELECT DISTINCT sha256 FROM `{GLB_TABLE}` WHERE sha256 IS NOT NULL")
+        return {row["sha256"] for row in rows}
+
+    def gc(self, grace_seconds: int = 3600) -> int:
+        """참조되지 않고 grace_seconds 이상 지난 저장소 파일 삭제 (업로드 직후 DB 기록 전 파일 보호)"""
+        if not self.schema_ready:
+            logger.info("[dry-run] schema not migrated yet, skip garbage collection")
+            return 0
+        referenced = self._referenced_digests()
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for digest, mtime in list(self.blob_store.iter_digests()):
+            if digest in referenced or mtime > cutoff:
+                continue
+            if self.dry_run:
+                logger.info(f"[dry-run] remove unreferenced blob {digest}")
+            else:
+                self.blob_store.delete(digest)
+            self._execute(f"DELETE FROM `{GLB_META_TABLE}` WHERE sha256 = %s", (digest,))
+            removed += 1
+        # 중단된 업로드의 임시 파일
+        for path in self.blob_store.root.joinpath("tmp").iterdir():
+            if path.stat().st_mtime <= cutoff and not self.dry_run:
+                path.unlink()
+        logger.info(f"Garbage collection finished: {removed} unreferenced blobs removed")
+        return removed
+
+
+async def _invalidate_glb_cache(db_manager: DBManager):
+    cache_manager = CacheManager()
+    # 서버와 같은 실제 테이블명으로 세대를 올린다
+    db_manager.catalog.load()
+    cache_manager.table_resolver = db_manager.catalog.canonical_table
+    try:
+        await cache_manager.invalidate_table_async(GLB_TABLE)
+        await cache_manager.invalidate_table_async(GLB_META_TABLE)
+    finally:
+        await cache_manager.close()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Move GLB.data (Base64) into the content-addressed blob store")
+    parser.add_argument("--blob-dir", default=config.GLB_BLOB_DIR,
+                       help=f"Blob store directory (default: {config.GLB_BLOB_DIR})")
+    parser.add_argument("--batch-size", type=int, default=20,
+                       help="Rows read per query (default: 20)")
+    parser.add_argument("--keep-data", action="store_true",
+                       help="Keep the data column after migration (a later run without this flag clears it)")
+    parser.add_argument("--skip-schema", action="store_true",
+                       help="Do not alter the GLB table")
+    parser.add_argument("--compress", action="store_true",
+                       help="Create gzip/zstd variants for stored blobs that lack them")
+    parser.add_argument("--gc", action="store_true",
+                       help="Remove blobs that no GLB row references")
+    parser.add_argument("--gc-grace", type=int, default=3600,
+                       help="Only remove unreferenced blobs older than this many seconds (default: 3600)")
+    parser.add_argument("--dry-run", action="store_true",
+                       help="Log what would change without writing")
+
+    args = parser.parse_args()
+
+    db_manager = DBManager()
+    migrator = GLBBlobMigrator(db_manager, BlobStore(args.blob_dir), dry_run=args.dry_run)
+    try:
+        if not args.skip_schema:
+            migrator.ensure_schema()
+        migrated = migrator.migrate(batch_size=args.batch_size, keep_data=args.keep_data)
+        cleared = 0 if args.keep_data else migrator.clear_migrated_data(batch_size=args.batch_size)
+        indexed = migrator.index_metadata()
+        if (migrated or cleared or indexed) and not args.dry_run:
+            # 캐시된 GLB 행(data 포함)과 목록을 무효화
+            asyncio.run(_invalidate_glb_cache(db_manager))
+        if args.compress:
+            compressor = BlobCompressor(
+                migrator.blob_store,
+                workers=max(config.GLB_COMPRESS_WORKERS, 1),
+                min_bytes=config.GLB_COMPRESS_MIN_BYTES,
+                gzip_level=config.GLB_GZIP_LEVEL,
+                zstd_level=config.GLB_ZSTD_LEVEL
+            )
+            try:
+                migrator.precompress(compressor)
+            finally:
+                compressor.shutdown()
+        if args.gc:
+            migrator.gc(grace_seconds=args.gc_grace)
+    finally:
+        db_manager.close_all_connections()
+
+if __name__ == "__main__":
+    main()